@@ -0,0 +1,107 @@
+import json
+import random
+import shutil
+import sqlite3
+import tempfile
+import time
+from collections.abc import Callable
+from contextlib import closing
+from pathlib import Path
+from typing import Any
+
+import click
+
+from benchmark.synthetic_design import SyntheticDesignSpec, SyntheticDesignWriter
+from src.infra.parser.sdf_stream_parser import SDFStreamParser
+from src.infra.parser.verilog_stream_parser import VerilogStreamParser
+from src.infra.repository.beam_path_search import sqlite_fanout
+from src.infra.repository.sqlite_graph_repository import SqliteGraphRepository
+from src.usecase.import_sdf import ImportSDFUseCase
+from src.usecase.import_verilog import ImportVerilogUseCase
+from src.usecase.trace_path import TracePathUseCase
+
+_FANOUT_BATCH = 64
+
+
+def compare_edge_layouts(
+    edges: int, work_dir: Path, lookups: int = 5000, seed: int = 0
+) -> dict[str, Any]:
+    """
+    Imports one design, copies the database and clusters the copy, then
+    runs the same fan-out lookups, traces and SDF merge against both.
+    Every measurement opens a fresh connection, so SQLite's page cache
+    starts cold (the OS cache does not).
+    """
+    spec = SyntheticDesignSpec(edges=edges, seed=seed)
+    design = SyntheticDesignWriter(spec).write(work_dir)
+    heap = SqliteGraphRepository(str(work_dir / "heap.db"))
+    heap.setup()
+    ImportVerilogUseCase(heap, VerilogStreamParser()).execute(design.verilog_path)
+    ImportSDFUseCase(heap, SDFStreamParser()).execute(design.sdf_path)
+    heap.close()
+    shutil.copy(heap.db_path, work_dir / "clustered.db")
+    clustered = SqliteGraphRepository(str(work_dir / "clustered.db"))
+
+    report: dict[str, Any] = {"edges": design.edges}
+    report["cluster_seconds"] = _seconds(clustered.cluster_edges)
+    clustered.close()
+    sources = _sample_sources(heap.db_path, lookups, seed)
+    for name, repo in (("heap", heap), ("clustered", clustered)):
+        report[name] = _measure(repo, sources, design.sdf_path)
+    return report
+
+
+def _sample_sources(db_path: str, lookups: int, seed: int) -> list[str]:
+    with closing(sqlite3.connect(db_path)) as connection:
+        sources = [
+            row[0] for row in connection.execute("SELECT DISTINCT src FROM edges")
+        ]
+    return random.Random(seed).sample(sources, min(lookups, len(sources)))
+
+
+def _measure(
+    repo: SqliteGraphRepository, sources: list[str], sdf_path: Path
+) -> dict[str, float]:
+    with closing(sqlite3.connect(repo.db_path)) as connection:
+        fetch = sqlite_fanout(connection)
+        single = _seconds(lambda: [fetch({source}) for source in sources])
+    with closing(sqlite3.connect(repo.db_path)) as connection:
+        fetch = sqlite_fanout(connection)
+        batches = [
+            set(sources[i : i + _FANOUT_BATCH])
+            for i in range(0, len(sources), _FANOUT_BATCH)
+        ]
+        batched = _seconds(lambda: [fetch(batch) for batch in batches])
+    usecase = TracePathUseCase(repo)
+    trace = _seconds(lambda: [usecase.execute(source) for source in sources])
+    merge = _seconds(
+        lambda: ImportSDFUseCase(repo, SDFStreamParser()).execute(sdf_path)
+    )
+    repo.close()
+    return {
+        "fanout_single_per_second": len(sources) / single,
+        "fanout_batched_per_second": len(sources) / batched,
+        "trace_per_second": len(sources) / trace,
+        "sdf_merge_seconds": merge,
+        "db_bytes": Path(repo.db_path).stat().st_size,
+    }
+
+
+def _seconds(run: Callable[[], Any]) -> float:
+    started = time.perf_counter()
+    run()
+    return time.perf_counter() - started
+
+
+@click.command()
+@click.option("--edges", type=int, default=1_000_000)
+@click.option("--lookups", type=int, default=5000, help="Source nodes looked up")
+def main(edges: int, lookups: int) -> None:
+    """Compare the insertion-order heap and the clustered edge layout."""
+    with tempfile.TemporaryDirectory() as tmp:
+        report = compare_edge_layouts(edges, Path(tmp), lookups)
+        click.echo(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
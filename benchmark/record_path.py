@@ -0,0 +1,75 @@
+import json
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any
+
+import click
+
+from benchmark.synthetic_design import SyntheticDesignSpec, SyntheticDesignWriter
+from src.infra.parser.sdf_stream_parser import SDFStreamParser
+from src.infra.parser.verilog_stream_parser import VerilogStreamParser
+from src.infra.repository.sqlite_graph_repository import SqliteGraphRepository
+
+_BATCH_SIZE = 100_000
+
+
+def compare_record_paths(edges: int, work_dir: Path) -> dict[str, Any]:
+    """Imports the same design through Edge objects and through raw rows."""
+    design = SyntheticDesignWriter(SyntheticDesignSpec(edges=edges)).write(work_dir)
+    verilog, sdf = VerilogStreamParser(), SDFStreamParser()
+    report: dict[str, Any] = {"edges": design.edges}
+    for name, parse, write in (
+        ("edges_objects", verilog.parse_edges, "save_edges_batch"),
+        ("edges_rows", verilog.parse_edge_rows, "save_edge_rows"),
+    ):
+        repo = _fresh_repo(work_dir / f"{name}.db")
+        batches = parse(design.verilog_path, _BATCH_SIZE)
+        report[name] = _measure(batches, getattr(repo, write))
+    for name, parse, write in (
+        ("delays_objects", sdf.parse_delays, "update_edges_delay_batch"),
+        ("delays_rows", sdf.parse_delay_rows, "update_edge_delay_rows"),
+    ):
+        repo = SqliteGraphRepository(str(work_dir / "edges_rows.db"))
+        with repo.bulk_mode():
+            batches = parse(design.sdf_path, _BATCH_SIZE)
+            report[name] = _measure(batches, getattr(repo, write))
+    return report
+
+
+def _fresh_repo(db_path: Path) -> SqliteGraphRepository:
+    repo = SqliteGraphRepository(str(db_path))
+    repo.setup()
+    return repo
+
+
+def _measure(batches: Iterable[Any], write: Callable[[Any], None]) -> dict[str, float]:
+    tracemalloc.start()
+    started = time.perf_counter()
+    rows = 0
+    for batch in batches:
+        write(batch)
+        rows += len(batch)
+    seconds = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "rows": rows,
+        "seconds": seconds,
+        "rows_per_second": rows / seconds,
+        "peak_traced_bytes": peak,
+    }
+
+
+@click.command()
+@click.option("--edges", type=int, default=1_000_000)
+def main(edges: int) -> None:
+    """Compare the Edge-object and raw-row import paths on one design."""
+    with tempfile.TemporaryDirectory() as tmp:
+        click.echo(json.dumps(compare_record_paths(edges, Path(tmp)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
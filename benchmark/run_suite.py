@@ -0,0 +1,154 @@
+import dataclasses
+import json
+import platform
+import random
+import resource
+import sqlite3
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import click
+
+from benchmark.synthetic_design import (
+    SCALES,
+    SyntheticDesign,
+    SyntheticDesignSpec,
+    SyntheticDesignWriter,
+)
+from src.infra.parser.sdf_stream_parser import SDFStreamParser
+from src.infra.parser.verilog_stream_parser import VerilogStreamParser
+from src.infra.repository.sqlite_graph_repository import SqliteGraphRepository
+from src.usecase.import_cell_arcs import ImportCellArcsUseCase
+from src.usecase.import_sdf import ImportSDFUseCase
+from src.usecase.import_verilog import ImportVerilogUseCase
+from src.usecase.trace_path import TracePathUseCase
+
+_RESULTS_DIR = Path(__file__).parent / "results"
+
+
+def run_suite(
+    spec: SyntheticDesignSpec, work_dir: Path, traces: int = 100
+) -> dict[str, Any]:
+    """Runs every stage on one generated design and returns a JSON-ready report."""
+    stages: dict[str, dict[str, float]] = {}
+    design = _timed(stages, "generate", lambda: _generate(spec, work_dir))
+    repo = SqliteGraphRepository(str(work_dir / "bench.db"))
+    repo.setup()
+    verilog = ImportVerilogUseCase(repo, VerilogStreamParser())
+    parser = SDFStreamParser()
+    sdf = ImportSDFUseCase(repo, parser, cell_arcs=ImportCellArcsUseCase(repo))
+    prefiltered = ImportSDFUseCase(repo, SDFStreamParser(), prefilter=True)
+    _timed(stages, "import_verilog", lambda: verilog.execute(design.verilog_path))
+    _timed(stages, "import_sdf", lambda: sdf.execute(design.sdf_path))
+    # The same delays again, to weigh the bloom prefilter against its build cost.
+    _timed(
+        stages, "import_sdf_prefiltered", lambda: prefiltered.execute(design.sdf_path)
+    )
+    _set_rate(stages, "import_verilog", design.edges)
+    _set_rate(stages, "import_sdf", design.interconnects)
+    _set_rate(stages, "import_sdf_prefiltered", design.interconnects)
+    _run_traces(stages, repo, design, spec.seed, traces)
+    return _report(spec, design, stages, work_dir / "bench.db")
+
+
+def _generate(spec: SyntheticDesignSpec, work_dir: Path) -> SyntheticDesign:
+    return SyntheticDesignWriter(spec).write(work_dir)
+
+
+def _run_traces(
+    stages: dict[str, dict[str, float]],
+    repo: SqliteGraphRepository,
+    design: SyntheticDesign,
+    seed: int,
+    traces: int,
+) -> None:
+    usecase = TracePathUseCase(repo)
+    rng = random.Random(seed)
+    # Input pins, so each trace crosses its gate's IOPATH arc to the output net.
+    starts = [f"u_g{rng.randrange(design.gates)}.A1" for _ in range(traces)]
+    _timed(stages, "trace", lambda: usecase.execute(starts[0]))
+    _timed(stages, "batch_trace", lambda: [usecase.execute(s) for s in starts])
+    _set_rate(stages, "batch_trace", traces)
+
+
+def _timed(
+    stages: dict[str, dict[str, float]], name: str, run: Callable[[], Any]
+) -> Any:
+    started = time.perf_counter()
+    result = run()
+    stages[name] = {"seconds": time.perf_counter() - started}
+    return result
+
+
+def _set_rate(stages: dict[str, dict[str, float]], name: str, rows: int) -> None:
+    stages[name]["rows"] = rows
+    stages[name]["rows_per_second"] = rows / max(stages[name]["seconds"], 1e-9)
+
+
+def _report(
+    spec: SyntheticDesignSpec,
+    design: SyntheticDesign,
+    stages: dict[str, dict[str, float]],
+    db_path: Path,
+) -> dict[str, Any]:
+    db_files = (db_path, db_path.with_name(f"{db_path.name}-wal"))
+    return {
+        "created_at": datetime.now(UTC).isoformat(timespec="seconds"),
+        "environment": {
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+        },
+        "spec": dataclasses.asdict(spec),
+        "design": {
+            "gates": design.gates,
+            "edges": design.edges,
+            "interconnects": design.interconnects,
+        },
+        "stages": stages,
+        "db_bytes": sum(p.stat().st_size for p in db_files if p.exists()),
+        "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+
+
+@click.command()
+@click.option("--scale", type=click.Choice(list(SCALES)), default="smoke")
+@click.option("--edges", type=int, default=None, help="Override the scale preset")
+@click.option("--depth", type=int, default=32, help="Logic levels")
+@click.option("--max-inputs", type=int, default=4, help="Maximum inputs per gate")
+@click.option(
+    "--fanout-profile", type=click.Choice(["uniform", "skewed"]), default="uniform"
+)
+@click.option("--depth-profile", type=click.Choice(["flat", "tapered"]), default="flat")
+@click.option("--reconvergence", type=float, default=0.2)
+@click.option("--seed", type=int, default=0)
+@click.option("--traces", type=int, default=100, help="Start points in batch_trace")
+@click.option("--work-dir", type=click.Path(path_type=Path), default=None)
+@click.option("--out", type=click.Path(path_type=Path), default=None)
+def main(
+    scale: str,
+    traces: int,
+    work_dir: Path | None,
+    out: Path | None,
+    **spec_options: Any,
+) -> None:
+    """Generate a synthetic design and benchmark every import/trace stage on it."""
+    edges = spec_options.pop("edges") or SCALES[scale]
+    spec = SyntheticDesignSpec(edges=edges, **spec_options)
+    with tempfile.TemporaryDirectory(dir=work_dir) as tmp:
+        report = run_suite(spec, Path(tmp), traces)
+
+    stamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%SZ")
+    out = out or _RESULTS_DIR / f"{scale}-{stamp}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2))
+    click.echo(json.dumps(report["stages"], indent=2))
+    click.echo(f"Report written to {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+import random
+import shutil
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Literal, TextIO
+
+SCALES: dict[str, int] = {
+    "smoke": 10_000,
+    "1M": 1_000_000,
+    "10M": 10_000_000,
+    "100M": 100_000_000,
+}
+
+_PRIMARY_INPUTS = 64
+
+
+@dataclass(frozen=True)
+class SyntheticDesignSpec:
+    """Shape of a generated gate netlist; the same spec always yields the same files."""
+
+    edges: int
+    depth: int = 32
+    max_inputs: int = 4
+    fanout_profile: Literal["uniform", "skewed"] = "uniform"
+    depth_profile: Literal["flat", "tapered"] = "flat"
+    reconvergence: float = 0.2
+    seed: int = 0
+
+    def level_widths(self) -> tuple[int, ...]:
+        """Number of gates per logic level, summing to roughly edges / pins."""
+        gates = max(self.depth, self.edges * 2 // (self.max_inputs + 3))
+        weights = [
+            1.0 if self.depth_profile == "flat" else float(self.depth - level)
+            for level in range(self.depth)
+        ]
+        scale = gates / sum(weights)
+        return tuple(max(1, round(w * scale)) for w in weights)
+
+
+@dataclass(frozen=True)
+class SyntheticDesign:
+    verilog_path: Path
+    sdf_path: Path
+    gates: int
+    edges: int
+    interconnects: int
+    arcs: int
+
+
+class SyntheticDesignWriter:
+    """
+    Streams a levelized gate netlist and its matching SDF in a single pass.
+    Each gate reads 1..max_inputs nets from the previous level, or with
+    probability `reconvergence` from any earlier level, so paths fan out and
+    reconverge. Every gate gets an IOPATH arc per input, so a trace from an
+    input pin crosses the gate. Memory stays O(depth) regardless of the
+    requested scale.
+    """
+
+    def __init__(self, spec: SyntheticDesignSpec) -> None:
+        self._spec = spec
+        self._rng = random.Random(spec.seed)
+
+    def write(self, out_dir: Path, name: str = "synthetic") -> SyntheticDesign:
+        out_dir.mkdir(parents=True, exist_ok=True)
+        verilog_path = out_dir / f"{name}.v"
+        sdf_path = out_dir / f"{name}.sdf"
+        # The design-level CELL holding the interconnects goes after the gate
+        # cells; it is spooled to a side file so the pass stays single.
+        spool_path = out_dir / f"{name}.interconnect"
+        with verilog_path.open("w") as v, sdf_path.open("w") as s:
+            with spool_path.open("w+") as spool:
+                gates, edges, interconnects = self._write_design(v, s, spool)
+                spool.seek(0)
+                shutil.copyfileobj(spool, s)
+            s.write("    )\n  )\n)\n)\n")
+        spool_path.unlink()
+        return SyntheticDesign(
+            verilog_path, sdf_path, gates, edges, interconnects, edges - gates
+        )
+
+    def _write_design(
+        self, v: TextIO, s: TextIO, spool: TextIO
+    ) -> tuple[int, int, int]:
+        widths = self._spec.level_widths()
+        self._write_headers(v, s, sum(widths))
+        edges = interconnects = 0
+        for gate, level, first_of_level in self._gates(widths):
+            inputs = self._pick_inputs(level, widths, first_of_level)
+            v.write(self._instance_line(gate, inputs))
+            s.write(self._cell_block(gate, inputs))
+            spool.writelines(self._interconnect_lines(gate, inputs))
+            edges += len(inputs) + 1
+            interconnects += sum(1 for driver in inputs if driver >= 0)
+        v.write("endmodule\n")
+        s.write('(CELL\n  (CELLTYPE "SYNTH")\n  (INSTANCE)\n  (DELAY\n    (ABSOLUTE\n')
+        return sum(widths), edges, interconnects
+
+    def _write_headers(self, v: TextIO, s: TextIO, gates: int) -> None:
+        v.write("module SYNTH ( );\n")
+        v.writelines(f"input pi{i} ;\n" for i in range(_PRIMARY_INPUTS))
+        v.writelines(f"wire n{g} ;\n" for g in range(gates))
+        s.write('(DELAYFILE\n(DESIGN "SYNTH")\n(DIVIDER /)\n(TIMESCALE 1ns)\n')
+
+    def _gates(self, widths: tuple[int, ...]) -> Iterator[tuple[int, int, int]]:
+        """Yields (gate id, level, first gate id of that level)."""
+        gate = 0
+        for level, width in enumerate(widths):
+            first = gate
+            for _ in range(width):
+                yield gate, level, first
+                gate += 1
+
+    def _pick_inputs(
+        self, level: int, widths: tuple[int, ...], first_of_level: int
+    ) -> tuple[int, ...]:
+        """Driver gate ids for each input; negative ids are primary inputs."""
+        count = self._rng.randint(1, self._spec.max_inputs)
+        if level == 0:
+            return tuple(
+                -1 - self._rng.randrange(_PRIMARY_INPUTS) for _ in range(count)
+            )
+        return tuple(
+            self._pick_driver(level, widths, first_of_level) for _ in range(count)
+        )
+
+    def _pick_driver(
+        self, level: int, widths: tuple[int, ...], first_of_level: int
+    ) -> int:
+        source_level = level - 1
+        if self._rng.random() < self._spec.reconvergence:
+            source_level = self._rng.randrange(level)
+        start = first_of_level - sum(widths[source_level:level])
+        return start + self._pick_index(widths[source_level])
+
+    def _pick_index(self, width: int) -> int:
+        """Uniform fanout, or a skew where low-index nets drive most sinks."""
+        if self._spec.fanout_profile == "skewed":
+            return min(width - 1, int(width * self._rng.random() ** 3))
+        return self._rng.randrange(width)
+
+    def _instance_line(self, gate: int, inputs: tuple[int, ...]) -> str:
+        pins = " , ".join(
+            f".A{k + 1} ( {_net(driver)} )" for k, driver in enumerate(inputs)
+        )
+        return f"ND{len(inputs)}D1 u_g{gate} ( {pins} , .ZN ( n{gate} ) ) ;\n"
+
+    def _cell_block(self, gate: int, inputs: tuple[int, ...]) -> str:
+        """The gate's CELL, with one IOPATH from each input pin to ZN."""
+        iopaths = "".join(
+            f"      (IOPATH A{k + 1} ZN {self._delays()})\n" for k in range(len(inputs))
+        )
+        return (
+            f'(CELL\n  (CELLTYPE "ND{len(inputs)}D1")\n  (INSTANCE SYNTH/u_g{gate})\n'
+            f"  (DELAY\n    (ABSOLUTE\n{iopaths}    )\n  )\n)\n"
+        )
+
+    def _interconnect_lines(self, gate: int, inputs: tuple[int, ...]) -> Iterator[str]:
+        for k, driver in enumerate(inputs):
+            if driver < 0:
+                continue
+            yield (
+                f"      (INTERCONNECT SYNTH/u_g{driver}/ZN SYNTH/u_g{gate}/A{k + 1} "
+                f"{self._delays()})\n"
+            )
+
+    def _delays(self) -> str:
+        rise, fall = self._rng.uniform(1e-4, 5e-2), self._rng.uniform(1e-4, 5e-2)
+        return f"({rise:.5f}::{rise:.5f}) ({fall:.5f}::{fall:.5f})"
+
+
+def _net(driver: int) -> str:
+    return f"pi{-1 - driver}" if driver < 0 else f"n{driver}"
@@ -0,0 +1,34 @@
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+_RE_BIT_NAME = re.compile(r"^(.+)\[(\d+)\]$")
+
+
+@dataclass(frozen=True)
+class Bus:
+    """A vector wire stored once with its [msb:lsb] range instead of per bit."""
+
+    name: str
+    msb: int
+    lsb: int
+
+    def bit_name(self, index: int) -> str:
+        return f"{self.name}[{index}]"
+
+    def bit_names(self) -> Iterator[str]:
+        """Expands the bits lazily, in declaration order (msb first)."""
+        step = -1 if self.msb >= self.lsb else 1
+        for index in range(self.msb, self.lsb + step, step):
+            yield self.bit_name(index)
+
+
+def split_bit_name(name: str) -> tuple[str, int] | None:
+    """Splits "data[3]" into ("data", 3); None for names without a bit-select."""
+    if match := _RE_BIT_NAME.match(name):
+        return match.group(1), int(match.group(2))
+    return None
+
+
+# (name, msb, lsb) record used on bulk import paths.
+BusRow = tuple[str, int, int]
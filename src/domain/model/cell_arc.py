@@ -0,0 +1,20 @@
+# (instance, cell type, from pin, to pin, rise, fall) as parsed from one IOPATH.
+CellArcRow = tuple[str, str, str, str, float, float]
+
+# (id, cell type, from pin, to pin, rise, fall): one distinct arc delay,
+# shared by every instance whose arc has exactly these values.
+DelayTemplateRow = tuple[int, str, str, str, float, float]
+
+# (instance, template id): the per-instance arc as stored.
+InstanceArcRow = tuple[str, int]
+
+
+def split_pin(name: str) -> tuple[str, str]:
+    """Splits "u1.A" into ("u1", "A"); a net name has no instance ("", "n1")."""
+    instance, _, pin = name.rpartition(".")
+    return instance, pin
+
+
+def output_pin(row: CellArcRow) -> str:
+    """The pin an arc drives, e.g. "u1.ZN", named as in netlist edges."""
+    return f"{row[0]}.{row[3]}"
@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+
+# Metrics the `stats` command can summarize: per-edge max(rise, fall), and
+# the arrival time and logic depth of endpoints from the slack table.
+METRICS = ("edge_delay", "arrival", "depth")
+
+
+@dataclass(frozen=True)
+class Distribution:
+    """Summary of one metric over all rows, or over one hierarchy prefix."""
+
+    metric: str
+    group: str | None
+    count: int
+    minimum: float
+    maximum: float
+    mean: float
+    percentiles: tuple[tuple[float, float], ...]
+    bin_edges: tuple[float, ...]
+    bin_counts: tuple[int, ...]
@@ -9,3 +9,12 @@ class Edge:
     dst_node: str
     delay_rise: float = 0.0
     delay_fall: float = 0.0
+
+
+# Column-ordered (src, dst, delay_rise, delay_fall) record used on bulk import
+# paths, where building an Edge per connection would cost an extra allocation.
+EdgeRow = tuple[str, str, float, float]
+
+# (src_id, dst_id, delay_rise, delay_fall) record with nodes numbered densely
+# from 0, as streamed by columnar exports.
+EdgeIdRow = tuple[int, int, float, float]
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+from src.domain.model.edge import EdgeRow
+
+
+@dataclass(frozen=True)
+class ModuleDefinition:
+    """
+    One Verilog module body in its own local names.
+    edges holds pin -> net and assign rows exactly as a flat netlist would;
+    instances holds (instance name, cell or module type) so instances of
+    other modules can be expanded when the hierarchy is flattened.
+    """
+
+    name: str
+    edges: tuple[EdgeRow, ...] = ()
+    instances: tuple[tuple[str, str], ...] = ()
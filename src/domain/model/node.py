@@ -6,3 +6,10 @@ class Node:
     """Represents a node (pin or port) in the verilog."""
 
     name: str
+
+
+# Single-column (name,) record used on bulk import paths.
+NodeRow = tuple[str]
+
+# (id, name) record for nodes whose IDs are assigned before they are stored.
+NodeIdRow = tuple[int, str]
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+# (node, arrival, required, slack) record as listed from the slack table.
+SlackRow = tuple[str, float, float, float]
+
+# SlackRow plus logic depth and whether the node was constrained directly,
+# as written by the slack computation.
+TimingRow = tuple[str, float, float, float, int, bool]
+
+
+@dataclass(frozen=True)
+class SlackSummary:
+    """Outcome of one slack computation over the whole graph."""
+
+    nodes: int = 0
+    endpoints: int = 0
+    worst_slack: float | None = None
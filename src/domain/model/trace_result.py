@@ -0,0 +1,39 @@
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+from src.domain.model.edge import Edge
+
+
+@dataclass(frozen=True)
+class SearchStats:
+    """How much of the graph a search explored before it finished or stopped."""
+
+    explored_paths: int = 0
+    explored_nodes: int = 0
+    elapsed_seconds: float = 0.0
+
+
+@dataclass(frozen=True)
+class TraceResult:
+    """Edges of a traced path, with flags describing how exact the search was."""
+
+    edges: tuple[Edge, ...] = ()
+    approximate: bool = False
+    partial: bool = False
+    stats: SearchStats = SearchStats()
+
+    @property
+    def total_delay(self) -> float:
+        return sum(max(e.delay_rise, e.delay_fall) for e in self.edges)
+
+    def __len__(self) -> int:
+        return len(self.edges)
+
+    def __iter__(self) -> Iterator[Edge]:
+        return iter(self.edges)
+
+    def __getitem__(self, index: int) -> Edge:
+        return self.edges[index]
+
+    def __bool__(self) -> bool:
+        return bool(self.edges)
@@ -0,0 +1,45 @@
+from collections.abc import Iterator, Sequence
+from typing import Protocol, runtime_checkable
+
+from src.domain.model.edge import EdgeIdRow
+
+
+@runtime_checkable
+class ColumnarSource(Protocol):
+    """A consistent view of the graph with nodes numbered 0..node_count-1."""
+
+    @property
+    def node_count(self) -> int: ...
+
+    @property
+    def edge_count(self) -> int: ...
+
+    @property
+    def name_bytes(self) -> int:
+        """Total UTF-8 length of all node names."""
+        ...
+
+    def iter_names(self, chunk_rows: int) -> Iterator[list[str]]:
+        """Yields node names in ID order."""
+        ...
+
+    def iter_edges(self, chunk_rows: int) -> Iterator[list[EdgeIdRow]]:
+        """Yields (src_id, dst_id, rise, fall) rows."""
+        ...
+
+
+@runtime_checkable
+class ColumnarWriter(Protocol):
+    """Destination of a columnar export, written sequentially in chunks."""
+
+    def allocate(self, node_count: int, edge_count: int, name_bytes: int) -> None:
+        """Sizes every column before the first chunk is written."""
+        ...
+
+    def write_names(self, names: Sequence[str]) -> None: ...
+
+    def write_edges(self, rows: Sequence[EdgeIdRow]) -> None: ...
+
+    def close(self) -> None:
+        """Flushes the columns to disk."""
+        ...
@@ -1,12 +1,19 @@
+from collections.abc import Iterator, Sequence
 from contextlib import AbstractContextManager
 from typing import Protocol, runtime_checkable
 
-from src.domain.model.edge import Edge
-from src.domain.model.node import Node
+from src.domain.model.bus import BusRow
+from src.domain.model.cell_arc import DelayTemplateRow, InstanceArcRow
+from src.domain.model.edge import Edge, EdgeRow
+from src.domain.model.module_definition import ModuleDefinition
+from src.domain.model.node import Node, NodeIdRow, NodeRow
+from src.domain.model.slack import SlackRow, TimingRow
+from src.domain.protocol.columnar_export import ColumnarSource
+from src.domain.protocol.path_queries import PathQueries
 
 
 @runtime_checkable
-class GraphRepository(Protocol):
+class GraphRepository(PathQueries, Protocol):
     """Protocol for graph data persistence."""
 
     def setup(self) -> None:
@@ -25,14 +32,103 @@ class GraphRepository(Protocol):
         """Update delay information for existing edges."""
         ...
 
-    def find_max_delay_path(
-        self, start_node: str, end_node: str | None = None, max_depth: int = 100
-    ) -> tuple[Edge]:
+    def save_node_rows(self, rows: Sequence[NodeRow]) -> None:
+        """Save (name,) rows as produced by the parsers, without conversion."""
+        ...
+
+    def save_node_id_rows(self, rows: Sequence[NodeIdRow]) -> None:
+        """Save (id, name) rows; a name already stored keeps its ID."""
+        ...
+
+    def next_node_id(self) -> int:
+        """Return one past the largest stored node ID."""
+        ...
+
+    def save_edge_rows(self, rows: Sequence[EdgeRow]) -> None:
+        """Save (src, dst, rise, fall) rows as produced by the parsers."""
+        ...
+
+    def save_new_edge_rows(self, rows: Sequence[EdgeRow]) -> None:
+        """Like save_edge_rows, but skips (src, dst) pairs already stored."""
+        ...
+
+    def update_edge_delay_rows(self, rows: Sequence[EdgeRow]) -> None:
+        """Update delays from (src, dst, rise, fall) rows; matched on dst."""
+        ...
+
+    def save_delay_template_rows(self, rows: Sequence[DelayTemplateRow]) -> None:
+        """Save (id, cell, from, to, rise, fall) delay templates; IDs kept as given."""
+        ...
+
+    def load_delay_template_rows(self) -> Sequence[DelayTemplateRow]:
+        """Return every stored delay template row."""
+        ...
+
+    def save_cell_arc_rows(self, rows: Sequence[InstanceArcRow]) -> None:
+        """Save (instance, template id) cell arcs; an arc reads as an edge."""
+        ...
+
+    def save_bus_rows(self, rows: Sequence[BusRow]) -> None:
+        """Save (name, msb, lsb) vector wire declarations, one row per bus."""
+        ...
+
+    def save_module(self, module: ModuleDefinition) -> None:
+        """Store one module definition, once regardless of how often it is used."""
+        ...
+
+    def load_module(self, name: str) -> ModuleDefinition | None:
+        """Return a stored module definition, or None for leaf cells."""
+        ...
+
+    def module_names(self) -> tuple[str, ...]:
+        """Return the names of all stored module definitions."""
+        ...
+
+    def count_edge_sources(self) -> int:
+        """Return the number of distinct edge source names."""
+        ...
+
+    def iter_edge_sources(self) -> Iterator[str]:
+        """Stream the distinct edge source names (the keys delays update)."""
+        ...
+
+    def iter_edge_rows(self) -> Iterator[EdgeRow]:
+        """Stream every edge as a row; delays not yet annotated read as 0."""
+        ...
+
+    def replace_slack_rows(self, rows: Sequence[TimingRow]) -> None:
+        """Replace the slack table with the rows of a new slack computation."""
+        ...
+
+    def find_slack_below(
+        self, threshold: float, limit: int | None = None
+    ) -> list[SlackRow]:
+        """Return stored slack rows below threshold, worst first."""
+        ...
+
+    def metric_range(self, metric: str) -> tuple[float, float] | None:
+        """Return (min, max) of a metric from METRICS, or None without rows."""
+        ...
+
+    def iter_metric_chunks(
+        self, metric: str, chunk_rows: int
+    ) -> Iterator[list[tuple[str, float]]]:
+        """Stream (node name, value) rows of a metric, chunk_rows at a time."""
+        ...
+
+    def columnar_snapshot(self) -> AbstractContextManager[ColumnarSource]:
+        """Number every node densely and expose the graph for a columnar export."""
+        ...
+
+    def cluster_edges(self) -> None:
         """
-        Finds the path with the maximum accumulated delay between start and end nodes.
-        Returns the tuple of edges forming that path.
+        Rewrite the edges in source order with an index covering the delays,
+        so fan-out lookups read contiguous pages; run once imports are done.
         """
+        ...
 
+    def build_node_lookup(self) -> None:
+        """Build the name index used by find_nodes."""
         ...
 
     def bulk_mode(self) -> AbstractContextManager:
@@ -0,0 +1,77 @@
+from collections.abc import Collection, Sequence
+from typing import Protocol, runtime_checkable
+
+from src.domain.model.bus import Bus
+from src.domain.model.trace_result import TraceResult
+
+
+@runtime_checkable
+class PathQueries(Protocol):
+    """Read-only queries a path trace needs; every GraphRepository offers them."""
+
+    def find_nodes(self, pattern: str, limit: int | None = None) -> tuple[str, ...]:
+        """Return node names matching a glob pattern (e.g. "u_core/u_alu*/Z")."""
+        ...
+
+    def find_bus(self, name: str) -> Bus | None:
+        """Return the bus declared under name, if any."""
+        ...
+
+    def find_max_delay_path(
+        self,
+        start_node: str,
+        end_node: str | None = None,
+        max_depth: int = 100,
+        beam_width: int | None = None,
+        timeout: float | None = None,
+    ) -> TraceResult:
+        """
+        Finds the path with the maximum accumulated delay between start and end nodes.
+        The search is exact unless beam_width is given, in which case only the
+        beam_width highest-arrival partial paths survive each level and the
+        result is flagged as approximate.
+        With a timeout (seconds) the search is cancelled when it runs out and
+        the best path found so far is returned, flagged as partial.
+        """
+
+        ...
+
+    def find_max_delay_path_from_any(
+        self,
+        start_nodes: Collection[str],
+        end_nodes: Collection[str] | None = None,
+        max_depth: int = 100,
+        beam_width: int | None = None,
+        timeout: float | None = None,
+    ) -> TraceResult:
+        """
+        One search seeded with every start node that finishes at any of
+        end_nodes (or anywhere when None): the worst path over all pairs
+        without a search per pair. Exact on acyclic graphs unless beam_width
+        is given; the timeout covers the whole search.
+        """
+        ...
+
+    def find_max_delay_path_through(
+        self,
+        start_node: str,
+        through: Sequence[str],
+        end_node: str | None = None,
+        timeout: float | None = None,
+    ) -> TraceResult:
+        """
+        Finds the max delay path from start_node that visits every through
+        node in the given order, then reaches end_node (or its worst endpoint).
+        Returns an empty result when some through node is unreachable.
+        """
+        ...
+
+    def find_max_delay_path_through_from_any(
+        self,
+        start_nodes: Collection[str],
+        through: Sequence[str],
+        end_nodes: Collection[str] | None = None,
+        timeout: float | None = None,
+    ) -> TraceResult:
+        """find_max_delay_path_through from any start node to any end node."""
+        ...
@@ -10,3 +10,15 @@ class ProgressObserver(Protocol):
     def set_description(self, description: str) -> None:
         """report current process"""
         ...
+
+    def stage_started(self, stage: str) -> None:
+        """report that a named stage (e.g. "import_edges") has begun"""
+        ...
+
+    def stage_finished(self, stage: str, rows: int) -> None:
+        """report that a stage ended after handling rows records"""
+        ...
+
+    def record_timing(self, category: str, seconds: float, rows: int = 0) -> None:
+        """report time spent in one step (e.g. "parse", "sql:insert_edges")"""
+        ...
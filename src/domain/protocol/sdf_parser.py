@@ -2,7 +2,9 @@ from collections.abc import Iterator
 from pathlib import Path
 from typing import Protocol, runtime_checkable
 
-from src.domain.model.edge import Edge
+from src.domain.model.cell_arc import CellArcRow
+from src.domain.model.edge import Edge, EdgeRow
+from src.domain.protocol.progress_observer import ProgressObserver
 
 
 @runtime_checkable
@@ -10,10 +12,43 @@ class SDFParser(Protocol):
     """Protocol for parsing SDF files to extract delay information."""
 
     def parse_delays(
-        self, path_sdf: Path, batch_size: int = 10000
+        self,
+        path_sdf: Path,
+        batch_size: int = 10000,
+        observer: ProgressObserver | None = None,
     ) -> Iterator[tuple[Edge, ...]]:
         """
         Parses SDF and yields batches of Edges with delay information.
         Note: The returned Edges act as DTOs containing (src, dst, delay).
         """
         ...
+
+    def parse_delay_rows(
+        self,
+        path_sdf: Path,
+        batch_size: int = 10000,
+        observer: ProgressObserver | None = None,
+    ) -> Iterator[list[EdgeRow]]:
+        """Yields batches of (src, dst, rise, fall) rows without building Edges."""
+        ...
+
+    def parse_cell_arc_rows(
+        self,
+        path_sdf: Path,
+        batch_size: int = 10000,
+        observer: ProgressObserver | None = None,
+    ) -> Iterator[list[CellArcRow]]:
+        """Yields batches of IOPATH arcs as (instance, cell, from, to, rise, fall)."""
+        ...
+
+    def parse_delay_and_cell_arc_rows(
+        self,
+        path_sdf: Path,
+        batch_size: int = 10000,
+        observer: ProgressObserver | None = None,
+    ) -> Iterator[tuple[list[EdgeRow], list[CellArcRow]]]:
+        """
+        One pass yielding (interconnect rows, IOPATH arcs) batch pairs;
+        either list of a pair may be empty.
+        """
+        ...
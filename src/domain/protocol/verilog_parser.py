@@ -2,8 +2,11 @@ from collections.abc import Iterator
 from pathlib import Path
 from typing import Protocol, runtime_checkable
 
-from src.domain.model.edge import Edge
-from src.domain.model.node import Node
+from src.domain.model.bus import BusRow
+from src.domain.model.edge import Edge, EdgeRow
+from src.domain.model.module_definition import ModuleDefinition
+from src.domain.model.node import Node, NodeRow
+from src.domain.protocol.progress_observer import ProgressObserver
 
 
 @runtime_checkable
@@ -11,13 +14,47 @@ class VerilogParser(Protocol):
     """Protocol for parsing Verilog files using streams."""
 
     def parse_nodes(
-        self, path_verilog: Path, batch_size: int = 10000
-    ) -> Iterator[tuple[Node]]:
+        self,
+        path_verilog: Path,
+        batch_size: int = 10000,
+        observer: ProgressObserver | None = None,
+    ) -> Iterator[tuple[Node, ...]]:
         """Yields batches of nodes from the file."""
         ...
 
     def parse_edges(
-        self, path_verilog: Path, batch_size: int = 10000
-    ) -> Iterator[tuple[Edge]]:
+        self,
+        path_verilog: Path,
+        batch_size: int = 10000,
+        observer: ProgressObserver | None = None,
+    ) -> Iterator[tuple[Edge, ...]]:
         """Yields batches of edges from the file."""
         ...
+
+    def parse_node_rows(
+        self,
+        path_verilog: Path,
+        batch_size: int = 10000,
+        observer: ProgressObserver | None = None,
+    ) -> Iterator[list[NodeRow]]:
+        """Yields batches of (name,) rows without building Node objects."""
+        ...
+
+    def parse_edge_rows(
+        self,
+        path_verilog: Path,
+        batch_size: int = 10000,
+        observer: ProgressObserver | None = None,
+    ) -> Iterator[list[EdgeRow]]:
+        """Yields batches of (src, dst, rise, fall) rows without building Edges."""
+        ...
+
+    def parse_modules(
+        self, path_verilog: Path, observer: ProgressObserver | None = None
+    ) -> Iterator[ModuleDefinition]:
+        """Yields every module definition with its edges in local names."""
+        ...
+
+    def bus_rows(self) -> list[BusRow]:
+        """Returns the (name, msb, lsb) vector wires seen by parse_node_rows."""
+        ...
@@ -0,0 +1,103 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from numpy.lib.format import open_memmap
+
+from src.domain.model.edge import EdgeIdRow
+
+# One .npy file per column; np.load(path, mmap_mode="r") maps each without
+# copying, which an .npz archive cannot offer.
+_EDGE_COLUMNS = ("src", "dst", "rise", "fall")
+_NAME_OFFSETS = "name_offsets"  # int64, node i is bytes [offsets[i], offsets[i+1])
+_NAME_BYTES = "name_bytes"  # uint8, UTF-8 names back to back
+
+
+class NpyBundleWriter:
+    """
+    Writes a columnar export as a directory of .npy files: int32 (or int64
+    on very large graphs) src/dst IDs, float32 rise/fall delays, and the name
+    table as byte offsets into one UTF-8 blob. Columns are preallocated as
+    memory maps and filled chunk by chunk, so memory does not grow with size.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self._directory = directory
+        self._columns: dict[str, np.ndarray] = {}
+        self._edges_written = 0
+        self._names_written = 0
+        self._bytes_written = 0
+
+    def allocate(self, node_count: int, edge_count: int, name_bytes: int) -> None:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        id_type = np.int32 if node_count <= np.iinfo(np.int32).max else np.int64
+        shapes = {
+            "src": (id_type, edge_count),
+            "dst": (id_type, edge_count),
+            "rise": (np.float32, edge_count),
+            "fall": (np.float32, edge_count),
+            _NAME_OFFSETS: (np.int64, node_count + 1),
+            _NAME_BYTES: (np.uint8, name_bytes),
+        }
+        for name, (dtype, length) in shapes.items():
+            self._columns[name] = self._open(name, dtype, length)
+        self._columns[_NAME_OFFSETS][0] = 0
+
+    def write_names(self, names: Sequence[str]) -> None:
+        encoded = [name.encode("utf-8") for name in names]
+        lengths = np.fromiter(map(len, encoded), np.int64, len(encoded))
+        start = self._names_written
+        self._columns[_NAME_OFFSETS][start + 1 : start + 1 + len(encoded)] = (
+            self._bytes_written + np.cumsum(lengths)
+        )
+        blob = np.frombuffer(b"".join(encoded), np.uint8)
+        self._columns[_NAME_BYTES][
+            self._bytes_written : self._bytes_written + len(blob)
+        ] = blob
+        self._names_written += len(encoded)
+        self._bytes_written += len(blob)
+
+    def write_edges(self, rows: Sequence[EdgeIdRow]) -> None:
+        block = np.array(rows, dtype=np.float64).reshape(-1, len(_EDGE_COLUMNS))
+        start, stop = self._edges_written, self._edges_written + len(block)
+        for i, name in enumerate(_EDGE_COLUMNS):
+            self._columns[name][start:stop] = block[:, i]
+        self._edges_written = stop
+
+    def close(self) -> None:
+        for column in self._columns.values():
+            if isinstance(column, np.memmap):
+                column.flush()
+        self._columns.clear()
+
+    def _open(self, name: str, dtype: type, length: int) -> np.ndarray:
+        path = self._directory / f"{name}.npy"
+        if length == 0:  # an empty file cannot be memory-mapped
+            np.save(path, np.empty(0, dtype=dtype))
+            return np.empty(0, dtype=dtype)
+        return open_memmap(path, mode="w+", dtype=dtype, shape=(length,))
+
+
+@dataclass(frozen=True)
+class NpyBundle:
+    """Read-only memory maps of an exported bundle."""
+
+    src: np.ndarray
+    dst: np.ndarray
+    rise: np.ndarray
+    fall: np.ndarray
+    name_offsets: np.ndarray
+    name_bytes: np.ndarray
+
+    def name(self, node_id: int) -> str:
+        start, stop = self.name_offsets[node_id : node_id + 2]
+        return self.name_bytes[start:stop].tobytes().decode("utf-8")
+
+
+def load_npy_bundle(directory: Path) -> NpyBundle:
+    """Maps every column with mmap_mode="r"; nothing is read until accessed."""
+    columns = (*_EDGE_COLUMNS, _NAME_OFFSETS, _NAME_BYTES)
+    return NpyBundle(
+        *(np.load(directory / f"{name}.npy", mmap_mode="r") for name in columns)
+    )
@@ -0,0 +1,105 @@
+import json
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from src.domain.protocol.progress_observer import ProgressObserver
+from src.infra.metrics.process_memory import peak_rss_bytes
+
+
+@dataclass
+class _Timing:
+    calls: int = 0
+    seconds: float = 0.0
+    rows: int = 0
+
+
+@dataclass
+class _Stage:
+    name: str
+    started_at: float
+    seconds: float = 0.0
+    rows: int = 0
+    timings: dict[str, _Timing] = field(default_factory=dict)
+
+
+class ProfilingObserver(ProgressObserver):
+    """
+    Collects stage events and step timings into a machine-readable report,
+    forwarding progress to another observer (e.g. a progress bar) if given.
+    Timings are attributed to the stage that is running when they arrive.
+    Peak RSS is the process-lifetime high-water mark, so it is reported once
+    for the whole run rather than per stage.
+    """
+
+    def __init__(self, inner: ProgressObserver | None = None) -> None:
+        self._inner = inner
+        self._started_at = time.perf_counter()
+        self._bytes = 0
+        self._stages: list[_Stage] = []
+        self._open: dict[str, _Stage] = {}
+        self._timings: dict[str, _Timing] = {}
+
+    def forward_to(self, inner: ProgressObserver | None) -> None:
+        self._inner = inner
+
+    def update(self, increment: int) -> None:
+        self._bytes += increment
+        if self._inner:
+            self._inner.update(increment)
+
+    def set_description(self, description: str) -> None:
+        if self._inner:
+            self._inner.set_description(description)
+
+    def stage_started(self, stage: str) -> None:
+        self._open[stage] = _Stage(stage, time.perf_counter())
+        self._stages.append(self._open[stage])
+        if self._inner:
+            self._inner.stage_started(stage)
+
+    def stage_finished(self, stage: str, rows: int) -> None:
+        if current := self._open.pop(stage, None):
+            current.seconds = time.perf_counter() - current.started_at
+            current.rows = rows
+        if self._inner:
+            self._inner.stage_finished(stage, rows)
+
+    def record_timing(self, category: str, seconds: float, rows: int = 0) -> None:
+        scopes = [self._timings]
+        scopes += [s.timings for s in self._open.values()]
+        for timings in scopes:
+            timing = timings.setdefault(category, _Timing())
+            timing.calls += 1
+            timing.seconds += seconds
+            timing.rows += rows
+
+    def report(self) -> dict[str, Any]:
+        return {
+            "wall_seconds": time.perf_counter() - self._started_at,
+            "input_bytes": self._bytes,
+            "peak_rss_bytes": peak_rss_bytes(),
+            "stages": [_stage_report(s) for s in self._stages],
+            "timings": _timings_report(self._timings),
+        }
+
+    def write_report(self, path: Path) -> None:
+        path.write_text(json.dumps(self.report(), indent=2))
+
+
+def _stage_report(stage: _Stage) -> dict[str, Any]:
+    return {
+        "name": stage.name,
+        "seconds": stage.seconds,
+        "rows": stage.rows,
+        "rows_per_second": stage.rows / stage.seconds if stage.seconds else 0.0,
+        "timings": _timings_report(stage.timings),
+    }
+
+
+def _timings_report(timings: dict[str, _Timing]) -> dict[str, dict[str, float]]:
+    return {
+        category: {"calls": t.calls, "seconds": t.seconds, "rows": t.rows}
+        for category, t in sorted(timings.items())
+    }
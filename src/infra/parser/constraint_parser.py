@@ -0,0 +1,27 @@
+from pathlib import Path
+
+
+def read_required_times(path: Path) -> dict[str, float]:
+    """
+    Reads "<endpoint> <required_time>" lines; blank lines and text after "#"
+    are ignored. A later line for the same endpoint replaces an earlier one.
+    """
+    required: dict[str, float] = {}
+    with path.open(encoding="utf-8") as f:
+        for number, line in enumerate(f, start=1):
+            fields = line.split("#", 1)[0].split()
+            if not fields:
+                continue
+            match fields:
+                case [endpoint, value]:
+                    try:
+                        required[endpoint] = float(value)
+                    except ValueError as error:
+                        raise ValueError(
+                            f"{path}:{number}: invalid required time {value!r}"
+                        ) from error
+                case _:
+                    raise ValueError(
+                        f"{path}:{number}: expected '<endpoint> <required_time>'"
+                    )
+    return required
@@ -0,0 +1,112 @@
+import bz2
+import gzip
+import lzma
+import queue
+import threading
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import IO, cast
+
+from src.domain.protocol.progress_observer import ProgressObserver
+
+_PROGRESS_CHUNK = 1 << 20  # bytes accumulated between observer updates
+_DECOMPRESS_BLOCK = 4 << 20  # decompressed bytes handed over per queue item
+_QUEUE_DEPTH = 4  # blocks buffered ahead of the parser
+_PUT_TIMEOUT = 0.1
+
+# A decompressed block with the compressed offset reached, a worker error
+# to re-raise, or None once the file is exhausted.
+_QueueItem = tuple[bytes, int] | BaseException | None
+
+_DECOMPRESSORS: dict[str, Callable[[IO[bytes]], IO[bytes]]] = {
+    ".gz": lambda raw: cast(IO[bytes], gzip.GzipFile(fileobj=raw)),
+    ".bz2": bz2.BZ2File,
+    ".xz": lzma.LZMAFile,
+}
+
+
+def read_lines(path: Path, observer: ProgressObserver | None) -> Iterator[str]:
+    """
+    Yields decoded lines, reporting progress per chunk instead of per line.
+    .gz/.bz2/.xz files are decompressed on a background thread; progress is
+    then reported in compressed bytes so it matches the file size on disk.
+    """
+    if path.suffix in _DECOMPRESSORS:
+        return _read_compressed_lines(path, observer)
+    return _read_plain_lines(path, observer)
+
+
+def _read_plain_lines(path: Path, observer: ProgressObserver | None) -> Iterator[str]:
+    pending = 0
+    try:
+        with path.open("rb") as f:
+            for line_bytes in f:
+                pending += len(line_bytes)
+                if pending >= _PROGRESS_CHUNK and observer:
+                    observer.update(pending)
+                    pending = 0
+                yield line_bytes.decode("utf-8", errors="replace")
+    finally:
+        if pending and observer:
+            observer.update(pending)
+
+
+def _read_compressed_lines(
+    path: Path, observer: ProgressObserver | None
+) -> Iterator[str]:
+    tail = b""
+    reported = 0
+    for block, compressed_offset in _BackgroundDecompressor(path).blocks():
+        lines = (tail + block).split(b"\n")
+        tail = lines.pop()
+        for line_bytes in lines:
+            yield line_bytes.decode("utf-8", errors="replace") + "\n"
+        if observer and compressed_offset > reported:
+            observer.update(compressed_offset - reported)
+            reported = compressed_offset
+    if tail:
+        yield tail.decode("utf-8", errors="replace")
+
+
+class _BackgroundDecompressor:
+    """Decompresses a file on a worker thread into a bounded queue of blocks."""
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._queue: queue.Queue[_QueueItem] = queue.Queue(maxsize=_QUEUE_DEPTH)
+        self._stopped = threading.Event()
+
+    def blocks(self) -> Iterator[tuple[bytes, int]]:
+        """Yields (decompressed block, compressed bytes consumed so far)."""
+        worker = threading.Thread(target=self._run, daemon=True)
+        worker.start()
+        try:
+            while (item := self._queue.get()) is not None:
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            self._stopped.set()
+            worker.join()
+
+    def _run(self) -> None:
+        try:
+            with self._path.open("rb") as raw:
+                with _DECOMPRESSORS[self._path.suffix](raw) as stream:
+                    while block := stream.read(_DECOMPRESS_BLOCK):
+                        if not self._put((block, raw.tell())):
+                            return
+        except Exception as error:  # re-raised on the reader thread
+            self._put(error)
+            return
+        self._put(None)
+
+    def _put(self, item: _QueueItem) -> bool:
+        """Blocks until the item is queued; False once the reader has gone away."""
+        while not self._stopped.is_set():
+            try:
+                self._queue.put(item, timeout=_PUT_TIMEOUT)
+                return True
+            except queue.Full:
+                continue
+        return False
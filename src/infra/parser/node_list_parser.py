@@ -0,0 +1,10 @@
+from pathlib import Path
+
+
+def read_node_names(path: Path) -> list[str]:
+    """
+    Reads one node name (or glob pattern) per line, in file order; blank
+    lines and text after "#" are ignored.
+    """
+    with path.open(encoding="utf-8") as f:
+        return [name for line in f if (name := line.split("#", 1)[0].strip())]
@@ -4,10 +4,17 @@ from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from itertools import islice
 from pathlib import Path
+from typing import TypeVar
 
-from src.domain.model.edge import Edge
+from src.domain.model.cell_arc import CellArcRow
+from src.domain.model.edge import Edge, EdgeRow
 from src.domain.protocol.progress_observer import ProgressObserver
 from src.domain.protocol.sdf_parser import SDFParser
+from src.infra.parser.line_reader import read_lines
+
+_CELL_KEYWORDS = ("(CELLTYPE", "(INSTANCE", "(IOPATH")
+
+_Row = TypeVar("_Row", EdgeRow, CellArcRow)
 
 
 @dataclass(frozen=True)
@@ -24,6 +31,18 @@ class SDFStreamParser(SDFParser):
         r"\(INTERCONNECT\s+([\w/\[\]]+)\s+([\w/\[\]]+)\s+\(.*?::([\d\.\-]+)\)\s+\(.*?::([\d\.\-]+)\)"
     )
     _RE_PARENS = re.compile(r"[()]")
+    # CELLTYPE and INSTANCE set the context of the IOPATH records that follow;
+    # an IOPATH input may carry an edge, as in "(posedge CP)".
+    _RE_CELL_RECORD = re.compile(
+        r'\(CELLTYPE\s+"([^"]*)"\s*\)'
+        r"|\(INSTANCE\s*([^()\s]*)\s*\)"
+        r"|\(IOPATH\s+(?:\(\s*\w+\s+([\w\[\]]+)\s*\)|([\w\[\]]+))\s+([\w\[\]]+)"
+        r"\s+\(([^()]*)\)(?:\s*\(([^()]*)\))?"
+    )
+
+    def __init__(self, hierarchical: bool = False) -> None:
+        """hierarchical keeps full pin paths ("u_core/u1.A") instead of "u1.A"."""
+        self._hierarchical = hierarchical
 
     def parse_delays(
         self,
@@ -31,24 +50,62 @@ class SDFStreamParser(SDFParser):
         batch_size: int = 10000,
         observer: ProgressObserver | None = None,
     ) -> Iterator[tuple[Edge, ...]]:
+        for rows in self.parse_delay_rows(path_sdf, batch_size, observer):
+            yield tuple(Edge(*row) for row in rows)
+
+    def parse_delay_rows(
+        self,
+        path_sdf: Path,
+        batch_size: int = 10000,
+        observer: ProgressObserver | None = None,
+    ) -> Iterator[list[EdgeRow]]:
         lines_gen = self._read_lines(path_sdf, observer)
         blocks_gen = self._yield_interconnect_blocks(lines_gen)
-        edges_gen = self._extract_edges(blocks_gen)
-        yield from self._batch_data(edges_gen, batch_size)
+        rows_gen = self._extract_rows(blocks_gen)
+        yield from self._batch_data(rows_gen, batch_size)
+
+    def parse_cell_arc_rows(
+        self,
+        path_sdf: Path,
+        batch_size: int = 10000,
+        observer: ProgressObserver | None = None,
+    ) -> Iterator[list[CellArcRow]]:
+        lines_gen = self._read_lines(path_sdf, observer)
+        yield from self._batch_data(self._extract_cell_arcs(lines_gen), batch_size)
+
+    def parse_delay_and_cell_arc_rows(
+        self,
+        path_sdf: Path,
+        batch_size: int = 10000,
+        observer: ProgressObserver | None = None,
+    ) -> Iterator[tuple[list[EdgeRow], list[CellArcRow]]]:
+        """
+        Reads the file once for both: yields (interconnect rows, IOPATH arcs)
+        whenever either reaches batch_size, so either list may be empty.
+        """
+        ctx, cell = _ParseContext(), ("", "")
+        delays: list[EdgeRow] = []
+        arcs: list[CellArcRow] = []
+        for line in self._read_lines(path_sdf, observer):
+            if self._should_process(line, ctx):
+                ctx, blocks = self._process_line(line, ctx)
+                delays.extend(self._extract_rows(iter(blocks)))
+            if any(keyword in line for keyword in _CELL_KEYWORDS):
+                cell = self._scan_cell_records(line, cell, arcs)
+            if len(delays) >= batch_size or len(arcs) >= batch_size:
+                yield delays, arcs
+                delays, arcs = [], []
+        if delays or arcs:
+            yield delays, arcs
 
     def _read_lines(
         self, path: Path, observer: ProgressObserver | None
     ) -> Iterator[str]:
-        with path.open("rb") as f:
-            for line_bytes in f:
-                if observer:
-                    observer.update(len(line_bytes))
-
-                yield line_bytes.decode("utf-8", errors="replace")
+        return read_lines(path, observer)
 
-    def _batch_data(self, data: Iterable, size: int) -> Iterator[tuple]:
+    def _batch_data(self, data: Iterable[_Row], size: int) -> Iterator[list[_Row]]:
         iterator = iter(data)
-        while batch := tuple(islice(iterator, size)):
+        while batch := list(islice(iterator, size)):
             yield batch
 
     def _yield_interconnect_blocks(self, lines: Iterator[str]) -> Iterator[str]:
@@ -116,21 +173,74 @@ class SDFStreamParser(SDFParser):
                 return text[: match.end()], balance, is_finished
         return text, balance, is_finished
 
-    def _extract_edges(self, statements: Iterator[str]) -> Iterator[Edge]:
-        """Parses complete statements to create Edge objects."""
+    def _extract_rows(self, statements: Iterator[str]) -> Iterator[EdgeRow]:
+        """Parses complete statements into (src, dst, rise, fall) rows."""
         for stmt in statements:
             if match := self._RE_INTERCONNECT.search(stmt):
                 src_raw, dst_raw, rise, fall = match.groups()
                 src = self._normalize_name(src_raw)
                 dst = self._normalize_name(dst_raw)
 
-                yield Edge(src, dst, float(rise), float(fall))
+                yield (src, dst, float(rise), float(fall))
+
+    def _extract_cell_arcs(self, lines: Iterator[str]) -> Iterator[CellArcRow]:
+        """
+        Yields one row per IOPATH, its instance named as pins are.
+        IOPATH records are expected on one line each, as tools write them;
+        arcs of the design-level CELL (an empty INSTANCE) have no instance.
+        """
+        cell = ("", "")
+        for line in lines:
+            if any(keyword in line for keyword in _CELL_KEYWORDS):
+                arcs: list[CellArcRow] = []
+                cell = self._scan_cell_records(line, cell, arcs)
+                yield from arcs
+
+    def _scan_cell_records(
+        self, line: str, cell: tuple[str, str], arcs: list[CellArcRow]
+    ) -> tuple[str, str]:
+        """
+        Appends the line's IOPATH arcs to arcs; cell is the (cell type, raw
+        instance) in effect, returned as the line leaves it.
+        """
+        cell_type, instance_raw = cell
+        for match in self._RE_CELL_RECORD.finditer(line):
+            celltype, instance, edged_in, plain_in, out, rise, fall = match.groups()
+            if celltype is not None:
+                cell_type, instance_raw = celltype, ""
+            elif instance is not None:
+                instance_raw = instance
+            elif instance_raw and instance_raw != "*":
+                in_pin = edged_in or plain_in
+                rise_delay = _max_value(rise)
+                fall_delay = rise_delay if fall is None else _max_value(fall)
+                instance = self._normalize_instance(instance_raw)
+                arcs.append((instance, cell_type, in_pin, out, rise_delay, fall_delay))
+        return cell_type, instance_raw
+
+    def _normalize_instance(self, raw_instance: str) -> str:
+        if self._hierarchical:
+            return raw_instance.replace(".", "/")
+        return raw_instance.replace(".", "/").rsplit("/", 1)[-1]
 
     def _normalize_name(self, raw_name: str) -> str:
-        """Converts SDF hierarchical path to local Verilog name."""
+        """
+        Converts an SDF pin path to the netlist's name for it: "u1.A", or
+        "u_core/u1.A" (hierarchy kept, as `flatten` names pins) when
+        hierarchical.
+        """
+        if self._hierarchical:
+            instance, _, pin = raw_name.replace(".", "/").rpartition("/")
+            return f"{instance}.{pin}" if instance else pin
         num_last_inst_pin = 2
         converted = raw_name.replace("/", ".")
         parts = converted.split(".")
         if len(parts) >= num_last_inst_pin:
             return f"{parts[-2]}.{parts[-1]}"
         return converted
+
+
+def _max_value(triple: str) -> float:
+    """The max of "min:typ:max" (or "min::max", or a single value); 0 if empty."""
+    fields = [field for field in triple.split(":") if field.strip()]
+    return float(fields[-1]) if fields else 0.0
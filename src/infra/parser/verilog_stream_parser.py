@@ -2,18 +2,38 @@ import re
 from collections.abc import Iterator
 from pathlib import Path
 
-from src.domain.model.edge import Edge
-from src.domain.model.node import Node
+from src.domain.model.bus import BusRow
+from src.domain.model.edge import Edge, EdgeRow
+from src.domain.model.module_definition import ModuleDefinition
+from src.domain.model.node import Node, NodeRow
 from src.domain.protocol.progress_observer import ProgressObserver
 from src.domain.protocol.verilog_parser import VerilogParser
+from src.infra.parser.line_reader import read_lines
+
+# A simple identifier, or an escaped one (\u_core/u1 ended by a space),
+# as flattening tools write hierarchical instance and net names.
+_NAME = r"(\\\S+\s|\w+)"
 
 
 class VerilogStreamParser(VerilogParser):
-    _RE_WIRE = re.compile(r"^\s*(?:wire|input|output)\s+(?:\[.*?\]\s*)?(\w+)\s*;")
-    _RE_ASSIGN = re.compile(r"^\s*assign\s+(\w+)\s*=\s*(\w+)\s*;")
-    _RE_INST_START = re.compile(r"^\s*(\w+)\s+(\w+)\s*\(")
-    _RE_PIN = re.compile(r"\.\s*(\w+)\s*\(\s*(\w+)\s*\)")
+    _RE_WIRE = re.compile(
+        r"^\s*(?:wire|input|output)\s+(?:\[\s*(?:(\d+)\s*:\s*(\d+))?[^\]]*\]\s*)?"
+        + _NAME
+        + r"\s*;"
+    )
+    _RE_ASSIGN = re.compile(
+        r"^\s*assign\s+(\w+)\s*(?:\[\s*(\d+)\s*\])?\s*=\s*(\w+)\s*(?:\[\s*(\d+)\s*\])?\s*;"
+    )
+    _RE_INST_START = re.compile(r"^\s*(\w+)\s+" + _NAME + r"\s*\(")
+    _RE_PIN = re.compile(
+        r"\.\s*(\w+)\s*\(\s*" + _NAME + r"\s*(?:\[\s*(\d+)\s*\])?\s*\)"
+    )
     _RE_INST_END = re.compile(r"\)\s*;")
+    _RE_MODULE_START = re.compile(r"^\s*module\s+(\w+)")
+    _RE_MODULE_END = re.compile(r"^\s*endmodule\b")
+
+    def __init__(self) -> None:
+        self._buses: list[BusRow] = []
 
     def parse_nodes(
         self,
@@ -21,61 +41,129 @@ class VerilogStreamParser(VerilogParser):
         batch_size: int = 10000,
         observer: ProgressObserver | None = None,
     ) -> Iterator[tuple[Node, ...]]:
-        batch: list[Node] = []
-        for line, raw_len in self._read_lines(path):
-            if observer:
-                observer.update(raw_len)
+        for rows in self.parse_node_rows(path, batch_size, observer):
+            yield tuple(Node(*row) for row in rows)
+
+    def parse_edges(
+        self,
+        path: Path,
+        batch_size: int = 10000,
+        observer: ProgressObserver | None = None,
+    ) -> Iterator[tuple[Edge, ...]]:
+        for rows in self.parse_edge_rows(path, batch_size, observer):
+            yield tuple(Edge(*row) for row in rows)
 
+    def parse_node_rows(
+        self,
+        path: Path,
+        batch_size: int = 10000,
+        observer: ProgressObserver | None = None,
+    ) -> Iterator[list[NodeRow]]:
+        batch: list[NodeRow] = []
+        self._buses = []
+        for line in self._read_lines(path, observer):
             if match := self._RE_WIRE.search(line):
-                batch.append(Node(match.group(1)))
+                msb, lsb, raw_name = match.groups()
+                name = _unescape(raw_name)
+                batch.append((name,))
+                if msb is not None:
+                    self._buses.append((name, int(msb), int(lsb)))
 
             if len(batch) >= batch_size:
-                yield tuple(batch)
+                yield batch
                 batch = []
 
         if batch:
-            yield tuple(batch)
+            yield batch
 
-    def parse_edges(
+    def parse_edge_rows(
         self,
         path: Path,
         batch_size: int = 10000,
         observer: ProgressObserver | None = None,
-    ) -> Iterator[tuple[Edge, ...]]:
-        batch: list[Edge] = []
+    ) -> Iterator[list[EdgeRow]]:
+        batch: list[EdgeRow] = []
         current_inst_name: str | None = None
 
-        for line, raw_len in self._read_lines(path):
-            if observer:
-                observer.update(raw_len)
-
-            if match := self._RE_ASSIGN.search(line):
-                batch.append(Edge(match.group(2), match.group(1), 0.0, 0.0))
-                continue
-
-            if match := self._RE_INST_START.search(line):
-                current_inst_name = match.group(2)
-
-            if current_inst_name:
-                for match in self._RE_PIN.finditer(line):
-                    pin_name = match.group(1)
-                    net_name = match.group(2)
-                    src_node = f"{current_inst_name}.{pin_name}"
-                    dst_node = net_name
-                    batch.append(Edge(src_node, dst_node, 0.0, 0.0))
-
-            if self._RE_INST_END.search(line):
-                current_inst_name = None
+        for line in self._read_lines(path, observer):
+            current_inst_name, rows = self._scan_edges(line, current_inst_name)
+            batch.extend(rows)
 
             if len(batch) >= batch_size:
-                yield tuple(batch)
+                yield batch
                 batch = []
 
         if batch:
-            yield tuple(batch)
+            yield batch
+
+    def parse_modules(
+        self, path: Path, observer: ProgressObserver | None = None
+    ) -> Iterator[ModuleDefinition]:
+        """
+        Yields each module ... endmodule once, with its edges in local names.
+        Only one module body is held in memory at a time.
+        """
+        module_name: str | None = None
+        edges: list[EdgeRow] = []
+        instances: list[tuple[str, str]] = []
+        current_inst_name: str | None = None
+
+        for line in self._read_lines(path, observer):
+            if match := self._RE_MODULE_START.search(line):
+                module_name, edges, instances = match.group(1), [], []
+                current_inst_name = None
+                continue
+            if module_name is None:
+                continue
+            if self._RE_MODULE_END.search(line):
+                yield ModuleDefinition(module_name, tuple(edges), tuple(instances))
+                module_name = None
+                continue
 
-    def _read_lines(self, path: Path) -> Iterator[tuple[str, int]]:
-        with path.open("rb") as f:
-            for line_bytes in f:
-                line_str = line_bytes.decode("utf-8", errors="replace")
-                yield line_str, len(line_bytes)
+            if not self._RE_ASSIGN.search(line) and (
+                match := self._RE_INST_START.search(line)
+            ):
+                instances.append((_unescape(match.group(2)), match.group(1)))
+            current_inst_name, rows = self._scan_edges(line, current_inst_name)
+            edges.extend(rows)
+
+    def bus_rows(self) -> list[BusRow]:
+        return list(self._buses)
+
+    def _scan_edges(
+        self, line: str, current_inst_name: str | None
+    ) -> tuple[str | None, list[EdgeRow]]:
+        """Returns the instance still open after line and the edges it declares."""
+        if match := self._RE_ASSIGN.search(line):
+            dst_node = _net_name(match.group(1), match.group(2))
+            src_node = _net_name(match.group(3), match.group(4))
+            return current_inst_name, [(src_node, dst_node, 0.0, 0.0)]
+
+        if match := self._RE_INST_START.search(line):
+            current_inst_name = _unescape(match.group(2))
+
+        rows: list[EdgeRow] = []
+        if current_inst_name:
+            for match in self._RE_PIN.finditer(line):
+                pin_name, net_name, bit = match.groups()
+                src_node = f"{current_inst_name}.{pin_name}"
+                rows.append((src_node, _net_name(_unescape(net_name), bit), 0.0, 0.0))
+
+        if self._RE_INST_END.search(line):
+            current_inst_name = None
+        return current_inst_name, rows
+
+    def _read_lines(
+        self, path: Path, observer: ProgressObserver | None
+    ) -> Iterator[str]:
+        return read_lines(path, observer)
+
+
+def _unescape(name: str) -> str:
+    """Drops the escape of an escaped identifier: u_core/u1, as flatten names it."""
+    return name[1:].rstrip() if name.startswith("\\") else name
+
+
+def _net_name(net: str, bit: str | None) -> str:
+    """Names one bit of a bus "net[bit]"; bits are never expanded eagerly."""
+    return net if bit is None else f"{net}[{bit}]"
@@ -0,0 +1,157 @@
+import heapq
+import sqlite3
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+
+from src.domain.model.cell_arc import split_pin
+from src.domain.model.edge import Edge
+from src.domain.model.trace_result import SearchStats, TraceResult
+from src.infra.repository.search_deadline import SearchDeadline
+
+_SQLITE_MAX_PARAMS = 900
+_SQL_ARCS_OF_INSTANCES = (
+    "SELECT a.instance, t.from_pin, t.to_pin, t.rise, t.fall FROM cell_arcs a "
+    "JOIN delay_templates t ON t.id = a.template_id WHERE a.instance IN ({})"
+)
+
+# Maps a set of nodes to their outgoing edges.
+FanoutSource = Callable[[set[str]], dict[str, list[Edge]]]
+
+
+@dataclass(frozen=True)
+class _PartialPath:
+    tip: str
+    arrival: float = 0.0
+    edges: tuple[Edge, ...] = ()
+    visited: frozenset[str] = frozenset()
+
+    def extend(self, edge: Edge) -> "_PartialPath":
+        return _PartialPath(
+            edge.dst_node,
+            self.arrival + max(edge.delay_rise, edge.delay_fall),
+            self.edges + (edge,),
+            self.visited | {edge.dst_node},
+        )
+
+
+class BeamPathSearch:
+    """
+    Approximate max delay search that expands the graph level by level and keeps
+    only the `beam_width` highest-arrival partial paths, one per reached node.
+    Time and memory are bounded by beam_width * max_depth. The deadline is
+    checked between levels; once it expires the best path so far is returned.
+    Without a beam_width every reached node keeps its best partial path, which
+    is exact on acyclic timing graphs.
+    """
+
+    def __init__(
+        self,
+        fanout: sqlite3.Connection | FanoutSource,
+        beam_width: int | None,
+        deadline: SearchDeadline | None = None,
+    ) -> None:
+        if isinstance(fanout, sqlite3.Connection):
+            fanout = sqlite_fanout(fanout)
+        self._fanout = fanout
+        self._beam_width = beam_width
+        self._deadline = deadline or SearchDeadline()
+
+    def run(self, start: str, end: str | None, max_depth: int) -> TraceResult:
+        return self.run_from_any((start,), None if end is None else (end,), max_depth)
+
+    def run_from_any(
+        self, starts: Iterable[str], ends: Iterable[str] | None, max_depth: int
+    ) -> TraceResult:
+        """
+        One search seeded with every start, finishing at any of ends (or
+        anywhere when ends is None); the worst path over all pairs wins.
+        Paths go on past an end while another end may lie beyond it.
+        """
+        targets = None if ends is None else frozenset(ends)
+        stop_at = targets if targets is not None and len(targets) == 1 else ()
+        beam = [_PartialPath(s, visited=frozenset((s,))) for s in dict.fromkeys(starts)]
+        best = _PartialPath("", arrival=float("-inf"))
+        paths, nodes = 0, set[str]()
+        for _ in range(max_depth):
+            if self._deadline.expired():
+                break
+            candidates = self._expand(beam)
+            paths += len(candidates)
+            nodes.update(c.tip for c in candidates)
+            finished = [c for c in candidates if targets is None or c.tip in targets]
+            best = max((best, *finished), key=_arrival)
+            beam = self._select_beam(c for c in candidates if c.tip not in stop_at)
+            if not beam:
+                break
+        stats = SearchStats(paths, len(nodes), self._deadline.elapsed())
+        partial = bool(beam) and self._deadline.expired()
+        approximate = self._beam_width is not None
+        return TraceResult(best.edges, approximate, partial=partial, stats=stats)
+
+    def _expand(self, beam: list[_PartialPath]) -> list[_PartialPath]:
+        fanout = self._fanout({p.tip for p in beam})
+        return [
+            p.extend(e)
+            for p in beam
+            for e in fanout.get(p.tip, ())
+            if e.dst_node not in p.visited
+        ]
+
+    def _select_beam(self, candidates: Iterable[_PartialPath]) -> list[_PartialPath]:
+        """Keeps the best partial path per node, then the top beam_width overall."""
+        per_node: dict[str, _PartialPath] = {}
+        for c in candidates:
+            if c.tip not in per_node or c.arrival > per_node[c.tip].arrival:
+                per_node[c.tip] = c
+        if self._beam_width is None:
+            return list(per_node.values())
+        return heapq.nlargest(self._beam_width, per_node.values(), key=_arrival)
+
+
+def sqlite_fanout(connection: sqlite3.Connection) -> FanoutSource:
+    """Reads fan-out from the edges table of connection, chunked by SQLite limits."""
+    return _sqlite_adjacency(connection, "src")
+
+
+def sqlite_fanin(connection: sqlite3.Connection) -> FanoutSource:
+    """Reads fan-in (incoming edges keyed by dst) from the edges table."""
+    return _sqlite_adjacency(connection, "dst")
+
+
+def _sqlite_adjacency(connection: sqlite3.Connection, column: str) -> FanoutSource:
+    """Edges keyed by column, plus cell arcs from or into the nodes' instances."""
+    key = 0 if column == "src" else 1
+
+    def fetch(nodes: set[str]) -> dict[str, list[Edge]]:
+        adjacency: dict[str, list[Edge]] = {}
+        for chunk, placeholders in _chunks(nodes):
+            sql = (
+                "SELECT src, dst, delay_rise, delay_fall FROM edges "
+                f"WHERE {column} IN ({placeholders})"
+            )
+            for row in connection.execute(sql, chunk):
+                adjacency.setdefault(row[key], []).append(Edge(*row))
+        instances = {split_pin(node)[0] for node in nodes}
+        for chunk, placeholders in _chunks(instances):
+            rows = connection.execute(
+                _SQL_ARCS_OF_INSTANCES.format(placeholders), chunk
+            )
+            for instance, from_pin, to_pin, rise, fall in rows:
+                arc = Edge(f"{instance}.{from_pin}", f"{instance}.{to_pin}", rise, fall)
+                if (node := arc.src_node if key == 0 else arc.dst_node) in nodes:
+                    adjacency.setdefault(node, []).append(arc)
+        return adjacency
+
+    return fetch
+
+
+def _chunks(names: set[str]) -> Iterator[tuple[list[str], str]]:
+    """Sorted names in groups that fit SQLite's parameter limit, with placeholders."""
+    ordered = sorted(names)
+    for i in range(0, len(ordered), _SQLITE_MAX_PARAMS):
+        chunk = ordered[i : i + _SQLITE_MAX_PARAMS]
+        yield chunk, ",".join("?" * len(chunk))
+
+
+def _arrival(path: _PartialPath) -> float:
+    return path.arrival
@@ -0,0 +1,91 @@
+import queue
+import sqlite3
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+_MMAP_SIZE = 1 << 30  # let readers map up to 1 GiB of the file
+_STATEMENT_CACHE = 256  # prepared statements kept per connection
+
+
+class ConnectionPool:
+    """
+    Reuses SQLite connections instead of opening one per call.
+    Queries get read-only connections (mode=ro, memory-mapped reads) from a
+    small pool; writes share one connection behind a lock. Connections are
+    handed to one thread at a time, so they may move between threads, and in
+    WAL mode readers run alongside the writer. Each connection keeps its own
+    prepared-statement cache, which reuse makes effective.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        configure: Callable[[sqlite3.Connection], None],
+        size: int = 4,
+    ) -> None:
+        self._db_path = db_path
+        self._configure = configure
+        self._size = size
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._readers: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._write_connection: sqlite3.Connection | None = None
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        connection = self._acquire_reader()
+        try:
+            yield connection
+        finally:
+            self._idle.put(connection)
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        with self._write_lock:
+            if self._write_connection is None:
+                self._write_connection = self._open(read_only=False)
+            yield self._write_connection
+
+    def close(self) -> None:
+        with self._lock, self._write_lock:
+            for connection in self._readers:
+                connection.close()
+            if self._write_connection is not None:
+                self._write_connection.close()
+            self._readers.clear()
+            self._idle = queue.LifoQueue()
+            self._write_connection = None
+
+    def _acquire_reader(self) -> sqlite3.Connection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if len(self._readers) < self._size:
+                connection = self._open(read_only=True)
+                self._readers.append(connection)
+                return connection
+        return self._idle.get()
+
+    def _open(self, read_only: bool) -> sqlite3.Connection:
+        if read_only:
+            uri = f"{Path(self._db_path).resolve().as_uri()}?mode=ro"
+            connection = sqlite3.connect(
+                uri,
+                uri=True,
+                check_same_thread=False,
+                cached_statements=_STATEMENT_CACHE,
+            )
+            connection.execute(f"PRAGMA mmap_size = {_MMAP_SIZE}")
+        else:
+            connection = sqlite3.connect(
+                self._db_path,
+                check_same_thread=False,
+                cached_statements=_STATEMENT_CACHE,
+            )
+        self._configure(connection)
+        return connection
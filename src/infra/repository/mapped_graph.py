@@ -0,0 +1,184 @@
+import json
+from bisect import bisect_left
+from collections.abc import Collection, Sequence
+from fnmatch import fnmatchcase
+from pathlib import Path
+
+import numpy as np
+
+from src.domain.model.bus import Bus
+from src.domain.model.edge import Edge
+from src.domain.model.trace_result import TraceResult
+from src.infra.export.npy_bundle import load_npy_bundle
+from src.infra.repository.beam_path_search import BeamPathSearch, FanoutSource
+from src.infra.repository.search_deadline import SearchDeadline
+from src.infra.repository.through_path_search import ThroughPathSearch
+
+# CSR index per direction: edges of node i are order[offsets[i]:offsets[i+1]].
+_DIRECTIONS = {"fanout": "src", "fanin": "dst"}
+_GLOB_WILDCARDS = "*?["
+_SOURCE_STAMP = "source.json"
+
+# File path -> [mtime in ns, size] of every file of the exported database.
+SourceStamp = dict[str, list[int]]
+
+
+def build_adjacency_index(directory: Path, source: SourceStamp | None = None) -> None:
+    """
+    Writes fan-out and fan-in CSR indexes next to an exported .npy bundle,
+    and last the stamp of the database it was exported from, if given.
+    """
+    bundle = load_npy_bundle(directory)
+    node_count = len(bundle.name_offsets) - 1
+    for direction, column in _DIRECTIONS.items():
+        ids = getattr(bundle, column)
+        order_type = np.int32 if len(ids) <= np.iinfo(np.int32).max else np.int64
+        offsets = np.zeros(node_count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(ids, minlength=node_count), out=offsets[1:])
+        np.save(directory / f"{direction}_offsets.npy", offsets)
+        order = np.argsort(ids, kind="stable").astype(order_type)
+        np.save(directory / f"{direction}_order.npy", order)
+    if source is not None:
+        (directory / _SOURCE_STAMP).write_text(json.dumps(source))
+
+
+def has_adjacency_index(directory: Path, source: SourceStamp | None = None) -> bool:
+    """With source, the index must also have been built from that same state."""
+    complete = all(
+        (directory / f"{direction}_{part}.npy").exists()
+        for direction in _DIRECTIONS
+        for part in ("offsets", "order")
+    )
+    if not complete or source is None:
+        return complete
+    stamp_path = directory / _SOURCE_STAMP
+    return stamp_path.exists() and json.loads(stamp_path.read_text()) == source
+
+
+class MappedGraph:
+    """
+    Path queries over an exported .npy bundle and its adjacency index, all
+    opened with mmap_mode="r". Nothing is copied into the process: worker
+    processes that open the same directory share one copy of the graph
+    through the page cache, so memory does not grow with their number.
+    Node IDs follow name order, which makes a name lookup a binary search.
+    Buses are not part of the bundle; bus names do not expand here.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self._bundle = load_npy_bundle(directory)
+        self._node_count = len(self._bundle.name_offsets) - 1
+        self._index = {
+            direction: tuple(
+                np.load(directory / f"{direction}_{part}.npy", mmap_mode="r")
+                for part in ("offsets", "order")
+            )
+            for direction in _DIRECTIONS
+        }
+
+    def find_nodes(self, pattern: str, limit: int | None = None) -> tuple[str, ...]:
+        """Scans the name range sharing the pattern's literal prefix."""
+        cut = min(
+            (pattern.find(c) for c in _GLOB_WILDCARDS if c in pattern), default=-1
+        )
+        prefix = (pattern if cut == -1 else pattern[:cut]).encode("utf-8")
+        matches: list[str] = []
+        node_id = bisect_left(range(self._node_count), prefix, key=self._raw_name)
+        while node_id < self._node_count and len(matches) != limit:
+            raw = self._raw_name(node_id)
+            if not raw.startswith(prefix):
+                break
+            if fnmatchcase(name := raw.decode("utf-8"), pattern):
+                matches.append(name)
+            node_id += 1
+        return tuple(matches)
+
+    def find_bus(self, name: str) -> Bus | None:
+        return None
+
+    def find_max_delay_path(
+        self,
+        start_node: str,
+        end_node: str | None = None,
+        max_depth: int = 100,
+        beam_width: int | None = None,
+        timeout: float | None = None,
+    ) -> TraceResult:
+        end_nodes = None if end_node is None else (end_node,)
+        return self.find_max_delay_path_from_any(
+            (start_node,), end_nodes, max_depth, beam_width, timeout
+        )
+
+    def find_max_delay_path_from_any(
+        self,
+        start_nodes: Collection[str],
+        end_nodes: Collection[str] | None = None,
+        max_depth: int = 100,
+        beam_width: int | None = None,
+        timeout: float | None = None,
+    ) -> TraceResult:
+        search = BeamPathSearch(
+            self._adjacency("fanout"), beam_width, SearchDeadline(timeout)
+        )
+        return search.run_from_any(start_nodes, end_nodes, max_depth)
+
+    def find_max_delay_path_through(
+        self,
+        start_node: str,
+        through: Sequence[str],
+        end_node: str | None = None,
+        timeout: float | None = None,
+    ) -> TraceResult:
+        end_nodes = None if end_node is None else (end_node,)
+        return self.find_max_delay_path_through_from_any(
+            (start_node,), through, end_nodes, timeout
+        )
+
+    def find_max_delay_path_through_from_any(
+        self,
+        start_nodes: Collection[str],
+        through: Sequence[str],
+        end_nodes: Collection[str] | None = None,
+        timeout: float | None = None,
+    ) -> TraceResult:
+        search = ThroughPathSearch(
+            self._adjacency("fanout"),
+            self._adjacency("fanin"),
+            SearchDeadline(timeout),
+        )
+        return search.run_from_any(start_nodes, through, end_nodes)
+
+    def _adjacency(self, direction: str) -> FanoutSource:
+        offsets, order = self._index[direction]
+        bundle = self._bundle
+
+        def fetch(nodes: set[str]) -> dict[str, list[Edge]]:
+            adjacency: dict[str, list[Edge]] = {}
+            for node in nodes:
+                if (node_id := self._node_id(node)) is None:
+                    continue
+                edge_ids = order[offsets[node_id] : offsets[node_id + 1]]
+                adjacency[node] = [
+                    Edge(bundle.name(src), bundle.name(dst), rise, fall)
+                    for src, dst, rise, fall in zip(
+                        bundle.src[edge_ids].tolist(),
+                        bundle.dst[edge_ids].tolist(),
+                        bundle.rise[edge_ids].tolist(),
+                        bundle.fall[edge_ids].tolist(),
+                        strict=True,
+                    )
+                ]
+            return adjacency
+
+        return fetch
+
+    def _node_id(self, name: str) -> int | None:
+        raw = name.encode("utf-8")
+        node_id = bisect_left(range(self._node_count), raw, key=self._raw_name)
+        if node_id < self._node_count and self._raw_name(node_id) == raw:
+            return node_id
+        return None
+
+    def _raw_name(self, node_id: int) -> bytes:
+        start, stop = self._bundle.name_offsets[node_id : node_id + 2]
+        return self._bundle.name_bytes[start:stop].tobytes()
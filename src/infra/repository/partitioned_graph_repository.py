@@ -0,0 +1,398 @@
+import re
+import sqlite3
+import zlib
+from collections.abc import Callable, Collection, Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, closing, contextmanager
+from itertools import chain
+from pathlib import Path
+from typing import Any
+
+from src.domain.model.bus import Bus, BusRow
+from src.domain.model.cell_arc import DelayTemplateRow, InstanceArcRow
+from src.domain.model.edge import Edge, EdgeRow
+from src.domain.model.module_definition import ModuleDefinition
+from src.domain.model.node import Node, NodeIdRow, NodeRow
+from src.domain.model.slack import SlackRow, TimingRow
+from src.domain.model.trace_result import TraceResult
+from src.domain.protocol.graph_repository import GraphRepository
+from src.domain.protocol.progress_observer import ProgressObserver
+from src.infra.repository.beam_path_search import (
+    BeamPathSearch,
+    sqlite_fanin,
+    sqlite_fanout,
+)
+from src.infra.repository.search_deadline import SearchDeadline
+from src.infra.repository.sqlite_columnar_source import (
+    SqliteColumnarSource,
+    cell_arc_edges,
+)
+from src.infra.repository.sqlite_graph_repository import SqliteGraphRepository
+from src.infra.repository.through_path_search import ThroughPathSearch
+
+_RE_TOP_LEVEL = re.compile(r"[/.\[]")
+
+_SQL_CREATE_PARTITIONS: str = (
+    "CREATE TABLE IF NOT EXISTS partitions (count INTEGER NOT NULL)"
+)
+_SQL_RECORD_PARTITIONS: str = "INSERT INTO partitions (count) VALUES (?)"
+
+
+class PartitionedGraphRepository(GraphRepository):
+    """
+    Shards nodes and edges over N SQLite files by the top-level hierarchy of
+    each name ("u_core" for "u_core/u1.A", "u1" for a flat "u1.A").
+    An edge is stored with its source, the only end a fan-out read looks
+    up, so no edge has to be kept outside a partition. The file at db_path
+    is the boundary database: it keeps buses, modules, delay templates and
+    slack. Partitions are written concurrently, one writer thread each;
+    path searches stitch fan-out from each node's own partition.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        partitions: int,
+        observer: ProgressObserver | None = None,
+    ) -> None:
+        self.db_path = db_path
+        self._boundary = SqliteGraphRepository(db_path, observer)
+        self._partitions = tuple(
+            SqliteGraphRepository(partition_path(db_path, index), observer)
+            for index in range(partitions)
+        )
+        self._writers: ThreadPoolExecutor | None = None
+
+    def setup(self) -> None:
+        """Names are routed modulo the count, so it can never change later."""
+        stored = stored_partition_count(self.db_path)
+        if stored is not None and stored != len(self._partitions):
+            raise ValueError(
+                f"{self.db_path} is split into {stored} partitions, "
+                f"not {len(self._partitions)}"
+            )
+        self._boundary.setup()
+        for partition in self._partitions:
+            partition.setup()
+        if stored is None:
+            with closing(sqlite3.connect(self.db_path)) as connection:
+                with connection:
+                    connection.execute(_SQL_CREATE_PARTITIONS)
+                    connection.execute(_SQL_RECORD_PARTITIONS, (len(self._partitions),))
+
+    @contextmanager
+    def bulk_mode(self) -> Iterator[None]:
+        """Keeps the boundary connection open; partition writers own theirs."""
+        with self._boundary.bulk_mode():
+            yield
+
+    def save_nodes_batch(self, nodes: tuple[Node]) -> None:
+        self.save_node_rows([(n.name,) for n in nodes])
+
+    def save_edges_batch(self, edges: tuple[Edge]) -> None:
+        self.save_edge_rows(
+            [(e.src_node, e.dst_node, e.delay_rise, e.delay_fall) for e in edges]
+        )
+
+    def update_edges_delay_batch(self, edges: tuple[Edge, ...]) -> None:
+        self.update_edge_delay_rows(
+            [(e.src_node, e.dst_node, e.delay_rise, e.delay_fall) for e in edges]
+        )
+
+    def save_node_rows(self, rows: Sequence[NodeRow]) -> None:
+        self._fan_out("save_node_rows", self._route(rows, key=0))
+
+    def save_node_id_rows(self, rows: Sequence[NodeIdRow]) -> None:
+        self._fan_out("save_node_id_rows", self._route(rows, key=1))
+
+    def next_node_id(self) -> int:
+        """IDs are unique across partitions, so the next one follows them all."""
+        return max(r.next_node_id() for r in self._all_repositories())
+
+    def save_edge_rows(self, rows: Sequence[EdgeRow]) -> None:
+        self._fan_out("save_edge_rows", self._route(rows, key=0))
+
+    def save_new_edge_rows(self, rows: Sequence[EdgeRow]) -> None:
+        self._fan_out("save_new_edge_rows", self._route(rows, key=0))
+
+    def update_edge_delay_rows(self, rows: Sequence[EdgeRow]) -> None:
+        """Delays match edges.src on the row's dst, so they route by dst."""
+        self._fan_out("update_edge_delay_rows", self._route(rows, key=1))
+
+    def save_delay_template_rows(self, rows: Sequence[DelayTemplateRow]) -> None:
+        """Every database keeps all templates, so its arcs resolve locally."""
+        everywhere = dict.fromkeys(range(len(self._partitions)), rows)
+        self._fan_out("save_delay_template_rows", everywhere, rows)
+
+    def load_delay_template_rows(self) -> list[DelayTemplateRow]:
+        return self._boundary.load_delay_template_rows()
+
+    def save_cell_arc_rows(self, rows: Sequence[InstanceArcRow]) -> None:
+        """An arc joins two pins of one instance, so it never crosses partitions."""
+        self._fan_out("save_cell_arc_rows", self._route(rows, key=0))
+
+    def save_bus_rows(self, rows: Sequence[BusRow]) -> None:
+        self._boundary.save_bus_rows(rows)
+
+    def find_bus(self, name: str) -> Bus | None:
+        return self._boundary.find_bus(name)
+
+    def save_module(self, module: ModuleDefinition) -> None:
+        self._boundary.save_module(module)
+
+    def load_module(self, name: str) -> ModuleDefinition | None:
+        return self._boundary.load_module(name)
+
+    def module_names(self) -> tuple[str, ...]:
+        return self._boundary.module_names()
+
+    def count_edge_sources(self) -> int:
+        return sum(r.count_edge_sources() for r in self._all_repositories())
+
+    def iter_edge_sources(self) -> Iterator[str]:
+        return chain.from_iterable(
+            r.iter_edge_sources() for r in self._all_repositories()
+        )
+
+    def iter_edge_rows(self) -> Iterator[EdgeRow]:
+        return chain.from_iterable(r.iter_edge_rows() for r in self._all_repositories())
+
+    def replace_slack_rows(self, rows: Sequence[TimingRow]) -> None:
+        self._boundary.replace_slack_rows(rows)
+
+    def find_slack_below(
+        self, threshold: float, limit: int | None = None
+    ) -> list[SlackRow]:
+        return self._boundary.find_slack_below(threshold, limit)
+
+    def metric_range(self, metric: str) -> tuple[float, float] | None:
+        ranges = [
+            bounds
+            for r in self._all_repositories()
+            if (bounds := r.metric_range(metric)) is not None
+        ]
+        if not ranges:
+            return None
+        return min(low for low, _ in ranges), max(high for _, high in ranges)
+
+    def iter_metric_chunks(
+        self, metric: str, chunk_rows: int
+    ) -> Iterator[list[tuple[str, float]]]:
+        return chain.from_iterable(
+            r.iter_metric_chunks(metric, chunk_rows) for r in self._all_repositories()
+        )
+
+    @contextmanager
+    def columnar_snapshot(self) -> Iterator[SqliteColumnarSource]:
+        """Attaches every partition to one connection so IDs span all files."""
+        with closing(_connect_read_only(self.db_path)) as connection:
+            schemas = ["main"]
+            for index, partition in enumerate(self._partitions):
+                connection.execute(
+                    f"ATTACH DATABASE ? AS p{index}",
+                    (_read_only_uri(partition.db_path),),
+                )
+                schemas.append(f"p{index}")
+            source = SqliteColumnarSource(
+                connection,
+                edge_tables=[
+                    table
+                    for schema in schemas
+                    for table in (f"{schema}.edges", cell_arc_edges(schema))
+                ],
+                node_tables=[f"{schema}.nodes" for schema in schemas],
+            )
+            yield source
+
+    def cluster_edges(self) -> None:
+        self._in_parallel(lambda r: r.cluster_edges())
+
+    def build_node_lookup(self) -> None:
+        self._in_parallel(lambda r: r.build_node_lookup())
+
+    def find_nodes(self, pattern: str, limit: int | None = None) -> tuple[str, ...]:
+        names = sorted(
+            {n for r in self._all_repositories() for n in r.find_nodes(pattern, limit)}
+        )
+        return tuple(names if limit is None else names[:limit])
+
+    def find_max_delay_path(
+        self,
+        start_node: str,
+        end_node: str | None = None,
+        max_depth: int = 100,
+        beam_width: int | None = None,
+        timeout: float | None = None,
+    ) -> TraceResult:
+        end_nodes = None if end_node is None else (end_node,)
+        return self.find_max_delay_path_from_any(
+            (start_node,), end_nodes, max_depth, beam_width, timeout
+        )
+
+    def find_max_delay_path_from_any(
+        self,
+        start_nodes: Collection[str],
+        end_nodes: Collection[str] | None = None,
+        max_depth: int = 100,
+        beam_width: int | None = None,
+        timeout: float | None = None,
+    ) -> TraceResult:
+        """
+        Searches level by level, reading each node's fan-out from its own
+        partition. Exact on acyclic graphs unless
+        beam_width bounds the frontier.
+        """
+        with ExitStack() as stack:
+            connections = [
+                stack.enter_context(r.read_connection()) for r in self._partitions
+            ]
+            fanout = self._stitched_fanout(connections)
+            search = BeamPathSearch(fanout, beam_width, SearchDeadline(timeout))
+            return search.run_from_any(start_nodes, end_nodes, max_depth)
+
+    def find_max_delay_path_through(
+        self,
+        start_node: str,
+        through: Sequence[str],
+        end_node: str | None = None,
+        timeout: float | None = None,
+    ) -> TraceResult:
+        end_nodes = None if end_node is None else (end_node,)
+        return self.find_max_delay_path_through_from_any(
+            (start_node,), through, end_nodes, timeout
+        )
+
+    def find_max_delay_path_through_from_any(
+        self,
+        start_nodes: Collection[str],
+        through: Sequence[str],
+        end_nodes: Collection[str] | None = None,
+        timeout: float | None = None,
+    ) -> TraceResult:
+        """
+        Fan-out is stitched as for find_max_delay_path. Fan-in cannot be routed
+        by name (edges live with their source), so it reads every file.
+        """
+        with ExitStack() as stack:
+            connections = [
+                stack.enter_context(r.read_connection()) for r in self._partitions
+            ]
+            search = ThroughPathSearch(
+                self._stitched_fanout(connections),
+                _merged_fanin(connections),
+                SearchDeadline(timeout),
+            )
+            return search.run_from_any(start_nodes, through, end_nodes)
+
+    def _stitched_fanout(
+        self, connections: list[sqlite3.Connection]
+    ) -> Callable[[set[str]], dict[str, list[Edge]]]:
+        partition_sources = [sqlite_fanout(c) for c in connections]
+
+        def fetch(nodes: set[str]) -> dict[str, list[Edge]]:
+            fanout: dict[str, list[Edge]] = {}
+            owned: dict[int, set[str]] = {}
+            for node in nodes:
+                owned.setdefault(self._index(node), set()).add(node)
+            for index, names in owned.items():
+                for src, edges in partition_sources[index](names).items():
+                    fanout.setdefault(src, []).extend(edges)
+            return fanout
+
+        return fetch
+
+    def _index(self, name: str) -> int:
+        top_level = _RE_TOP_LEVEL.split(name, maxsplit=1)[0]
+        return zlib.crc32(top_level.encode()) % len(self._partitions)
+
+    def _route(self, rows: Sequence[Any], key: int) -> dict[int, list[Any]]:
+        routed: dict[int, list[Any]] = {}
+        for row in rows:
+            routed.setdefault(self._index(row[key]), []).append(row)
+        return routed
+
+    def _fan_out(
+        self,
+        method: str,
+        routed: Mapping[int, Sequence[Any]],
+        boundary_rows: Sequence[Any] = (),
+    ) -> None:
+        """Writes every partition's share on its own thread, boundary rows here."""
+        futures = [
+            self._executor().submit(getattr(self._partitions[index], method), rows)
+            for index, rows in routed.items()
+        ]
+        if boundary_rows:
+            getattr(self._boundary, method)(boundary_rows)
+        for future in futures:
+            future.result()
+
+    def _in_parallel(self, action: Callable[[SqliteGraphRepository], None]) -> None:
+        futures = [self._executor().submit(action, p) for p in self._partitions]
+        action(self._boundary)
+        for future in futures:
+            future.result()
+
+    def _executor(self) -> ThreadPoolExecutor:
+        if self._writers is None:
+            self._writers = ThreadPoolExecutor(max_workers=len(self._partitions))
+        return self._writers
+
+    def _all_repositories(self) -> tuple[SqliteGraphRepository, ...]:
+        return (*self._partitions, self._boundary)
+
+
+def _merged_fanin(
+    connections: list[sqlite3.Connection],
+) -> Callable[[set[str]], dict[str, list[Edge]]]:
+    sources = [sqlite_fanin(c) for c in connections]
+
+    def fetch(nodes: set[str]) -> dict[str, list[Edge]]:
+        fanin: dict[str, list[Edge]] = {}
+        for source in sources:
+            for dst, edges in source(nodes).items():
+                fanin.setdefault(dst, []).extend(edges)
+        return fanin
+
+    return fetch
+
+
+def _read_only_uri(db_path: str) -> str:
+    return f"{Path(db_path).resolve().as_uri()}?mode=ro"
+
+
+def _connect_read_only(db_path: str) -> sqlite3.Connection:
+    return sqlite3.connect(_read_only_uri(db_path), uri=True)
+
+
+def partition_path(db_path: str, index: int) -> str:
+    """gls.db -> gls.p0.db, gls.p1.db, ..."""
+    path = Path(db_path)
+    return str(path.with_name(f"{path.stem}.p{index}{path.suffix}"))
+
+
+def stored_partition_count(db_path: str) -> int | None:
+    """Partition count recorded by setup(), or None for a single-file database."""
+    if not Path(db_path).exists():
+        return None
+    with closing(sqlite3.connect(db_path)) as connection:
+        try:
+            row = connection.execute("SELECT count FROM partitions").fetchone()
+        except sqlite3.OperationalError:
+            return None
+    return row[0] if row else None
+
+
+def database_stamp(db_path: str) -> dict[str, list[int]]:
+    """
+    [mtime in ns, size] of db_path, of its partition files and of their
+    write-ahead logs: any write to the database changes one of them. An
+    empty log holds no changes, and a reader may leave one behind.
+    """
+    count = stored_partition_count(db_path) or 0
+    stamp: dict[str, list[int]] = {}
+    for path in (db_path, *(partition_path(db_path, i) for i in range(count))):
+        for file in (Path(path), Path(f"{path}-wal")):
+            if file.exists() and (stat := file.stat()).st_size:
+                stamp[str(file.resolve())] = [stat.st_mtime_ns, stat.st_size]
+    return stamp
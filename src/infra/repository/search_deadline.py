@@ -0,0 +1,15 @@
+import time
+
+
+class SearchDeadline:
+    """Wall-clock budget shared by the cooperative checks of a path search."""
+
+    def __init__(self, timeout: float | None = None) -> None:
+        self._started_at = time.monotonic()
+        self._expires_at = None if timeout is None else self._started_at + timeout
+
+    def expired(self) -> bool:
+        return self._expires_at is not None and time.monotonic() >= self._expires_at
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self._started_at
@@ -0,0 +1,89 @@
+import sqlite3
+from collections.abc import Iterator, Sequence
+
+from src.domain.model.edge import EdgeIdRow
+
+
+class SqliteColumnarSource:
+    """
+    Numbers every node and pin name densely in a temporary table, so edges
+    can be streamed as integer ID pairs by a join instead of a Python map.
+    IDs follow name order. edge_tables and node_tables name the tables to
+    read (several for a partitioned database attached to one connection);
+    an entry may also be a parenthesized subquery such as cell_arc_edges().
+    close() drops the temporary table, since pooled connections are reused.
+    """
+
+    def __init__(
+        self,
+        connection: sqlite3.Connection,
+        edge_tables: Sequence[str] = ("edges",),
+        node_tables: Sequence[str] = ("nodes",),
+    ) -> None:
+        self._connection = connection
+        self._edges = " UNION ALL ".join(
+            f"SELECT src, dst, delay_rise, delay_fall FROM {t}" for t in edge_tables
+        )
+        names = " UNION ".join(
+            [
+                f"SELECT src AS name FROM {t} UNION SELECT dst FROM {t}"
+                for t in edge_tables
+            ]
+            + [f"SELECT name FROM {t}" for t in node_tables]
+        )
+        with connection:
+            connection.execute(
+                "CREATE TEMPORARY TABLE columnar_ids "
+                "(id INTEGER PRIMARY KEY, name TEXT UNIQUE NOT NULL)"
+            )
+            connection.execute(
+                f"INSERT INTO columnar_ids (name) SELECT name FROM ({names}) "
+                "ORDER BY name"
+            )
+
+    @property
+    def node_count(self) -> int:
+        return self._scalar("SELECT COUNT(*) FROM columnar_ids")
+
+    @property
+    def edge_count(self) -> int:
+        return self._scalar(f"SELECT COUNT(*) FROM ({self._edges})")
+
+    @property
+    def name_bytes(self) -> int:
+        return self._scalar(
+            "SELECT COALESCE(SUM(LENGTH(CAST(name AS BLOB))), 0) FROM columnar_ids"
+        )
+
+    def iter_names(self, chunk_rows: int) -> Iterator[list[str]]:
+        cursor = self._connection.execute("SELECT name FROM columnar_ids ORDER BY id")
+        while chunk := cursor.fetchmany(chunk_rows):
+            yield [name for (name,) in chunk]
+
+    def iter_edges(self, chunk_rows: int) -> Iterator[list[EdgeIdRow]]:
+        cursor = self._connection.execute(
+            "SELECT s.id - 1, d.id - 1, "
+            "COALESCE(e.delay_rise, 0.0), COALESCE(e.delay_fall, 0.0) "
+            f"FROM ({self._edges}) e "
+            "JOIN columnar_ids s ON s.name = e.src "
+            "JOIN columnar_ids d ON d.name = e.dst"
+        )
+        while chunk := cursor.fetchmany(chunk_rows):
+            yield chunk
+
+    def close(self) -> None:
+        self._connection.execute("DROP TABLE IF EXISTS temp.columnar_ids")
+
+    def _scalar(self, sql: str) -> int:
+        return int(self._connection.execute(sql).fetchone()[0])
+
+
+def cell_arc_edges(schema: str = "main") -> str:
+    """A subquery reading the cell arcs of schema as an edges table."""
+    return (
+        "(SELECT a.instance || '.' || t.from_pin AS src, "
+        "a.instance || '.' || t.to_pin AS dst, "
+        "t.rise AS delay_rise, t.fall AS delay_fall "
+        f"FROM {schema}.cell_arcs a JOIN {schema}.delay_templates t "
+        "ON t.id = a.template_id)"
+    )
@@ -1,11 +1,34 @@
+import re
 import sqlite3
+import time
+from collections.abc import Collection, Iterator, Sequence
 from contextlib import closing, contextmanager
 from typing import Any
 
-from src.domain.model.edge import Edge
-from src.domain.model.node import Node
+from src.domain.model.bus import Bus, BusRow
+from src.domain.model.cell_arc import DelayTemplateRow, InstanceArcRow, split_pin
+from src.domain.model.edge import Edge, EdgeRow
+from src.domain.model.module_definition import ModuleDefinition
+from src.domain.model.node import Node, NodeIdRow, NodeRow
+from src.domain.model.slack import SlackRow, TimingRow
+from src.domain.model.trace_result import TraceResult
 from src.domain.protocol.graph_repository import GraphRepository
+from src.domain.protocol.progress_observer import ProgressObserver
+from src.infra.repository.beam_path_search import (
+    BeamPathSearch,
+    sqlite_fanin,
+    sqlite_fanout,
+)
+from src.infra.repository.connection_pool import ConnectionPool
+from src.infra.repository.search_deadline import SearchDeadline
+from src.infra.repository.sqlite_columnar_source import (
+    SqliteColumnarSource,
+    cell_arc_edges,
+)
+from src.infra.repository.streaming_path_search import StreamingPathSearch
+from src.infra.repository.through_path_search import ThroughPathSearch
 
+_EDGE_COLUMNS = "src TEXT NOT NULL, dst TEXT NOT NULL, delay_rise REAL, delay_fall REAL"
 _SQLS_SETUP: tuple[str, ...] = (
     """
     CREATE TABLE IF NOT EXISTS nodes (
@@ -13,28 +36,200 @@ _SQLS_SETUP: tuple[str, ...] = (
         name TEXT UNIQUE NOT NULL
     )
     """,
+    f"CREATE TABLE IF NOT EXISTS edges ({_EDGE_COLUMNS})",
+    "CREATE INDEX IF NOT EXISTS idx_edges_src_dst ON edges(src, dst)",
+    "CREATE INDEX IF NOT EXISTS idx_edges_dst ON edges(dst)",
+    """
+    CREATE TABLE IF NOT EXISTS node_lookup (
+        name TEXT PRIMARY KEY,
+        reversed_name TEXT NOT NULL
+    ) WITHOUT ROWID
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_node_lookup_reversed ON node_lookup(reversed_name)",
+    """
+    CREATE TABLE IF NOT EXISTS buses (
+        id INTEGER PRIMARY KEY,
+        name TEXT UNIQUE NOT NULL,
+        msb INTEGER NOT NULL,
+        lsb INTEGER NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS modules (
+        id INTEGER PRIMARY KEY,
+        name TEXT UNIQUE NOT NULL
+    )
+    """,
     """
-    CREATE TABLE IF NOT EXISTS edges (
+    CREATE TABLE IF NOT EXISTS module_edges (
+        module_id INTEGER NOT NULL,
         src TEXT NOT NULL,
-        dst TEXT NOT NULL,
-        delay_rise REAL,
-        delay_fall REAL
+        dst TEXT NOT NULL
     )
     """,
-    "CREATE INDEX IF NOT EXISTS idx_edges_src_dst ON edges(src, dst)",
+    "CREATE INDEX IF NOT EXISTS idx_module_edges ON module_edges(module_id)",
+    """
+    CREATE TABLE IF NOT EXISTS module_instances (
+        module_id INTEGER NOT NULL,
+        name TEXT NOT NULL,
+        cell TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_module_instances ON module_instances(module_id)",
+    """
+    CREATE TABLE IF NOT EXISTS slack (
+        node TEXT PRIMARY KEY,
+        arrival REAL NOT NULL,
+        required REAL NOT NULL,
+        slack REAL NOT NULL,
+        depth INTEGER NOT NULL,
+        endpoint INTEGER NOT NULL
+    ) WITHOUT ROWID
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_slack ON slack(slack)",
+    """
+    CREATE TABLE IF NOT EXISTS delay_templates (
+        id INTEGER PRIMARY KEY,
+        cell TEXT NOT NULL,
+        from_pin TEXT NOT NULL,
+        to_pin TEXT NOT NULL,
+        rise REAL NOT NULL,
+        fall REAL NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS cell_arcs (
+        instance TEXT NOT NULL,
+        template_id INTEGER NOT NULL
+    )
+    """,
+    "CREATE UNIQUE INDEX IF NOT EXISTS idx_cell_arcs "
+    "ON cell_arcs(instance, template_id)",
+)
+
+# Rewrites edges in (src, dst) order, so the rowid heap is clustered on the
+# source, and makes idx_edges_src_dst cover the delays: a fan-out lookup is
+# answered from one contiguous index range without visiting the heap. Edge
+# rowids stay (the path CTE names edges by them), so WITHOUT ROWID is not
+# an option. The copy happens in one transaction; a leftover staging table
+# from an interrupted run is dropped first.
+_SQLS_CLUSTER_EDGES: tuple[str, ...] = (
+    "DROP TABLE IF EXISTS edges_clustered",
+    f"CREATE TABLE edges_clustered ({_EDGE_COLUMNS})",
+    "INSERT INTO edges_clustered (src, dst, delay_rise, delay_fall) "
+    "SELECT src, dst, delay_rise, delay_fall FROM edges ORDER BY src, dst",
+    "DROP TABLE edges",
+    "ALTER TABLE edges_clustered RENAME TO edges",
+    "CREATE INDEX idx_edges_src_dst ON edges(src, dst, delay_rise, delay_fall)",
+    "CREATE INDEX idx_edges_dst ON edges(dst)",
 )
 
 _SQL_INSERT_NODE: str = "INSERT OR IGNORE INTO nodes (name) VALUES (?)"
+_SQL_INSERT_NODE_ID: str = "INSERT OR IGNORE INTO nodes (id, name) VALUES (?, ?)"
+# An upsert rather than INSERT OR REPLACE, which would give the bus a new id
+_SQL_INSERT_BUS: str = (
+    "INSERT INTO buses (name, msb, lsb) VALUES (?, ?, ?) "
+    "ON CONFLICT(name) DO UPDATE SET msb = excluded.msb, lsb = excluded.lsb"
+)
 _SQL_INSERT_EDGE: str = """
     INSERT INTO edges (src, dst, delay_rise, delay_fall)
     VALUES (?, ?, ?, ?)
 """
+# Probes idx_edges_src_dst, so an edge written again keeps its stored delays
+_SQL_INSERT_NEW_EDGE: str = """
+    INSERT INTO edges (src, dst, delay_rise, delay_fall)
+    SELECT ?1, ?2, ?3, ?4
+    WHERE NOT EXISTS (SELECT 1 FROM edges WHERE src = ?1 AND dst = ?2)
+"""
+_SQL_INSERT_DELAY_TEMPLATE: str = (
+    "INSERT OR IGNORE INTO delay_templates (id, cell, from_pin, to_pin, rise, fall) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+_SQL_INSERT_CELL_ARC: str = (
+    "INSERT OR IGNORE INTO cell_arcs (instance, template_id) VALUES (?, ?)"
+)
+_SQL_BUILD_NODE_LOOKUP: str = """
+    INSERT OR IGNORE INTO node_lookup (name, reversed_name)
+    SELECT name, reverse_text(name) FROM (
+        SELECT name FROM nodes
+        UNION SELECT src FROM edges
+        UNION SELECT dst FROM edges
+    )
+"""
+# Cell arcs join the search as "instance.from_pin -> instance.to_pin" steps;
+# their IDs are negated arc rowids so one list can name both kinds of edge.
+_SQL_RECURSIVE_PATHS: str = """
+    WITH RECURSIVE paths(current_node, path_str, edge_ids, total_delay, depth) AS (
+        SELECT dst, src || ',' || dst, CAST(rowid AS TEXT),
+               MAX(delay_rise, delay_fall), 1
+        FROM edges WHERE src = ?1
+        UNION ALL
+        SELECT a.instance || '.' || t.to_pin,
+               ?1 || ',' || a.instance || '.' || t.to_pin,
+               CAST(-a.rowid AS TEXT), MAX(t.rise, t.fall), 1
+        FROM cell_arcs a JOIN delay_templates t ON t.id = a.template_id
+        WHERE a.instance = instance_of(?1) AND a.instance || '.' || t.from_pin = ?1
+        UNION ALL
+        SELECT e.dst, p.path_str || ',' || e.dst, p.edge_ids || ',' || e.rowid,
+               p.total_delay + MAX(e.delay_rise, e.delay_fall), p.depth + 1
+        FROM edges e JOIN paths p ON e.src = p.current_node
+        WHERE p.depth < ?2 AND instr(p.path_str, e.dst) = 0
+        UNION ALL
+        SELECT a.instance || '.' || t.to_pin,
+               p.path_str || ',' || a.instance || '.' || t.to_pin,
+               p.edge_ids || ',' || -a.rowid,
+               p.total_delay + MAX(t.rise, t.fall), p.depth + 1
+        FROM paths p
+        JOIN cell_arcs a ON a.instance = instance_of(p.current_node)
+        JOIN delay_templates t ON t.id = a.template_id
+        WHERE a.instance || '.' || t.from_pin = p.current_node
+          AND p.depth < ?2 AND instr(p.path_str, a.instance || '.' || t.to_pin) = 0
+    )
+"""
+_SQL_EDGES_BY_IDS: str = """
+    SELECT COALESCE(e.src, a.instance || '.' || t.from_pin),
+           COALESCE(e.dst, a.instance || '.' || t.to_pin),
+           COALESCE(e.delay_rise, t.rise), COALESCE(e.delay_fall, t.fall)
+    FROM json_each('[' || ? || ']') AS hop
+    LEFT JOIN edges e ON hop.value > 0 AND e.rowid = hop.value
+    LEFT JOIN cell_arcs a ON hop.value < 0 AND a.rowid = -hop.value
+    LEFT JOIN delay_templates t ON t.id = a.template_id
+    ORDER BY hop.key
+"""
+# (name, value) rows per metric summarized by the `stats` command
+_SQL_METRICS: dict[str, str] = {
+    "edge_delay": (
+        "SELECT src AS name, "
+        "MAX(COALESCE(delay_rise, 0.0), COALESCE(delay_fall, 0.0)) AS value "
+        "FROM edges"
+    ),
+    "arrival": "SELECT node AS name, arrival AS value FROM slack WHERE endpoint",
+    "depth": "SELECT node AS name, depth AS value FROM slack WHERE endpoint",
+}
+_GLOB_WILDCARDS: str = "*?["
+_RE_GLOB_TOKEN = re.compile(r"\[[^\]]*\]|.", re.DOTALL)
+# SDF rows are (src, dst, rise, fall); the SDF destination pin is the DB source
+_SQL_STAGE_DELAY: str = (
+    "INSERT OR REPLACE INTO batch_updates (node, rise, fall) VALUES (?2, ?3, ?4)"
+)
 
 
 class SqliteGraphRepository(GraphRepository):
-    def __init__(self, db_path: str) -> None:
+    def __init__(self, db_path: str, observer: ProgressObserver | None = None) -> None:
         self.db_path = db_path
+        self._observer = observer
         self._active_connection: sqlite3.Connection | None = None
+        self._pool = ConnectionPool(db_path, _configure)
+
+    def close(self) -> None:
+        """Closes the pooled connections; the repository reopens them on demand."""
+        self._pool.close()
+
+    @contextmanager
+    def read_connection(self) -> Iterator[sqlite3.Connection]:
+        """Lends a pooled read-only connection for queries."""
+        with self._pool.reader() as connection:
+            yield connection
 
     def setup(self) -> None:
         """Initialize DB schema with performance tuning."""
@@ -58,121 +253,425 @@ class SqliteGraphRepository(GraphRepository):
                 self._active_connection.close()
                 self._active_connection = None
 
-    def _get_connection(self) -> sqlite3.Connection:
-        """Returns active connection or opens a new temporary one."""
+    @contextmanager
+    def _write_connection(self) -> Iterator[sqlite3.Connection]:
+        """Yields the bulk_mode connection, or the pool's shared writer."""
         if self._active_connection:
-            return self._active_connection
-        return self._connect()
+            yield self._active_connection
+            return
+        with self._pool.writer() as connection:
+            yield connection
 
     def save_nodes_batch(self, nodes: tuple[Node]) -> None:
-        data = [(n.name,) for n in nodes]
-        self._executemany(_SQL_INSERT_NODE, data)
+        self.save_node_rows([(n.name,) for n in nodes])
 
     def save_edges_batch(self, edges: tuple[Edge]) -> None:
-        data = [(e.src_node, e.dst_node, e.delay_rise, e.delay_fall) for e in edges]
-        self._executemany(_SQL_INSERT_EDGE, data)
+        self.save_edge_rows(
+            [(e.src_node, e.dst_node, e.delay_rise, e.delay_fall) for e in edges]
+        )
 
     def update_edges_delay_batch(self, edges: tuple[Edge, ...]) -> None:
-        if not edges:
-            return
+        self.update_edge_delay_rows(
+            [(e.src_node, e.dst_node, e.delay_rise, e.delay_fall) for e in edges]
+        )
 
-        data = [(e.dst_node, e.delay_rise, e.delay_fall) for e in edges]
-        connection = self._get_connection()
-        should_close = self._active_connection is None
+    def save_node_rows(self, rows: Sequence[NodeRow]) -> None:
+        self._executemany(_SQL_INSERT_NODE, rows, "sql:insert_nodes")
 
-        try:
+    def save_node_id_rows(self, rows: Sequence[NodeIdRow]) -> None:
+        self._executemany(_SQL_INSERT_NODE_ID, rows, "sql:insert_nodes")
+
+    def next_node_id(self) -> int:
+        with self._write_connection() as connection:
+            row = connection.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM nodes")
+            return int(row.fetchone()[0])
+
+    def save_edge_rows(self, rows: Sequence[EdgeRow]) -> None:
+        self._executemany(_SQL_INSERT_EDGE, rows, "sql:insert_edges")
+
+    def save_new_edge_rows(self, rows: Sequence[EdgeRow]) -> None:
+        self._executemany(_SQL_INSERT_NEW_EDGE, rows, "sql:insert_new_edges")
+
+    def update_edge_delay_rows(self, rows: Sequence[EdgeRow]) -> None:
+        if not rows:
+            return
+
+        with self._write_connection() as connection:
             with connection:
                 connection.execute(
                     "CREATE TEMPORARY TABLE IF NOT EXISTS batch_updates "
                     "(node TEXT PRIMARY KEY, rise REAL, fall REAL)"
                 )
+                with self._timed("sql:stage_delays", len(rows)):
+                    connection.executemany(_SQL_STAGE_DELAY, rows)
+                with self._timed("sql:update_delays", len(rows)):
+                    connection.execute("""
+                        UPDATE edges
+                        SET delay_rise = batch_updates.rise,
+                            delay_fall = batch_updates.fall
+                        FROM batch_updates
+                        WHERE edges.src = batch_updates.node
+                    """)
+                    connection.execute("DELETE FROM batch_updates")
+                self._commit(connection)
+
+    def save_delay_template_rows(self, rows: Sequence[DelayTemplateRow]) -> None:
+        self._executemany(
+            _SQL_INSERT_DELAY_TEMPLATE, rows, "sql:insert_delay_templates"
+        )
+
+    def load_delay_template_rows(self) -> list[DelayTemplateRow]:
+        with self._pool.reader() as connection:
+            return connection.execute(
+                "SELECT id, cell, from_pin, to_pin, rise, fall FROM delay_templates"
+            ).fetchall()
+
+    def save_cell_arc_rows(self, rows: Sequence[InstanceArcRow]) -> None:
+        self._executemany(_SQL_INSERT_CELL_ARC, rows, "sql:insert_cell_arcs")
+
+    def save_bus_rows(self, rows: Sequence[BusRow]) -> None:
+        self._executemany(_SQL_INSERT_BUS, rows, "sql:insert_buses")
+
+    def find_bus(self, name: str) -> Bus | None:
+        with self._pool.reader() as connection:
+            row = connection.execute(
+                "SELECT name, msb, lsb FROM buses WHERE name = ?", (name,)
+            ).fetchone()
+        return Bus(*row) if row else None
+
+    def save_module(self, module: ModuleDefinition) -> None:
+        """Stores one module definition, replacing an earlier one of that name."""
+        with self._write_connection() as connection:
+            with connection, self._timed("sql:save_module", len(module.edges)):
+                cursor = connection.execute(
+                    "INSERT INTO modules (name) VALUES (?) "
+                    "ON CONFLICT(name) DO UPDATE SET name = excluded.name "
+                    "RETURNING id",
+                    (module.name,),
+                )
+                module_id = cursor.fetchone()[0]
+                for table in ("module_edges", "module_instances"):
+                    connection.execute(
+                        f"DELETE FROM {table} WHERE module_id = ?", (module_id,)
+                    )
                 connection.executemany(
-                    "INSERT OR REPLACE INTO batch_updates (node, rise, fall) VALUES (?, ?, ?)",
-                    data,
+                    "INSERT INTO module_edges (module_id, src, dst) VALUES (?, ?, ?)",
+                    ((module_id, src, dst) for src, dst, _, _ in module.edges),
                 )
-                connection.execute("""
-                    UPDATE edges
-                    SET delay_rise = batch_updates.rise,
-                        delay_fall = batch_updates.fall
-                    FROM batch_updates
-                    WHERE edges.src = batch_updates.node
-                """)
-                connection.execute("DELETE FROM batch_updates")
-        finally:
-            if should_close:
-                connection.close()
+                connection.executemany(
+                    "INSERT INTO module_instances (module_id, name, cell) "
+                    "VALUES (?, ?, ?)",
+                    ((module_id, name, cell) for name, cell in module.instances),
+                )
+                self._commit(connection)
+
+    def load_module(self, name: str) -> ModuleDefinition | None:
+        with self._pool.reader() as connection:
+            row = connection.execute(
+                "SELECT id FROM modules WHERE name = ?", (name,)
+            ).fetchone()
+            if row is None:
+                return None
+            edges = connection.execute(
+                "SELECT src, dst, 0.0, 0.0 FROM module_edges WHERE module_id = ? "
+                "ORDER BY rowid",
+                row,
+            ).fetchall()
+            instances = connection.execute(
+                "SELECT name, cell FROM module_instances WHERE module_id = ? "
+                "ORDER BY rowid",
+                row,
+            ).fetchall()
+        return ModuleDefinition(name, tuple(edges), tuple(instances))
+
+    def module_names(self) -> tuple[str, ...]:
+        with self._pool.reader() as connection:
+            rows = connection.execute("SELECT name FROM modules ORDER BY name")
+            return tuple(row[0] for row in rows)
+
+    def count_edge_sources(self) -> int:
+        with self._pool.reader() as connection:
+            return int(
+                connection.execute("SELECT COUNT(DISTINCT src) FROM edges").fetchone()[
+                    0
+                ]
+            )
+
+    def iter_edge_sources(self) -> Iterator[str]:
+        """Streams distinct edges.src values, the key SDF delays are matched on."""
+        with self._pool.reader() as connection:
+            for (src,) in connection.execute("SELECT DISTINCT src FROM edges"):
+                yield src
+
+    def iter_edge_rows(self) -> Iterator[EdgeRow]:
+        """Streams every edge and cell arc; delays not yet annotated read as 0."""
+        sql = (
+            "SELECT src, dst, COALESCE(delay_rise, 0.0), COALESCE(delay_fall, 0.0) "
+            "FROM edges UNION ALL "
+            "SELECT a.instance || '.' || t.from_pin, a.instance || '.' || t.to_pin, "
+            "t.rise, t.fall FROM cell_arcs a JOIN delay_templates t "
+            "ON t.id = a.template_id"
+        )
+        with self._pool.reader() as connection:
+            yield from connection.execute(sql)
+
+    def replace_slack_rows(self, rows: Sequence[TimingRow]) -> None:
+        with self._write_connection() as connection:
+            with connection, self._timed("sql:replace_slack", len(rows)):
+                connection.execute("DELETE FROM slack")
+                connection.executemany(
+                    "INSERT INTO slack (node, arrival, required, slack, depth, "
+                    "endpoint) VALUES (?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self._commit(connection)
+
+    def find_slack_below(
+        self, threshold: float, limit: int | None = None
+    ) -> list[SlackRow]:
+        """Worst-first rows with slack < threshold, a range scan on idx_slack."""
+        sql = (
+            "SELECT node, arrival, required, slack FROM slack WHERE slack < ? "
+            "ORDER BY slack LIMIT ?"
+        )
+        with self._pool.reader() as connection, self._timed("sql:find_slack"):
+            return connection.execute(
+                sql, (threshold, -1 if limit is None else limit)
+            ).fetchall()
+
+    def metric_range(self, metric: str) -> tuple[float, float] | None:
+        sql = f"SELECT MIN(value), MAX(value) FROM ({_SQL_METRICS[metric]})"
+        with self._pool.reader() as connection, self._timed("sql:metric_range"):
+            low, high = connection.execute(sql).fetchone()
+        return None if low is None else (low, high)
+
+    def iter_metric_chunks(
+        self, metric: str, chunk_rows: int
+    ) -> Iterator[list[tuple[str, float]]]:
+        with self._pool.reader() as connection:
+            cursor = connection.execute(_SQL_METRICS[metric])
+            while chunk := cursor.fetchmany(chunk_rows):
+                yield chunk
+
+    @contextmanager
+    def columnar_snapshot(self) -> Iterator[SqliteColumnarSource]:
+        with self._pool.reader() as connection:
+            source = SqliteColumnarSource(
+                connection, edge_tables=("edges", cell_arc_edges())
+            )
+            try:
+                yield source
+            finally:
+                source.close()
+
+    def cluster_edges(self) -> None:
+        with self._write_connection() as connection:
+            with connection, self._timed("sql:cluster_edges"):
+                for sql in _SQLS_CLUSTER_EDGES:
+                    connection.execute(sql)
+
+    def build_node_lookup(self) -> None:
+        """Indexes every node and pin name forwards and reversed for glob lookup."""
+        with self._write_connection() as connection:
+            with connection, self._timed("sql:build_node_lookup"):
+                connection.execute(_SQL_BUILD_NODE_LOOKUP)
+
+    def find_nodes(self, pattern: str, limit: int | None = None) -> tuple[str, ...]:
+        """Returns names matching a glob pattern using the forward or reversed index."""
+        column, glob = _lookup_column_for(pattern)
+        sql = (
+            f"SELECT name FROM node_lookup WHERE {column} GLOB ? ORDER BY name LIMIT ?"
+        )
+        with self._pool.reader() as connection, self._timed("sql:find_nodes"):
+            rows = connection.execute(sql, (glob, -1 if limit is None else limit))
+            return tuple(row[0] for row in rows)
 
     def find_max_delay_path(
-        self, start_node: str, end_node: str | None = None, max_depth: int = 100
-    ) -> tuple[Edge, ...]:
-        """Finds the max delay path using Recursive CTE."""
-        path_str = self._fetch_max_delay_path_string(start_node, end_node, max_depth)
+        self,
+        start_node: str,
+        end_node: str | None = None,
+        max_depth: int = 100,
+        beam_width: int | None = None,
+        timeout: float | None = None,
+    ) -> TraceResult:
+        """Finds the max delay path using Recursive CTE, or beam search if asked."""
+        deadline = SearchDeadline(timeout)
+        if beam_width is not None:
+            return self._find_max_delay_path_beam(
+                start_node, end_node, max_depth, beam_width, deadline
+            )
+        if timeout is not None:
+            return self._find_max_delay_path_streaming(
+                start_node, end_node, max_depth, deadline
+            )
+
+        with self._pool.reader() as connection:
+            edge_ids = self._fetch_max_delay_edge_ids(
+                connection, start_node, end_node, max_depth
+            )
+            if not edge_ids:
+                return TraceResult()
+            return TraceResult(self._materialize_edges(connection, edge_ids))
+
+    def find_max_delay_path_from_any(
+        self,
+        start_nodes: Collection[str],
+        end_nodes: Collection[str] | None = None,
+        max_depth: int = 100,
+        beam_width: int | None = None,
+        timeout: float | None = None,
+    ) -> TraceResult:
+        """Level-by-level search; the recursive CTE only takes a single start."""
+        with self._pool.reader() as connection, self._timed("sql:beam_search"):
+            search = BeamPathSearch(connection, beam_width, SearchDeadline(timeout))
+            return search.run_from_any(start_nodes, end_nodes, max_depth)
+
+    def find_max_delay_path_through(
+        self,
+        start_node: str,
+        through: Sequence[str],
+        end_node: str | None = None,
+        timeout: float | None = None,
+    ) -> TraceResult:
+        """Forward passes between waypoints, one backward pass from end_node."""
+        end_nodes = None if end_node is None else (end_node,)
+        return self.find_max_delay_path_through_from_any(
+            (start_node,), through, end_nodes, timeout
+        )
 
-        if not path_str:
-            return tuple()
+    def find_max_delay_path_through_from_any(
+        self,
+        start_nodes: Collection[str],
+        through: Sequence[str],
+        end_nodes: Collection[str] | None = None,
+        timeout: float | None = None,
+    ) -> TraceResult:
+        with self._pool.reader() as connection, self._timed("sql:through_search"):
+            search = ThroughPathSearch(
+                sqlite_fanout(connection),
+                sqlite_fanin(connection),
+                SearchDeadline(timeout),
+            )
+            return search.run_from_any(start_nodes, through, end_nodes)
 
-        return self._reconstruct_edges_from_path(path_str)
+    def _find_max_delay_path_beam(
+        self,
+        start: str,
+        end: str | None,
+        depth: int,
+        beam_width: int,
+        deadline: SearchDeadline,
+    ) -> TraceResult:
+        with self._pool.reader() as connection, self._timed("sql:beam_search"):
+            return BeamPathSearch(connection, beam_width, deadline).run(
+                start, end, depth
+            )
+
+    def _find_max_delay_path_streaming(
+        self, start: str, end: str | None, depth: int, deadline: SearchDeadline
+    ) -> TraceResult:
+        """Exact search that can be cancelled, keeping the best path found so far."""
+        sql = (
+            f"{_SQL_RECURSIVE_PATHS} "
+            "SELECT current_node, edge_ids, total_delay FROM paths"
+        )
+        with self._pool.reader() as connection:
+            with self._timed("sql:stream_paths"):
+                outcome = StreamingPathSearch(connection, deadline).run(
+                    sql, (start, depth), end
+                )
+            edges = (
+                self._materialize_edges(connection, outcome.edge_ids)
+                if outcome.edge_ids
+                else ()
+            )
+        return TraceResult(edges, partial=outcome.partial, stats=outcome.stats)
 
     def _connect(self) -> sqlite3.Connection:
         """Creates a connection with performance settings."""
         connection = sqlite3.connect(self.db_path)
-        connection.execute("PRAGMA journal_mode = WAL")
-        connection.execute("PRAGMA synchronous = NORMAL")
-        connection.execute("PRAGMA temp_store = MEMORY")
-        connection.execute("PRAGMA cache_size = -64000")
+        _configure(connection)
         return connection
 
-    def _executemany(self, sql: str, data: list[Any]) -> None:
+    def _executemany(self, sql: str, data: Sequence[Any], label: str) -> None:
         if not data:
             return
 
-        connection = self._get_connection()
-        should_close = self._active_connection is None
+        with self._write_connection() as connection:
+            with connection:  # Rolls back if anything below fails
+                with self._timed(label, len(data)):
+                    connection.executemany(sql, data)
+                self._commit(connection)
+
+    def _commit(self, connection: sqlite3.Connection) -> None:
+        with self._timed("commit"):
+            connection.commit()
+
+    @contextmanager
+    def _timed(self, category: str, rows: int = 0) -> Iterator[None]:
+        """Reports the wall time of the enclosed SQL work to the observer."""
+        if self._observer is None:
+            yield
+            return
+        started = time.perf_counter()
         try:
-            with connection:  # Commit transaction
-                connection.executemany(sql, data)
+            yield
         finally:
-            if should_close:
-                connection.close()
+            elapsed = time.perf_counter() - started
+            self._observer.record_timing(category, elapsed, rows)
 
-    def _fetch_max_delay_path_string(
-        self, start: str, end: str | None, depth: int
+    def _fetch_max_delay_edge_ids(
+        self,
+        connection: sqlite3.Connection,
+        start: str,
+        end: str | None,
+        depth: int,
     ) -> str | None:
         sql = self._build_recursive_query(end is not None)
         params = [start, depth]
         if end:
             params.append(end)
 
-        with closing(self._connect()) as connection:
+        with self._timed("sql:max_delay_path"):
             row = connection.execute(sql, tuple(params)).fetchone()
             return row[0] if row else None
 
     def _build_recursive_query(self, has_end_node: bool) -> str:
-        base_sql = """
-        WITH RECURSIVE paths(current_node, path_str, total_delay, depth) AS (
-            SELECT dst, src || ',' || dst, MAX(delay_rise, delay_fall), 1
-            FROM edges WHERE src = ?
-            UNION ALL
-            SELECT e.dst, p.path_str || ',' || e.dst,
-                   p.total_delay + MAX(e.delay_rise, e.delay_fall), p.depth + 1
-            FROM edges e JOIN paths p ON e.src = p.current_node
-            WHERE p.depth < ? AND instr(p.path_str, e.dst) = 0
-        )
-        SELECT path_str FROM paths
-        """
+        base_sql = f"{_SQL_RECURSIVE_PATHS} SELECT edge_ids FROM paths"
         where = "WHERE current_node = ?" if has_end_node else ""
         order = "ORDER BY total_delay DESC LIMIT 1"
         return f"{base_sql} {where} {order}"
 
-    def _reconstruct_edges_from_path(self, path_str: str) -> tuple[Edge, ...]:
-        nodes = path_str.split(",")
-        edges: list[Edge] = []
-        sql = "SELECT src, dst, delay_rise, delay_fall FROM edges WHERE src=? AND dst=?"
+    def _materialize_edges(
+        self, connection: sqlite3.Connection, edge_ids: str
+    ) -> tuple[Edge, ...]:
+        """Fetches the exact edges the search chose, in path order, in one query."""
+        with self._timed("sql:materialize_path"):
+            rows = connection.execute(_SQL_EDGES_BY_IDS, (edge_ids,))
+            return tuple(Edge(*row) for row in rows)
+
+
+def _configure(connection: sqlite3.Connection) -> None:
+    """Applies the performance PRAGMAs; read-only connections ignore the writes."""
+    connection.execute("PRAGMA journal_mode = WAL")
+    connection.execute("PRAGMA synchronous = NORMAL")
+    connection.execute("PRAGMA temp_store = MEMORY")
+    connection.execute("PRAGMA cache_size = -64000")
+    connection.create_function("reverse_text", 1, _reverse, deterministic=True)
+    connection.create_function("instance_of", 1, _instance_of, deterministic=True)
+
+
+def _instance_of(name: str) -> str:
+    return split_pin(name)[0]
+
+
+def _reverse(text: str) -> str:
+    return text[::-1]
 
-        with closing(self._connect()) as connection:
-            cursor = connection.cursor()
-            for i in range(len(nodes) - 1):
-                if row := cursor.execute(sql, (nodes[i], nodes[i + 1])).fetchone():
-                    edges.append(Edge(*row))
 
-        return tuple(edges)
+def _lookup_column_for(pattern: str) -> tuple[str, str]:
+    """Picks the index whose literal prefix lets SQLite range-scan the pattern."""
+    if pattern[:1] not in _GLOB_WILDCARDS:
+        return "name", pattern
+    tokens = _RE_GLOB_TOKEN.findall(pattern)
+    return "reversed_name", "".join(reversed(tokens))
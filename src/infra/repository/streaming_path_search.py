@@ -0,0 +1,54 @@
+import sqlite3
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from src.domain.model.trace_result import SearchStats
+from src.infra.repository.search_deadline import SearchDeadline
+
+
+@dataclass(frozen=True)
+class StreamingOutcome:
+    """Edge rowids of the best path seen and whether the stream was cut short."""
+
+    edge_ids: str | None
+    partial: bool
+    stats: SearchStats
+
+
+class StreamingPathSearch:
+    """
+    Consumes the recursive CTE row by row instead of sorting it inside SQLite,
+    so the best path seen so far survives when the deadline cancels the query.
+    Cancellation uses SQLite's progress handler, which interrupts the statement.
+    """
+
+    _PROGRESS_INTERVAL = 10_000  # SQLite VM instructions between deadline checks
+
+    def __init__(self, connection: sqlite3.Connection, deadline: SearchDeadline):
+        self._connection = connection
+        self._deadline = deadline
+
+    def run(
+        self, sql: str, params: Sequence[object], end: str | None
+    ) -> StreamingOutcome:
+        best: tuple[float, str] | None = None
+        paths, nodes = 0, set[str]()
+        self._connection.set_progress_handler(
+            self._deadline.expired, self._PROGRESS_INTERVAL
+        )
+        try:
+            for node, edge_ids, delay in self._connection.execute(sql, params):
+                paths += 1
+                nodes.add(node)
+                if (end is None or node == end) and (best is None or delay > best[0]):
+                    best = (delay, edge_ids)
+            partial = False
+        except sqlite3.OperationalError:
+            if not self._deadline.expired():
+                raise
+            partial = True
+        finally:
+            self._connection.set_progress_handler(None, 0)
+
+        stats = SearchStats(paths, len(nodes), self._deadline.elapsed())
+        return StreamingOutcome(best[1] if best else None, partial, stats)
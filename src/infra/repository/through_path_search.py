@@ -0,0 +1,135 @@
+from collections import deque
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+
+from src.domain.model.edge import Edge
+from src.domain.model.trace_result import SearchStats, TraceResult
+from src.infra.repository.beam_path_search import FanoutSource
+from src.infra.repository.search_deadline import SearchDeadline
+
+
+@dataclass(frozen=True)
+class _Propagation:
+    """Best accumulated delay per node, and the edge that produced it."""
+
+    best: dict[str, tuple[float, Edge | None]]
+    complete: bool
+
+
+class ThroughPathSearch:
+    """
+    Worst path from start that visits every through-point in order.
+    Each leg is one linear pass: the cone reachable from its origin is
+    collected, topologically ordered and relaxed once. The first legs
+    propagate forward from start and each through-point. The last leg
+    propagates backward from end, and the two meet at the final
+    through-point instead of enumerating the paths between them.
+    """
+
+    def __init__(
+        self,
+        fanout: FanoutSource,
+        fanin: FanoutSource,
+        deadline: SearchDeadline | None = None,
+    ) -> None:
+        self._fanout = fanout
+        self._fanin = fanin
+        self._deadline = deadline or SearchDeadline()
+        self._explored = 0
+
+    def run(self, start: str, through: Sequence[str], end: str | None) -> TraceResult:
+        return self.run_from_any((start,), through, None if end is None else (end,))
+
+    def run_from_any(
+        self,
+        starts: Iterable[str],
+        through: Sequence[str],
+        ends: Iterable[str] | None,
+    ) -> TraceResult:
+        """
+        The first leg propagates from every start at once and the last one
+        back from every end at once, so many endpoints still cost one pass.
+        """
+        edges: list[Edge] = []
+        complete = True
+        origins = set(starts)
+        for target in through:
+            leg = self._forward(origins)
+            complete &= leg.complete
+            if target not in leg.best:
+                return self._result((), complete)
+            edges += _walk(leg.best, target, lambda e: e.src_node)[::-1]
+            origins = {target}
+
+        if ends is None:
+            leg = self._forward(origins)
+            tip = max(leg.best, key=lambda node: leg.best[node][0])
+            tail = _walk(leg.best, tip, lambda e: e.src_node)[::-1]
+        else:
+            leg = self._backward(set(ends))
+            reached = origins & leg.best.keys()
+            if not reached:
+                return self._result((), complete and leg.complete)
+            last = max(reached, key=lambda node: leg.best[node][0])
+            tail = _walk(leg.best, last, lambda e: e.dst_node)
+        return self._result((*edges, *tail), complete and leg.complete)
+
+    def _forward(self, origins: set[str]) -> _Propagation:
+        return self._propagate(origins, self._fanout, lambda e: e.dst_node)
+
+    def _backward(self, origins: set[str]) -> _Propagation:
+        return self._propagate(origins, self._fanin, lambda e: e.src_node)
+
+    def _propagate(
+        self, origins: set[str], expand: FanoutSource, step: Callable[[Edge], str]
+    ) -> _Propagation:
+        """Collects the cone of the origins, then relaxes it in topological order."""
+        adjacency: dict[str, list[Edge]] = {}
+        frontier = set(origins)
+        while frontier and not self._deadline.expired():
+            fetched = expand(frontier)
+            adjacency.update((node, fetched.get(node, [])) for node in frontier)
+            frontier = {
+                step(e) for edges in fetched.values() for e in edges
+            } - adjacency.keys()
+        self._explored += len(adjacency)
+
+        indegree = dict.fromkeys(adjacency, 0)
+        for edges in adjacency.values():
+            for e in edges:
+                if step(e) in indegree:
+                    indegree[step(e)] += 1
+
+        best: dict[str, tuple[float, Edge | None]] = dict.fromkeys(origins, (0.0, None))
+        ready = deque(node for node, degree in indegree.items() if degree == 0)
+        while ready:
+            node = ready.popleft()
+            for e in adjacency[node]:
+                nxt = step(e)
+                if nxt not in indegree:
+                    continue
+                if node in best:
+                    arrival = best[node][0] + max(e.delay_rise, e.delay_fall)
+                    if nxt not in best or arrival > best[nxt][0]:
+                        best[nxt] = (arrival, e)
+                indegree[nxt] -= 1
+                if indegree[nxt] == 0:
+                    ready.append(nxt)
+        return _Propagation(best, complete=not frontier)
+
+    def _result(self, edges: Sequence[Edge], complete: bool) -> TraceResult:
+        stats = SearchStats(0, self._explored, self._deadline.elapsed())
+        return TraceResult(tuple(edges), partial=not complete, stats=stats)
+
+
+def _walk(
+    best: dict[str, tuple[float, Edge | None]],
+    node: str,
+    step: Callable[[Edge], str],
+) -> list[Edge]:
+    """Follows the recorded best edges from node back to the propagation origin."""
+    edges: list[Edge] = []
+    while (edge := best[node][1]) is not None:
+        edges.append(edge)
+        node = step(edge)
+    return edges
@@ -1,14 +1,50 @@
+import glob
+import tempfile
+from collections.abc import Iterator, Sequence
+from contextlib import ExitStack, contextmanager
+from functools import partial
 from pathlib import Path
+from typing import Any
 
 import click
 from tqdm import tqdm
 
+from src.domain.model.distribution import METRICS, Distribution
+from src.domain.model.trace_result import TraceResult
+from src.domain.protocol.graph_repository import GraphRepository
 from src.domain.protocol.progress_observer import ProgressObserver
+from src.infra.export.npy_bundle import NpyBundleWriter
+from src.infra.metrics.process_memory import current_rss_bytes
+from src.infra.metrics.profiling_observer import ProfilingObserver
+from src.infra.parser.constraint_parser import read_required_times
+from src.infra.parser.node_list_parser import read_node_names
 from src.infra.parser.sdf_stream_parser import SDFStreamParser
 from src.infra.parser.verilog_stream_parser import VerilogStreamParser
+from src.infra.repository.mapped_graph import (
+    MappedGraph,
+    build_adjacency_index,
+    has_adjacency_index,
+)
+from src.infra.repository.partitioned_graph_repository import (
+    PartitionedGraphRepository,
+    database_stamp,
+    stored_partition_count,
+)
 from src.infra.repository.sqlite_graph_repository import SqliteGraphRepository
-from src.usecase.import_sdf import ImportSDFUseCase
+from src.usecase.adaptive_batch_sizer import AdaptiveBatchSizer
+from src.usecase.compute_slack import ComputeSlackUseCase
+from src.usecase.compute_stats import ComputeStatsUseCase
+from src.usecase.concurrent_import import FileProgress, FileSummary
+from src.usecase.export_columnar import ExportColumnarUseCase
+from src.usecase.fanin_cone import BuildFaninConeUseCase, FaninCone
+from src.usecase.find_nodes import FindNodesUseCase
+from src.usecase.flatten_hierarchy import FlattenHierarchyUseCase
+from src.usecase.import_cell_arcs import ImportCellArcsUseCase
+from src.usecase.import_modules import ImportModulesUseCase
+from src.usecase.import_sdf import DelayImportSummary, ImportSDFUseCase
 from src.usecase.import_verilog import ImportVerilogUseCase
+from src.usecase.instrumentation import observed_stage
+from src.usecase.parallel_trace_path import ParallelTracePathUseCase
 from src.usecase.trace_path import TracePathUseCase
 
 
@@ -22,6 +58,132 @@ class TqdmObserver(ProgressObserver):
     def set_description(self, description: str) -> None:
         self._pbar.set_description(description)
 
+    def stage_started(self, stage: str) -> None:
+        pass
+
+    def stage_finished(self, stage: str, rows: int) -> None:
+        pass
+
+    def record_timing(self, category: str, seconds: float, rows: int = 0) -> None:
+        pass
+
+
+_PROFILE_OPTION = click.option(
+    "--profile",
+    "profile_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Write a JSON report of stage, SQL and memory metrics to this file",
+)
+
+
+_MEMORY_BUDGET_OPTION = click.option(
+    "--memory-budget",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Keep process RSS under this many MiB by adapting write batch sizes",
+)
+
+
+_PARTITIONS_OPTION = click.option(
+    "--partitions",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Shard the graph over N database files written in parallel",
+)
+
+
+_WORKERS_OPTION = click.option(
+    "--workers",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Worker processes [default: CPU count]",
+)
+
+
+_BEAM_OPTION = click.option(
+    "--beam",
+    "beam_width",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Approximate search keeping only the W best partial paths per level",
+)
+
+
+_TIMEOUT_OPTION = click.option(
+    "--timeout",
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    help="Cancel the search after SECONDS and report the best path so far",
+)
+
+
+def _open_repository(
+    db: str, profiler: ProfilingObserver, partitions: int | None = None
+) -> GraphRepository:
+    """Opens a partitioned database when asked to or when db already is one."""
+    stored = stored_partition_count(db)
+    if partitions and stored and partitions != stored:
+        raise click.UsageError(
+            f"{db} is split into {stored} partitions, not {partitions}."
+        )
+    partitions = partitions or stored
+    if partitions:
+        return PartitionedGraphRepository(db, partitions, observer=profiler)
+    return SqliteGraphRepository(db_path=db, observer=profiler)
+
+
+def _batch_sizer(memory_budget_mib: int | None) -> AdaptiveBatchSizer:
+    budget = memory_budget_mib * 1024 * 1024 if memory_budget_mib else None
+    return AdaptiveBatchSizer(memory_budget=budget, memory_probe=current_rss_bytes)
+
+
+def _write_profile(profiler: ProfilingObserver, profile_path: Path | None) -> None:
+    if profile_path is not None:
+        profiler.write_report(profile_path)
+
+
+def _expand_paths(patterns: tuple[str, ...]) -> list[Path]:
+    """Expands quoted globs (e.g. "blocks/*.sdf"); other paths must exist."""
+    paths: list[Path] = []
+    for pattern in patterns:
+        if Path(pattern).is_file():
+            paths.append(Path(pattern))
+        elif matches := sorted(glob.glob(pattern)):
+            paths.extend(Path(match) for match in matches)
+        else:
+            raise click.BadParameter(f"no file matches {pattern!r}.")
+    return list(dict.fromkeys(paths))
+
+
+@contextmanager
+def _file_bars(paths: Sequence[Path], passes: int) -> Iterator[FileProgress]:
+    """One progress bar per file, advanced by the progress callback yielded."""
+    with ExitStack() as stack:
+        bars = [
+            stack.enter_context(
+                tqdm(
+                    total=path.stat().st_size * passes,
+                    unit="B",
+                    unit_scale=True,
+                    desc=path.name,
+                    position=index,
+                )
+            )
+            for index, path in enumerate(paths)
+        ]
+        yield lambda index, increment: bars[index].update(increment)
+
+
+def _echo_file_summaries(*runs: Sequence[FileSummary]) -> None:
+    """One line per file, adding up the rows and time of every pass over it."""
+    for passes in zip(*runs, strict=True):
+        rows = {kind: n for summary in passes for kind, n in summary.rows.items()}
+        seconds = sum(summary.seconds for summary in passes)
+        counts = ", ".join(f"{n} {kind}" for kind, n in rows.items())
+        click.echo(f"  {passes[0].path}: {counts or 'nothing'} in {seconds:.1f}s")
+
 
 @click.group()
 def cli() -> None:
@@ -30,63 +192,305 @@ def cli() -> None:
 
 
 @cli.command()
-@click.argument("verilog_file", type=click.Path(exists=True, path_type=Path))
+@click.argument("verilog_files", nargs=-1, required=True)
 @click.option("--db", "-d", default="gls.db", help="Path to SQLite database")
-def import_verilog(verilog_file: Path, db: str) -> None:
-    """Import Gate Netlist (Verilog) into the database."""
+@_PROFILE_OPTION
+@_MEMORY_BUDGET_OPTION
+@_PARTITIONS_OPTION
+@_WORKERS_OPTION
+@click.option(
+    "--hierarchical",
+    is_flag=True,
+    help="Store each module definition once; expand instances with `flatten`",
+)
+@click.option(
+    "--only-cone",
+    "cone_endpoints",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    help="Import only the fan-in cone of the endpoints listed in this file",
+)
+@click.option(
+    "--sdf",
+    "cone_sdfs",
+    multiple=True,
+    help="SDF giving the pin directions for --only-cone (repeatable, globs ok)",
+)
+def import_verilog(
+    verilog_files: tuple[str, ...],
+    db: str,
+    profile_path: Path | None,
+    **import_options: Any,
+) -> None:
+    """
+    Import Gate Netlist (Verilog) into the database.
+    Several files (or a quoted glob such as "blocks/*.v") are parsed
+    concurrently, one process each, and written through this process.
+    With --only-cone, a first pass over the netlist and the --sdf files
+    finds the fan-in of the listed endpoints, and only that is imported.
+    """
+    paths = _expand_paths(verilog_files)
+    if len(paths) > 1 and import_options["hierarchical"]:
+        raise click.UsageError("--hierarchical takes one file.")
+    if import_options["cone_endpoints"] and import_options["hierarchical"]:
+        raise click.UsageError("--only-cone cannot be combined with --hierarchical.")
+    if import_options["memory_budget"] and import_options["hierarchical"]:
+        raise click.UsageError(
+            "--memory-budget cannot be combined with --hierarchical, "
+            "which writes one module at a time."
+        )
+    if import_options["cone_endpoints"] and not import_options["cone_sdfs"]:
+        raise click.UsageError("--only-cone needs --sdf for the pin directions.")
     count_node_and_gate = 2
-    repo = SqliteGraphRepository(db_path=db)
+    profiler = ProfilingObserver()
+    repo = _open_repository(db, profiler, import_options["partitions"])
     repo.setup()
     parser = VerilogStreamParser()
-    usecase = ImportVerilogUseCase(repo, parser)
+    cone: FaninCone | None = None
+    if import_options["hierarchical"]:
+        count_node_and_gate = 1
+        usecase: ImportVerilogUseCase | ImportModulesUseCase = ImportModulesUseCase(
+            repo, parser
+        )
+    else:
+        cone = (
+            _fanin_cone(paths, import_options, profiler)
+            if import_options["cone_endpoints"]
+            else None
+        )
+        usecase = ImportVerilogUseCase(
+            repo, parser, _batch_sizer(import_options["memory_budget"]), cone
+        )
+
+    if len(paths) > 1 and isinstance(usecase, ImportVerilogUseCase):
+        with _file_bars(paths, count_node_and_gate) as on_progress:
+            files = usecase.execute_many(
+                paths, import_options["workers"], on_progress, profiler
+            )
+        _echo_file_summaries(files)
+    else:
+        total_size = paths[0].stat().st_size * count_node_and_gate
+        with tqdm(
+            total=total_size, unit="B", unit_scale=True, desc="Initializing"
+        ) as pbar:
+            profiler.forward_to(TqdmObserver(pbar))
+            usecase.execute(paths[0], observer=profiler)
+
+    if cone is not None:
+        _import_cone_delays(repo, cone, import_options, profiler)
+    _write_profile(profiler, profile_path)
+    click.echo("Done.")
 
-    total_size = verilog_file.stat().st_size * count_node_and_gate
 
+def _fanin_cone(
+    verilog_paths: Sequence[Path],
+    import_options: dict[str, Any],
+    profiler: ProfilingObserver,
+) -> FaninCone:
+    """The cheap first pass of import-verilog --only-cone."""
+    sdf_paths = _expand_paths(import_options["cone_sdfs"])
+    endpoints = read_node_names(import_options["cone_endpoints"])
+    usecase = BuildFaninConeUseCase(VerilogStreamParser(), SDFStreamParser())
+    total_size = sum(path.stat().st_size for path in [*verilog_paths, *sdf_paths])
     with tqdm(total=total_size, unit="B", unit_scale=True, desc="Initializing") as pbar:
-        observer = TqdmObserver(pbar)
-        usecase.execute(verilog_file, observer=observer)
+        profiler.forward_to(TqdmObserver(pbar))
+        cone = usecase.execute(endpoints, verilog_paths, sdf_paths, profiler)
+    profiler.forward_to(None)
 
-    click.echo("Done.")
+    if not cone:
+        raise click.ClickException("No endpoint was found in the netlist or SDF.")
+    for endpoint in cone.missing:
+        click.echo(f"Note: endpoint {endpoint} matches no pin or net.")
+    click.echo(f"Fan-in cone of {len(endpoints)} endpoint(s): {len(cone)} node(s).")
+    return cone
+
+
+def _import_cone_delays(
+    repo: GraphRepository,
+    cone: FaninCone,
+    import_options: dict[str, Any],
+    profiler: ProfilingObserver,
+) -> None:
+    """
+    The second and last pass over the --sdf files of --only-cone: delays and
+    cell arcs are kept exactly when they load a pin of the cone.
+    """
+    sdf_paths = _expand_paths(import_options["cone_sdfs"])
+    parser = SDFStreamParser()
+    sizer = _batch_sizer(import_options["memory_budget"])
+    arcs = ImportCellArcsUseCase(repo, cone)
+    usecase = ImportSDFUseCase(repo, parser, sizer, cone, arcs)
+    summary = _run_sdf_import(usecase, sdf_paths, import_options["workers"], profiler)
+    arc_count = summary.cell_arcs.arcs if summary.cell_arcs else 0
+    click.echo(
+        f"Imported {summary.written} delay(s) and {arc_count} cell arc(s) of the cone."
+    )
 
 
 @cli.command()
-@click.argument("sdf_file", type=click.Path(exists=True, path_type=Path))
 @click.option("--db", "-d", default="gls.db", help="Path to SQLite database")
-def import_sdf(sdf_file: Path, db: str) -> None:
-    """Import Standard Delay Format (SDF) into the database."""
-    repo = SqliteGraphRepository(db_path=db)
+@click.option("--top", default=None, help="Top module (inferred when unique)")
+@click.option(
+    "--block",
+    default=None,
+    help='Only materialize this instance path, e.g. "u_core/u_alu"',
+)
+@_PROFILE_OPTION
+def flatten(
+    db: str, top: str | None, block: str | None, profile_path: Path | None
+) -> None:
+    """Expand modules stored by `import-verilog --hierarchical` into edges."""
+    profiler = ProfilingObserver()
+    repo = _open_repository(db, profiler)
     repo.setup()
-    parser = SDFStreamParser()
-    usecase = ImportSDFUseCase(repo, parser)
+    usecase = FlattenHierarchyUseCase(repo)
+
+    try:
+        rows = usecase.execute(top, block, observer=profiler)
+    except ValueError as error:
+        raise click.ClickException(str(error)) from error
 
-    total_size = sdf_file.stat().st_size
+    _write_profile(profiler, profile_path)
+    click.echo(f"Materialized {rows} edge(s).")
 
-    with tqdm(total=total_size, unit="B", unit_scale=True, desc="Initializing") as pbar:
-        observer = TqdmObserver(pbar)
-        usecase.execute(sdf_file, observer=observer)
 
+@cli.command()
+@click.argument("sdf_files", nargs=-1, required=True)
+@click.option("--db", "-d", default="gls.db", help="Path to SQLite database")
+@click.option(
+    "--hier-names",
+    is_flag=True,
+    help='Match SDF pins by full instance path ("u_core/u1.A"), not "u1.A"; '
+    "always on for netlists imported with --hierarchical",
+)
+@_PROFILE_OPTION
+@_MEMORY_BUDGET_OPTION
+@_PARTITIONS_OPTION
+@_WORKERS_OPTION
+@click.option(
+    "--prefilter/--no-prefilter",
+    default=False,
+    help="Drop SDF records with no matching edge first (costs a scan of edges)",
+)
+@click.option(
+    "--iopath/--no-iopath",
+    default=True,
+    help="Also import IOPATH cell arcs, stored once per distinct delay template",
+)
+def import_sdf(
+    sdf_files: tuple[str, ...],
+    db: str,
+    hier_names: bool,
+    profile_path: Path | None,
+    **import_options: Any,
+) -> None:
+    """
+    Import Standard Delay Format (SDF) into the database.
+    Several files (or a quoted glob such as "blocks/*.sdf") are parsed
+    concurrently, one process each, and written through this process.
+    """
+    paths = _expand_paths(sdf_files)
+    profiler = ProfilingObserver()
+    repo = _open_repository(db, profiler, import_options["partitions"])
+    repo.setup()
+    # flatten names edges by full instance path, so the SDF must match that.
+    parser = SDFStreamParser(hierarchical=hier_names or bool(repo.module_names()))
+    sizer = _batch_sizer(import_options["memory_budget"])
+    prefilter = import_options["prefilter"]
+    usecase = ImportSDFUseCase(
+        repo,
+        parser,
+        sizer,
+        prefilter,
+        ImportCellArcsUseCase(repo, prefilter) if import_options["iopath"] else None,
+    )
+
+    summary = _run_sdf_import(usecase, paths, import_options["workers"], profiler)
+    _write_profile(profiler, profile_path)
+    arcs = summary.cell_arcs
+    if prefilter:
+        discarded = summary.discarded + (arcs.discarded if arcs else 0)
+        click.echo(
+            f"Prefilter discarded {discarded} SDF records with no matching edge."
+        )
+    if arcs is not None:
+        click.echo(
+            f"Imported {arcs.arcs} cell arc(s) over {arcs.templates} delay template(s)."
+        )
     click.echo("Done.")
 
 
+def _run_sdf_import(
+    usecase: ImportSDFUseCase,
+    paths: Sequence[Path],
+    workers: int | None,
+    profiler: ProfilingObserver,
+) -> DelayImportSummary:
+    """Imports one SDF under a byte bar, or several concurrently, one bar each."""
+    if len(paths) > 1:
+        with _file_bars(paths, 1) as on_progress:
+            summary = usecase.execute_many(paths, workers, on_progress, profiler)
+        _echo_file_summaries(summary.files)
+        return summary
+    total_size = paths[0].stat().st_size
+    with tqdm(total=total_size, unit="B", unit_scale=True, desc="Initializing") as pbar:
+        profiler.forward_to(TqdmObserver(pbar))
+        summary = usecase.execute(paths[0], observer=profiler)
+    profiler.forward_to(None)
+    return summary
+
+
 @cli.command()
 @click.argument("start_node")
 @click.argument("end_node", required=False)
 @click.option("--db", "-d", default="gls.db", help="Path to SQLite database")
-def trace_path(start_node: str, end_node: str | None, db: str) -> None:
+@_BEAM_OPTION
+@_TIMEOUT_OPTION
+@click.option(
+    "--through",
+    multiple=True,
+    metavar="NODE",
+    help="Only consider paths through NODE; repeat to pass several in order",
+)
+@_PROFILE_OPTION
+def trace_path(
+    start_node: str,
+    end_node: str | None,
+    db: str,
+    profile_path: Path | None,
+    **search_options: Any,
+) -> None:
     """
     Trace the max delay path from START_NODE.
     If END_NODE is provided, finds path to that node.
     Otherwise, finds the critical path to any reachable node.
+    Both accept glob patterns (e.g. "u_alu*.Z"); the worst matching path wins.
+    With --through, the path must visit each given node in order.
     """
-    repo = SqliteGraphRepository(db_path=db)
+    through = search_options.pop("through")
+    if through and search_options["beam_width"] is not None:
+        raise click.UsageError("--through cannot be combined with --beam.")
+    profiler = ProfilingObserver()
+    repo = _open_repository(db, profiler)
     usecase = TracePathUseCase(repo)
 
-    path = usecase.execute(start_node, end_node)
+    profiler.stage_started("trace_path")
+    if through:
+        path = usecase.execute_through(
+            start_node, through, end_node, timeout=search_options["timeout"]
+        )
+    else:
+        path = usecase.execute(start_node, end_node, **search_options)
+    profiler.stage_finished("trace_path", len(path))
+    _write_profile(profiler, profile_path)
 
     target_msg = f"to {end_node}" if end_node else "(Critical Path)"
+    if through:
+        target_msg += f" through {' -> '.join(through)}"
 
     if not path:
         click.echo(f"No path found from {start_node} {target_msg}.")
+        _echo_partial_note(path)
         return
 
     click.echo(f"Path found from {start_node} {target_msg}:")
@@ -104,6 +508,291 @@ def trace_path(start_node: str, end_node: str | None, db: str) -> None:
     click.echo("-" * 40)
     click.echo(f"Total Edges: {len(path)}")
     click.echo(f"Total Delay: Rise={total_rise:.5f}, Fall={total_fall:.5f}")
+    if path.approximate:
+        beam_width = search_options["beam_width"]
+        click.echo(f"Note: approximate result (beam width {beam_width}).")
+    _echo_partial_note(path)
+
+
+def _echo_partial_note(path: TraceResult) -> None:
+    if path.partial:
+        stats = path.stats
+        click.echo(
+            f"Note: search timed out after {stats.elapsed_seconds:.1f}s; "
+            "showing the best path found so far "
+            f"({stats.explored_paths} paths over {stats.explored_nodes} nodes "
+            "explored)."
+        )
+
+
+@cli.command()
+@click.option("--db", "-d", default="gls.db", help="Path to SQLite database")
+@click.option(
+    "--constraints",
+    "constraints_file",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    help='File of "<endpoint> <required_time>" lines',
+)
+@click.option(
+    "--clock-period",
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    help="Required time at every endpoint without fan-out",
+)
+@click.option(
+    "--below",
+    "threshold",
+    type=float,
+    default=0.0,
+    show_default=True,
+    help="List nodes whose slack is below this value",
+)
+@click.option("--limit", "-n", type=int, default=20, help="Maximum nodes to list")
+@_PROFILE_OPTION
+def slack(db: str, profile_path: Path | None, **slack_options: Any) -> None:
+    """
+    Compute required time and slack for every node into the slack table.
+    Endpoints come from --constraints, --clock-period, or both (listed
+    endpoints override the clock period).
+    """
+    constraints_file = slack_options["constraints_file"]
+    if constraints_file is None and slack_options["clock_period"] is None:
+        raise click.UsageError("Give --constraints, --clock-period, or both.")
+    try:
+        required = read_required_times(constraints_file) if constraints_file else {}
+    except ValueError as error:
+        raise click.ClickException(str(error)) from error
+
+    profiler = ProfilingObserver()
+    repo = _open_repository(db, profiler)
+    repo.setup()
+    usecase = ComputeSlackUseCase(repo)
+
+    profiler.stage_started("slack")
+    summary = usecase.execute(required, slack_options["clock_period"])
+    profiler.stage_finished("slack", summary.nodes)
+    violations = repo.find_slack_below(
+        slack_options["threshold"], slack_options["limit"]
+    )
+    _write_profile(profiler, profile_path)
+
+    if summary.worst_slack is None:
+        click.echo("No constrained endpoint was found in the graph.")
+        return
+    click.echo(
+        f"Slack computed for {summary.nodes} nodes from {summary.endpoints} "
+        f"endpoints (worst: {summary.worst_slack:.5f})."
+    )
+    for node, arrival, required_time, node_slack in violations:
+        click.echo(
+            f"  {node_slack:10.5f}  {node} "
+            f"(Arrival: {arrival:.5f}, Required: {required_time:.5f})"
+        )
+
+
+@cli.command()
+@click.option("--db", "-d", default="gls.db", help="Path to SQLite database")
+@click.option(
+    "--metric",
+    "metrics",
+    type=click.Choice(METRICS),
+    multiple=True,
+    help="Metric to summarize (repeatable; default: all)",
+)
+@click.option("--bins", type=click.IntRange(min=1), default=10, show_default=True)
+@click.option(
+    "--by-prefix",
+    is_flag=True,
+    help="Also break each metric down by top-level hierarchy prefix",
+)
+@_PROFILE_OPTION
+def stats(db: str, profile_path: Path | None, **stats_options: Any) -> None:
+    """
+    Print percentiles and histograms of edge delay and, after `slack`,
+    of endpoint arrival time and logic depth.
+    """
+    profiler = ProfilingObserver()
+    repo = _open_repository(db, profiler)
+    repo.setup()
+    usecase = ComputeStatsUseCase(repo)
+
+    for metric in stats_options["metrics"] or METRICS:
+        profiler.stage_started(f"stats:{metric}")
+        distributions = usecase.execute(
+            metric, stats_options["bins"], stats_options["by_prefix"]
+        )
+        profiler.stage_finished(f"stats:{metric}", len(distributions))
+        if not distributions:
+            click.echo(f"{metric}: no values.")
+            continue
+        overall, *groups = distributions
+        _echo_distribution(overall)
+        for group in groups:
+            click.echo(f"  {group.group}: {_format_summary(group)}")
+    _write_profile(profiler, profile_path)
+
+
+_HISTOGRAM_WIDTH = 40
+
+
+def _format_summary(distribution: Distribution) -> str:
+    percentiles = "  ".join(f"p{q:g}={v:.5f}" for q, v in distribution.percentiles)
+    return (
+        f"n={distribution.count} min={distribution.minimum:.5f} "
+        f"mean={distribution.mean:.5f} max={distribution.maximum:.5f}  {percentiles}"
+    )
+
+
+def _echo_distribution(distribution: Distribution) -> None:
+    click.echo(f"{distribution.metric}: {_format_summary(distribution)}")
+    peak = max(distribution.bin_counts)
+    bounds = zip(distribution.bin_edges, distribution.bin_edges[1:], strict=False)
+    for (low, high), count in zip(bounds, distribution.bin_counts, strict=True):
+        bar = "#" * round(_HISTOGRAM_WIDTH * count / peak)
+        click.echo(f"  [{low:12.5f}, {high:12.5f})  {bar:<{_HISTOGRAM_WIDTH}} {count}")
+
+
+@cli.command()
+@click.argument(
+    "starts_file", type=click.Path(exists=True, dir_okay=False, path_type=Path)
+)
+@click.argument("end_node", required=False)
+@click.option("--db", "-d", default="gls.db", help="Path to SQLite database")
+@click.option(
+    "--graph-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help="Keep the memory-mapped graph in DIR and reuse it on later runs",
+)
+@_WORKERS_OPTION
+@_BEAM_OPTION
+@_TIMEOUT_OPTION
+@_PROFILE_OPTION
+def trace_batch(
+    starts_file: Path,
+    end_node: str | None,
+    db: str,
+    profile_path: Path | None,
+    **batch_options: Any,
+) -> None:
+    """
+    Trace the max delay path from every start node listed in STARTS_FILE.
+    Worker processes share one read-only, memory-mapped copy of the graph,
+    exported from the database first (kept in --graph-dir when given).
+    """
+    profiler = ProfilingObserver()
+    starts = read_node_names(starts_file)
+    with _mapped_graph(db, batch_options.pop("graph_dir"), profiler) as graph_dir:
+        usecase = ParallelTracePathUseCase(
+            partial(MappedGraph, graph_dir), batch_options.pop("workers")
+        )
+        profiler.stage_started("trace_batch")
+        paths = usecase.execute(starts, end_node, **batch_options)
+        profiler.stage_finished("trace_batch", len(paths))
+    _write_profile(profiler, profile_path)
+
+    for start, path in zip(starts, paths, strict=True):
+        if not path:
+            click.echo(f"{start}: no path")
+            continue
+        timed_out = " (timed out)" if path.partial else ""
+        click.echo(
+            f"{start} -> {path[-1].dst_node}: {path.total_delay:.5f} "
+            f"over {len(path)} edge(s){timed_out}"
+        )
+    click.echo(f"Traced {len(starts)} start node(s).")
+
+
+@contextmanager
+def _mapped_graph(
+    db: str, graph_dir: Path | None, profiler: ProfilingObserver
+) -> Iterator[Path]:
+    """
+    Yields a directory holding the exported graph and its adjacency index.
+    A kept graph_dir is exported again once the database has been written.
+    """
+    with ExitStack() as stack:
+        if graph_dir is None:
+            graph_dir = Path(stack.enter_context(tempfile.TemporaryDirectory()))
+        source = database_stamp(db)
+        if not has_adjacency_index(graph_dir, source):
+            repo = _open_repository(db, profiler)
+            ExportColumnarUseCase(repo, NpyBundleWriter(graph_dir)).execute(profiler)
+            with observed_stage("adjacency_index", profiler):
+                build_adjacency_index(graph_dir, source)
+        yield graph_dir
+
+
+@cli.command()
+@click.argument(
+    "output_dir", type=click.Path(file_okay=False, writable=True, path_type=Path)
+)
+@click.option("--db", "-d", default="gls.db", help="Path to SQLite database")
+@click.option(
+    "--chunk-rows",
+    type=click.IntRange(min=1),
+    default=1 << 16,
+    show_default=True,
+    help="Rows streamed per chunk",
+)
+@_PROFILE_OPTION
+def export_columnar(
+    output_dir: Path, db: str, chunk_rows: int, profile_path: Path | None
+) -> None:
+    """
+    Export nodes and edges as .npy columns into OUTPUT_DIR.
+    Load each with np.load(path, mmap_mode="r") for zero-copy access.
+    """
+    profiler = ProfilingObserver()
+    repo = _open_repository(db, profiler)
+    usecase = ExportColumnarUseCase(repo, NpyBundleWriter(output_dir), chunk_rows)
+
+    nodes, edges = usecase.execute(observer=profiler)
+    _write_profile(profiler, profile_path)
+    click.echo(f"Exported {nodes} nodes and {edges} edges to {output_dir}.")
+
+
+@cli.command()
+@click.option("--db", "-d", default="gls.db", help="Path to SQLite database")
+@_PROFILE_OPTION
+def cluster_edges(db: str, profile_path: Path | None) -> None:
+    """
+    Rewrite the edges table in source order with an index covering the
+    delays, so traces read each node's fan-out from contiguous pages.
+    Run it after the imports; later imports keep working, only slower.
+    """
+    profiler = ProfilingObserver()
+    repo = _open_repository(db, profiler)
+    repo.setup()
+
+    with observed_stage("cluster_edges", profiler):
+        repo.cluster_edges()
+    _write_profile(profiler, profile_path)
+    click.echo("Edges clustered by source.")
+
+
+@cli.command()
+@click.argument("pattern")
+@click.option("--db", "-d", default="gls.db", help="Path to SQLite database")
+@click.option("--limit", "-n", type=int, default=None, help="Maximum names to list")
+@_PROFILE_OPTION
+def find_nodes(
+    pattern: str, db: str, limit: int | None, profile_path: Path | None
+) -> None:
+    """List node names matching a glob PATTERN (e.g. "u_core*" or "*.CK")."""
+    profiler = ProfilingObserver()
+    repo = _open_repository(db, profiler)
+    usecase = FindNodesUseCase(repo)
+
+    profiler.stage_started("find_nodes")
+    names = usecase.execute(pattern, limit)
+    profiler.stage_finished("find_nodes", len(names))
+    _write_profile(profiler, profile_path)
+
+    for name in names:
+        click.echo(name)
+    click.echo(f"{len(names)} node(s) matched.")
 
 
 if __name__ == "__main__":
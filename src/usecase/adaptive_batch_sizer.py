@@ -0,0 +1,72 @@
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+
+class AdaptiveBatchSizer:
+    """
+    Chooses how many rows to hand to the repository per write.
+    Batches grow while a write (execute + commit) finishes well under the
+    target latency, i.e. while fixed commit cost dominates, and shrink when
+    writes get slow or the process RSS approaches the memory budget.
+    """
+
+    _MINIMUM = 5_000
+    _MAXIMUM = 2_000_000
+    _GROW_FACTOR = 2.0
+    _SHRINK_FACTOR = 0.5
+    _GROW_BELOW_BUDGET = 0.7  # only grow while RSS is under 70% of the budget
+    _SHRINK_ABOVE_BUDGET = 0.9
+
+    def __init__(
+        self,
+        initial: int = 100_000,
+        target_seconds: float = 1.0,
+        memory_budget: int | None = None,
+        memory_probe: Callable[[], int] | None = None,
+    ) -> None:
+        self._size = max(self._MINIMUM, min(initial, self._MAXIMUM))
+        self._target_seconds = target_seconds
+        self._memory_budget = memory_budget
+        self._memory_probe = memory_probe
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def chunk_size(self) -> int:
+        """Batch size to request from parsers; writes are assembled from chunks."""
+        return self._MINIMUM
+
+    def observe(self, rows: int, seconds: float) -> None:
+        """Adjusts the size after a write of rows took seconds."""
+        usage = self._memory_usage()
+        if usage > self._SHRINK_ABOVE_BUDGET or seconds > 2 * self._target_seconds:
+            self._resize(self._SHRINK_FACTOR)
+        elif (
+            usage < self._GROW_BELOW_BUDGET
+            and seconds < self._target_seconds / 2
+            and rows >= self._size
+        ):
+            self._resize(self._GROW_FACTOR)
+
+    def rebatch(self, chunks: Iterable[Iterable[Any]]) -> Iterator[list[Any]]:
+        """Regroups parser chunks into batches of the current size."""
+        pending: list[Any] = []
+        for chunk in chunks:
+            pending.extend(chunk)
+            if len(pending) >= self._size:
+                yield pending
+                pending = []
+        if pending:
+            yield pending
+
+    def _memory_usage(self) -> float:
+        """RSS as a fraction of the budget (0 when no budget is set)."""
+        if self._memory_budget is None or self._memory_probe is None:
+            return 0.0
+        return self._memory_probe() / self._memory_budget
+
+    def _resize(self, factor: float) -> None:
+        resized = int(self._size * factor)
+        self._size = max(self._MINIMUM, min(resized, self._MAXIMUM))
@@ -0,0 +1,48 @@
+import hashlib
+import math
+from collections.abc import Iterable
+
+_UINT64_MASK = (1 << 64) - 1
+
+
+class BloomFilter:
+    """
+    Compact set-membership test with no false negatives.
+    Positions come from blake2b rather than hash(), so a filter pickled to
+    a worker process answers exactly like the original.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+        capacity = max(capacity, 1)
+        bits = -capacity * math.log(error_rate) / math.log(2) ** 2
+        self._size = max(8, math.ceil(bits))
+        self._hashes = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+
+    @classmethod
+    def from_keys(
+        cls, keys: Iterable[str], capacity: int, error_rate: float = 0.01
+    ) -> "BloomFilter":
+        bloom = cls(capacity, error_rate)
+        for key in keys:
+            bloom.add(key)
+        return bloom
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(key)
+        )
+
+    def _positions(self, key: str) -> list[int]:
+        """Double hashing: position_i = h1 + i * h2 (mod size)."""
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        value = int.from_bytes(digest, "little")
+        first, second = value & _UINT64_MASK, (value >> 64) | 1
+        return [(first + i * second) % self._size for i in range(self._hashes)]
@@ -0,0 +1,117 @@
+from collections.abc import Iterable, Mapping
+
+from src.domain.model.edge import EdgeRow
+from src.domain.model.slack import SlackSummary, TimingRow
+from src.domain.protocol.graph_repository import GraphRepository
+
+
+class _AdjacencyGraph:
+    """Integer adjacency lists over node names, built fresh for one run."""
+
+    def __init__(self, rows: Iterable[EdgeRow]) -> None:
+        self.ids: dict[str, int] = {}
+        self.names: list[str] = []
+        self.fanout: list[list[tuple[int, float]]] = []
+        for src, dst, rise, fall in rows:
+            self.fanout[self._id(src)].append((self._id(dst), max(rise, fall)))
+
+    def _id(self, name: str) -> int:
+        if (node := self.ids.get(name)) is None:
+            node = self.ids[name] = len(self.names)
+            self.names.append(name)
+            self.fanout.append([])
+        return node
+
+
+class ComputeSlackUseCase:
+    """
+    Computes arrival, required time and slack for every constrained node.
+    Edges are read once into integer adjacency lists and ordered
+    topologically. Arrival times and logic depth (edges on the longest-delay
+    path) are propagated forward from the sources;
+    required times are propagated backward from the endpoints in one sweep
+    over the reversed order. Nodes on combinational loops are never ordered
+    and get no slack.
+    """
+
+    def __init__(self, repo: GraphRepository) -> None:
+        self._repo = repo
+
+    def execute(
+        self,
+        required_times: Mapping[str, float],
+        clock_period: float | None = None,
+    ) -> SlackSummary:
+        """
+        Endpoints are the nodes listed in required_times and, when a
+        clock_period is given, every node without fan-out (required at the
+        period unless listed).
+        """
+        graph = _AdjacencyGraph(self._repo.iter_edge_rows())
+        order = _topological_order(graph)
+        timing = _propagate_arrival(graph, order)
+
+        required: list[float | None] = [None] * len(graph.names)
+        if clock_period is not None:
+            for node in order:
+                if not graph.fanout[node]:
+                    required[node] = clock_period
+        for name, time in required_times.items():
+            if (listed := graph.ids.get(name)) is not None:
+                required[listed] = time
+        endpoints = {node for node, r in enumerate(required) if r is not None}
+        _propagate_required(graph, order, required)
+
+        rows: list[TimingRow] = [
+            (
+                graph.names[node],
+                timing[node][0],
+                required_time,
+                required_time - timing[node][0],
+                timing[node][1],
+                node in endpoints,
+            )
+            for node in order
+            if (required_time := required[node]) is not None
+        ]
+        self._repo.replace_slack_rows(rows)
+        worst = min((row[3] for row in rows), default=None)
+        return SlackSummary(len(rows), len(endpoints), worst)
+
+
+def _topological_order(graph: _AdjacencyGraph) -> list[int]:
+    indegree = [0] * len(graph.names)
+    for edges in graph.fanout:
+        for dst, _ in edges:
+            indegree[dst] += 1
+    order = [node for node, degree in enumerate(indegree) if degree == 0]
+    for node in order:  # grows while iterating
+        for dst, _ in graph.fanout[node]:
+            indegree[dst] -= 1
+            if indegree[dst] == 0:
+                order.append(dst)
+    return order
+
+
+def _propagate_arrival(
+    graph: _AdjacencyGraph, order: list[int]
+) -> list[tuple[float, int]]:
+    """(arrival, depth) per node; ties on arrival keep the deeper path."""
+    timing = [(0.0, 0)] * len(graph.names)
+    for node in order:
+        arrival, depth = timing[node]
+        for dst, delay in graph.fanout[node]:
+            timing[dst] = max(timing[dst], (arrival + delay, depth + 1))
+    return timing
+
+
+def _propagate_required(
+    graph: _AdjacencyGraph, order: list[int], required: list[float | None]
+) -> None:
+    for node in reversed(order):
+        for dst, delay in graph.fanout[node]:
+            if (downstream := required[dst]) is None:
+                continue
+            through = downstream - delay
+            current = required[node]
+            required[node] = through if current is None else min(current, through)
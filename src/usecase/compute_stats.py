@@ -0,0 +1,43 @@
+import re
+
+import numpy as np
+
+from src.domain.model.distribution import Distribution
+from src.domain.protocol.graph_repository import GraphRepository
+from src.usecase.streaming_histogram import StreamingHistogram
+
+PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+_RE_TOP_LEVEL = re.compile(r"[/.\[]")
+
+
+class ComputeStatsUseCase:
+    """
+    Histograms and percentiles of a metric over the whole graph.
+    The value range is read first, then rows are streamed in chunks that are
+    binned with NumPy and dropped, so memory stays flat on any graph size.
+    With by_prefix, rows are also grouped by the top-level hierarchy segment
+    of their node name ("u_core" for "u_core/u1.A").
+    """
+
+    def __init__(self, repo: GraphRepository, chunk_rows: int = 1 << 16) -> None:
+        self._repo = repo
+        self._chunk_rows = chunk_rows
+
+    def execute(
+        self, metric: str, bins: int = 10, by_prefix: bool = False
+    ) -> tuple[Distribution, ...]:
+        """Returns nothing when the metric has no rows."""
+        bounds = self._repo.metric_range(metric)
+        if bounds is None:
+            return ()
+        histogram = StreamingHistogram(*bounds, bins)
+        for chunk in self._repo.iter_metric_chunks(metric, self._chunk_rows):
+            names, values = zip(*chunk, strict=True)
+            groups = (
+                np.array([_RE_TOP_LEVEL.split(n, maxsplit=1)[0] for n in names])
+                if by_prefix
+                else None
+            )
+            histogram.add(np.fromiter(values, np.float64, len(values)), groups)
+        return histogram.distributions(metric, PERCENTILES)
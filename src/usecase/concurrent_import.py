@@ -0,0 +1,238 @@
+import multiprocessing
+import os
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import suppress
+from dataclasses import dataclass, field
+from pathlib import Path
+from queue import Empty
+from typing import Any
+
+from src.domain.protocol.progress_observer import ProgressObserver
+from src.usecase.adaptive_batch_sizer import AdaptiveBatchSizer
+from src.usecase.delay_prefilter import DelayPrefilter
+from src.usecase.instrumentation import run_stage
+
+# Parses one file into (kind, rows) batches, reporting bytes read to observer.
+FileParse = Callable[[Path, ProgressObserver], Iterable[tuple[str, list[Any]]]]
+
+# Receives (file index, bytes read) as the workers progress.
+FileProgress = Callable[[int, int], None]
+
+_BATCHES_IN_FLIGHT = 4  # per worker, before parsers wait for the writer
+_POLL_SECONDS = 0.5  # how long the writer waits before checking on workers
+_PROGRESS = "progress"
+_DONE = "done"
+
+# The queue back to the writer and the row filters, handed to each worker
+# process once, on start-up.
+_worker: dict[str, Any] = {}
+
+
+@dataclass(frozen=True)
+class FileSummary:
+    """
+    Rows of each kind one file sent to the writer, its wall time in a
+    worker, and rows of each kind its worker filtered out.
+    """
+
+    path: Path
+    rows: dict[str, int]
+    seconds: float
+    discarded: dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class _Tally:
+    """What the writer has learnt about one file so far."""
+
+    rows: dict[str, int] = field(default_factory=dict)
+    seconds: float = 0.0
+    discarded: dict[str, int] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class _Batch:
+    kind: str
+    rows: list[Any]
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+
+class ConcurrentFileImport:
+    """
+    Parses several files at once on a process pool and feeds every batch to
+    one writer in this process, in arrival order, so SQLite still sees a
+    single writer. The queue between them is bounded: when the writer falls
+    behind, the parsers wait instead of buffering whole files in memory.
+    With a sizer, the workers' chunks are regrouped per kind into writes of
+    its size, and every write is fed back to it. filters[kind] runs in the
+    workers, so the rows it drops never cross to this process.
+    """
+
+    def __init__(
+        self,
+        parse: FileParse,
+        workers: int | None = None,
+        on_progress: FileProgress | None = None,
+        sizer: AdaptiveBatchSizer | None = None,
+        filters: Mapping[str, DelayPrefilter] | None = None,
+    ) -> None:
+        self._parse = parse
+        self._workers = workers or os.cpu_count() or 1
+        self._on_progress = on_progress
+        self._sizer = sizer
+        self._filters = dict(filters or {})
+
+    def run(
+        self,
+        stage: str,
+        file_paths: Sequence[Path],
+        writers: Mapping[str, Callable[[list[Any]], None]],
+        observer: ProgressObserver | None = None,
+    ) -> list[FileSummary]:
+        """Writes each batch with writers[kind]; returns one summary per file."""
+        tallies = [_Tally() for _ in file_paths]
+
+        def write(batch: _Batch) -> None:
+            started = time.perf_counter()
+            writers[batch.kind](batch.rows)
+            if self._sizer:
+                self._sizer.observe(len(batch), time.perf_counter() - started)
+
+        workers = min(self._workers, len(file_paths))
+        queue = multiprocessing.get_context().Queue(_BATCHES_IN_FLIGHT * workers)
+        with ProcessPoolExecutor(
+            workers, initializer=_attach, initargs=(queue, self._filters)
+        ) as pool:
+            futures = [
+                pool.submit(_parse_file, self._parse, index, path)
+                for index, path in enumerate(file_paths)
+            ]
+            batches = self._receive(queue, futures, tallies)
+            if self._sizer:
+                batches = _regrouped(batches, self._sizer)
+            try:
+                run_stage(stage, batches, write, observer)
+            except BaseException:
+                _drain(queue, futures)
+                raise
+            for future in futures:
+                future.result()  # re-raises a worker's parse error
+        return [
+            FileSummary(path, tally.rows, tally.seconds, tally.discarded)
+            for path, tally in zip(file_paths, tallies, strict=True)
+        ]
+
+    def _receive(
+        self, queue: Any, futures: Sequence[Future[None]], tallies: list[_Tally]
+    ) -> Iterator[_Batch]:
+        """
+        Yields row batches until every file has reported that it is done,
+        tallying each file's rows of every kind as they arrive.
+        A worker that dies never reports, so while the queue is idle the
+        futures of pending files are checked and their error (for instance
+        BrokenProcessPool) is raised here instead of waiting forever.
+        """
+        pending = set(range(len(futures)))
+        while pending:
+            try:
+                file_index, kind, payload = queue.get(timeout=_POLL_SECONDS)
+            except Empty:
+                _raise_worker_error(futures[i] for i in pending)
+                continue
+            if kind == _PROGRESS:
+                if self._on_progress:
+                    self._on_progress(file_index, payload)
+            elif kind == _DONE:
+                tally = tallies[file_index]
+                tally.seconds, tally.discarded = payload
+                pending.discard(file_index)
+            else:
+                counts = tallies[file_index].rows
+                counts[kind] = counts.get(kind, 0) + len(payload)
+                yield _Batch(kind, payload)
+
+
+class _QueueProgress:
+    """Forwards a worker's progress to the writer's process."""
+
+    def __init__(self, file_index: int) -> None:
+        self._file_index = file_index
+
+    def update(self, increment: int) -> None:
+        _worker["queue"].put((self._file_index, _PROGRESS, increment))
+
+    def set_description(self, description: str) -> None:
+        pass
+
+    def stage_started(self, stage: str) -> None:
+        pass
+
+    def stage_finished(self, stage: str, rows: int) -> None:
+        pass
+
+    def record_timing(self, category: str, seconds: float, rows: int = 0) -> None:
+        pass
+
+
+def _regrouped(
+    batches: Iterable[_Batch], sizer: AdaptiveBatchSizer
+) -> Iterator[_Batch]:
+    """Merges the chunks of each kind into batches of the sizer's size."""
+    pending: dict[str, list[Any]] = {}
+    for batch in batches:
+        rows = pending.setdefault(batch.kind, [])
+        rows.extend(batch.rows)
+        if len(rows) >= sizer.size:
+            yield _Batch(batch.kind, pending.pop(batch.kind))
+    for kind, rows in pending.items():
+        yield _Batch(kind, rows)
+
+
+def _raise_worker_error(futures: Iterable[Future[None]]) -> None:
+    for future in futures:
+        if future.done() and (error := future.exception()) is not None:
+            raise error
+
+
+def _drain(queue: Any, futures: Sequence[Future[None]]) -> None:
+    """Unblocks and stops the parsers after the writer has failed."""
+    for future in futures:
+        future.cancel()
+    while not all(future.done() for future in futures):
+        with suppress(Empty):
+            queue.get(timeout=0.1)
+
+
+def _attach(queue: Any, filters: dict[str, DelayPrefilter]) -> None:
+    _worker["queue"] = queue
+    _worker["filters"] = filters
+
+
+def _parse_file(parse: FileParse, file_index: int, path: Path) -> None:
+    """
+    Sends the batches of one file that survive the filters, then "done"
+    with the rows they dropped, even if parsing fails.
+    """
+    started = time.perf_counter()
+    queue, filters = _worker["queue"], _worker["filters"]
+    discarded_before = {kind: f.discarded for kind, f in filters.items()}
+    try:
+        for kind, rows in parse(path, _QueueProgress(file_index)):
+            kept = filters[kind].apply(rows) if kind in filters else rows
+            if kept:
+                queue.put((file_index, kind, kept))
+    finally:
+        elapsed = time.perf_counter() - started
+        discarded = {
+            kind: f.discarded - discarded_before[kind] for kind, f in filters.items()
+        }
+        queue.put((file_index, _DONE, (elapsed, discarded)))
+
+
+def tagged(kind: str, batches: Iterable[list[Any]]) -> Iterator[tuple[str, list[Any]]]:
+    """Labels every batch with the writer it is meant for."""
+    return ((kind, rows) for rows in batches)
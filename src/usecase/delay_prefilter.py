@@ -0,0 +1,46 @@
+from collections.abc import Callable, Container, Iterable, Iterator
+from operator import itemgetter
+from typing import Any
+
+from src.domain.protocol.graph_repository import GraphRepository
+from src.usecase.bloom_filter import BloomFilter
+
+
+class DelayPrefilter:
+    """
+    Drops SDF delay rows whose destination pin is not the source of any
+    stored edge, before they are staged and joined by the repository.
+    The key set may be approximate (a bloom filter): rows it lets through
+    by mistake simply update nothing. key picks the pin of a row to look
+    up; for cell arcs it is the arc's output pin.
+    """
+
+    def __init__(
+        self, keys: Container[str], key: Callable[[Any], str] = itemgetter(1)
+    ) -> None:
+        self._keys = keys
+        self._key = key
+        self.kept = 0
+        self.discarded = 0
+
+    @classmethod
+    def from_repository(
+        cls,
+        repo: GraphRepository,
+        error_rate: float = 0.01,
+        key: Callable[[Any], str] = itemgetter(1),
+    ) -> "DelayPrefilter":
+        capacity = repo.count_edge_sources()
+        keys = BloomFilter.from_keys(repo.iter_edge_sources(), capacity, error_rate)
+        return cls(keys, key)
+
+    def apply(self, rows: list[Any]) -> list[Any]:
+        kept = [row for row in rows if self._key(row) in self._keys]
+        self.kept += len(kept)
+        self.discarded += len(rows) - len(kept)
+        return kept
+
+    def filter_batches(self, batches: Iterable[list[Any]]) -> Iterator[list[Any]]:
+        for rows in batches:
+            if kept := self.apply(rows):
+                yield kept
@@ -0,0 +1,44 @@
+from collections.abc import Iterable
+
+from src.domain.model.cell_arc import CellArcRow, DelayTemplateRow, InstanceArcRow
+
+_TemplateKey = tuple[str, str, str, float, float]
+
+
+class DelayTemplateRegistry:
+    """
+    Assigns one ID per distinct (cell type, from pin, to pin, rise, fall).
+    Instances of a cell type mostly share their arc delays, so each distinct
+    tuple is stored once and every instance arc only references its ID.
+    """
+
+    def __init__(self, next_id: int = 1) -> None:
+        self._ids: dict[_TemplateKey, int] = {}
+        self._next_id = next_id
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[DelayTemplateRow]) -> "DelayTemplateRegistry":
+        """Seeds the registry with templates stored by a previous import."""
+        registry = cls()
+        for template_id, cell, from_pin, to_pin, rise, fall in rows:
+            registry._ids[(cell, from_pin, to_pin, rise, fall)] = template_id
+            registry._next_id = max(registry._next_id, template_id + 1)
+        return registry
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def register(
+        self, rows: Iterable[CellArcRow]
+    ) -> tuple[list[DelayTemplateRow], list[InstanceArcRow]]:
+        """Returns the templates not seen before and one arc row per input row."""
+        new_templates: list[DelayTemplateRow] = []
+        arcs: list[InstanceArcRow] = []
+        for instance, cell, from_pin, to_pin, rise, fall in rows:
+            template = (cell, from_pin, to_pin, rise, fall)
+            if (template_id := self._ids.get(template)) is None:
+                template_id = self._ids[template] = self._next_id
+                new_templates.append((template_id, *template))
+                self._next_id += 1
+            arcs.append((instance, template_id))
+        return new_templates, arcs
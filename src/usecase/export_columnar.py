@@ -0,0 +1,41 @@
+from src.domain.protocol.columnar_export import ColumnarWriter
+from src.domain.protocol.graph_repository import GraphRepository
+from src.domain.protocol.progress_observer import ProgressObserver
+from src.usecase.instrumentation import run_stage
+
+
+class ExportColumnarUseCase:
+    """Streams node names and ID-numbered edges into a columnar writer."""
+
+    def __init__(
+        self,
+        repo: GraphRepository,
+        writer: ColumnarWriter,
+        chunk_rows: int = 1 << 16,
+    ) -> None:
+        self._repo = repo
+        self._writer = writer
+        self._chunk_rows = chunk_rows
+
+    def execute(self, observer: ProgressObserver | None = None) -> tuple[int, int]:
+        """Returns the (nodes, edges) counts exported."""
+        with self._repo.columnar_snapshot() as source:
+            self._writer.allocate(
+                source.node_count, source.edge_count, source.name_bytes
+            )
+            try:
+                nodes = run_stage(
+                    "export_names",
+                    source.iter_names(self._chunk_rows),
+                    self._writer.write_names,
+                    observer,
+                )
+                edges = run_stage(
+                    "export_edges",
+                    source.iter_edges(self._chunk_rows),
+                    self._writer.write_edges,
+                    observer,
+                )
+            finally:
+                self._writer.close()
+        return nodes, edges
@@ -0,0 +1,169 @@
+import sys
+from array import array
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from itertools import compress
+from pathlib import Path
+
+import numpy as np
+
+from src.domain.model.cell_arc import CellArcRow, output_pin, split_pin
+from src.domain.model.edge import EdgeRow
+from src.domain.protocol.progress_observer import ProgressObserver
+from src.domain.protocol.sdf_parser import SDFParser
+from src.domain.protocol.verilog_parser import VerilogParser
+from src.usecase.import_sdf import writing_cell_arcs
+from src.usecase.instrumentation import observed_stage, run_stage
+
+_GLOB_WILDCARDS = "*?["
+_BATCH_SIZE = 100000
+
+
+@dataclass(frozen=True)
+class FaninCone:
+    """Pin and net names feeding the endpoints; endpoints matching nothing."""
+
+    names: frozenset[str]
+    missing: tuple[str, ...] = ()
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.names
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+class ConnectivityIndex:
+    """
+    Driver-to-load links between interned integer IDs, with no delays.
+    The name dict (whose insertion order gives the IDs) is the bulk of it,
+    at roughly the size of the names plus a hundred bytes each; links are
+    two packed integer columns and driver flags one byte per name.
+    """
+
+    def __init__(self) -> None:
+        self._ids: dict[str, int] = {}
+        self._drivers = array("q")
+        self._loads = array("q")
+        self._is_driver = bytearray()
+
+    def add_interconnects(self, rows: list[EdgeRow]) -> None:
+        """SDF INTERCONNECT rows run from the driver to the load pin."""
+        for src, dst, _, _ in rows:
+            driver = self._id(src)
+            self._is_driver[driver] = True
+            self._link(driver, self._id(dst))
+
+    def add_cell_arcs(self, rows: list[CellArcRow]) -> None:
+        """IOPATH arcs run from an input to an output pin of one instance."""
+        for row in rows:
+            output = self._id(output_pin(row))
+            self._is_driver[output] = True
+            self._link(self._id(f"{row[0]}.{row[2]}"), output)
+
+    def add_netlist_edges(self, rows: list[EdgeRow]) -> None:
+        """
+        A pin-to-net edge has no direction: the pin drives the net when the
+        SDF already named it as a driver, and loads it otherwise. Add the
+        netlist after the SDF for that reason. An assign edge joins two
+        nets and already runs from the driving net to the loaded one.
+        """
+        for src, dst, _, _ in rows:
+            src_id, dst_id = self._id(src), self._id(dst)
+            if self._is_driver[src_id] or not split_pin(src)[0]:
+                self._link(src_id, dst_id)
+            else:
+                self._link(dst_id, src_id)
+
+    def fanin_cone(self, endpoints: Sequence[str]) -> FaninCone:
+        """Walks the links backwards, one whole frontier per NumPy step."""
+        starts: set[int] = set()
+        missing: list[str] = []
+        for endpoint in endpoints:
+            matches = self._match(endpoint)
+            starts.update(matches)
+            if not matches:
+                missing.append(endpoint)
+
+        loads = np.frombuffer(self._loads, dtype=np.int64)
+        drivers = np.frombuffer(self._drivers, dtype=np.int64)
+        drivers = drivers[np.argsort(loads, kind="stable")]
+        offsets = np.zeros(len(self._ids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(loads, minlength=len(self._ids)), out=offsets[1:])
+
+        in_cone = np.zeros(len(self._ids), dtype=bool)
+        frontier = np.fromiter(starts, dtype=np.int64, count=len(starts))
+        in_cone[frontier] = True
+        while len(frontier):
+            first = offsets[frontier]
+            counts = offsets[frontier + 1] - first
+            skip = np.repeat(np.cumsum(counts) - counts - first, counts)
+            frontier = np.unique(drivers[np.arange(counts.sum()) - skip])
+            frontier = frontier[~in_cone[frontier]]
+            in_cone[frontier] = True
+
+        names = frozenset(compress(self._ids, in_cone.tolist()))
+        return FaninCone(names, tuple(missing))
+
+    def _match(self, endpoint: str) -> list[int]:
+        if not any(c in endpoint for c in _GLOB_WILDCARDS):
+            node_id = self._ids.get(endpoint)
+            return [] if node_id is None else [node_id]
+        return [
+            node_id
+            for node_id, name in enumerate(self._ids)
+            if fnmatchcase(name, endpoint)
+        ]
+
+    def _id(self, name: str) -> int:
+        node_id = self._ids.get(name)
+        if node_id is None:
+            node_id = self._ids[sys.intern(name)] = len(self._ids)
+            self._is_driver.append(False)
+        return node_id
+
+    def _link(self, driver: int, load: int) -> None:
+        self._drivers.append(driver)
+        self._loads.append(load)
+
+
+class BuildFaninConeUseCase:
+    """
+    First, cheap pass of a cone-restricted import: only connectivity is
+    read, into a ConnectivityIndex, and nothing reaches the database. The
+    netlist alone has no pin directions, so they come from the SDF, whose
+    interconnects and IOPATH arcs are read together in one pass per file.
+    """
+
+    def __init__(self, verilog_parser: VerilogParser, sdf_parser: SDFParser) -> None:
+        self._verilog_parser = verilog_parser
+        self._sdf_parser = sdf_parser
+
+    def execute(
+        self,
+        endpoints: Sequence[str],
+        verilog_paths: Iterable[Path],
+        sdf_paths: Iterable[Path],
+        observer: ProgressObserver | None = None,
+    ) -> FaninCone:
+        index = ConnectivityIndex()
+        if observer:
+            observer.set_description("Indexing SDF Connectivity...")
+        for path in sdf_paths:
+            pairs = self._sdf_parser.parse_delay_and_cell_arc_rows(
+                path, _BATCH_SIZE, observer
+            )
+            interconnects = writing_cell_arcs(pairs, index.add_cell_arcs)
+            run_stage("index_sdf", interconnects, index.add_interconnects, observer)
+
+        if observer:
+            observer.set_description("Indexing Netlist Connectivity...")
+        for path in verilog_paths:
+            edges = self._verilog_parser.parse_edge_rows(path, _BATCH_SIZE, observer)
+            run_stage("index_netlist", edges, index.add_netlist_edges, observer)
+
+        if observer:
+            observer.set_description("Tracing Fan-in Cone...")
+        with observed_stage("trace_fanin_cone", observer):
+            return index.fanin_cone(endpoints)
@@ -0,0 +1,11 @@
+from src.domain.protocol.graph_repository import GraphRepository
+
+
+class FindNodesUseCase:
+    """UseCase to list node names matching a glob pattern."""
+
+    def __init__(self, repo: GraphRepository) -> None:
+        self._repo = repo
+
+    def execute(self, pattern: str, limit: int | None = None) -> tuple[str, ...]:
+        return self._repo.find_nodes(pattern, limit)
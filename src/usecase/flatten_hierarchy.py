@@ -0,0 +1,152 @@
+from collections.abc import Iterator
+from itertools import islice
+
+from src.domain.model.bus import split_bit_name
+from src.domain.model.edge import EdgeRow
+from src.domain.model.module_definition import ModuleDefinition
+from src.domain.protocol.graph_repository import GraphRepository
+from src.domain.protocol.progress_observer import ProgressObserver
+from src.usecase.instrumentation import observed_stage, run_stage
+
+_HIERARCHY_SEPARATOR = "/"
+
+
+class FlattenHierarchyUseCase:
+    """
+    Materializes stored module definitions into flat edges, for the whole
+    design or only for one sub-block. Module definitions are loaded once and
+    cached, so the cost of expanding N instances of a module is one load
+    plus the rows actually written. Flattening again adds only missing
+    edges, so delays imported in between are kept.
+    """
+
+    def __init__(self, repo: GraphRepository, batch_size: int = 100000) -> None:
+        self._repo = repo
+        self._batch_size = batch_size
+        self._known: frozenset[str] | None = None
+        self._cache: dict[str, ModuleDefinition] = {}
+
+    def execute(
+        self,
+        top: str | None = None,
+        block: str | None = None,
+        observer: ProgressObserver | None = None,
+    ) -> int:
+        """
+        Writes the edges below block (an instance path such as "u_core/u_alu")
+        of top, named with "/"-joined instance prefixes; returns the row count.
+        The block's ports take the names of the nets they connect to above
+        it, so its edges match those of a full flatten.
+        """
+        module, prefix, ports = self._locate(top or self._find_top(), block)
+        if observer:
+            observer.set_description("Flattening Hierarchy...")
+
+        with self._repo.bulk_mode():
+            rows = self._flatten(module, prefix, ports)
+            written = run_stage(
+                "flatten", self._batched(rows), self._repo.save_new_edge_rows, observer
+            )
+            with observed_stage("build_node_lookup", observer):
+                self._repo.build_node_lookup()
+        return written
+
+    def _find_top(self) -> str:
+        """The top is the only module that no other module instantiates."""
+        names = self._known_modules()
+        used = {cell for name in names for _, cell in self._module(name).instances}
+        tops = sorted(names - used)
+        if len(tops) != 1:
+            raise ValueError(f"Cannot infer the top module from {tops}; pass top")
+        return tops[0]
+
+    def _locate(
+        self, top: str, block: str | None
+    ) -> tuple[ModuleDefinition, str, dict[str, str]]:
+        """The block's module, its name prefix and its port bindings."""
+        if top not in self._known_modules():
+            raise ValueError(f"Module not found: {top}")
+        module, prefix = self._module(top), ""
+        ports: dict[str, str] = {}
+        for instance in block.split(_HIERARCHY_SEPARATOR) if block else ():
+            cell = dict(module.instances).get(instance)
+            if cell not in self._known_modules():
+                raise ValueError(f"No module instance {instance} in {module.name}")
+            ports = _port_bindings(module, instance, prefix, ports)
+            module = self._module(cell)
+            prefix += instance + _HIERARCHY_SEPARATOR
+        return module, prefix, ports
+
+    def _flatten(
+        self, module: ModuleDefinition, prefix: str, ports: dict[str, str]
+    ) -> Iterator[EdgeRow]:
+        """
+        Yields module's edges under prefix. Pins of sub-module instances are
+        not edges but port bindings: inside the child, the port net is the
+        parent's net.
+        """
+        children = {
+            name: self._module(cell)
+            for name, cell in module.instances
+            if cell in self._known_modules()
+        }
+        bindings: dict[str, dict[str, str]] = {name: {} for name in children}
+
+        for src, dst, rise, fall in module.edges:
+            instance, _, pin = src.partition(".")
+            if pin and instance in bindings:
+                bindings[instance][pin] = _qualify(dst, prefix, ports)
+                continue
+            yield (
+                _qualify(src, prefix, ports),
+                _qualify(dst, prefix, ports),
+                rise,
+                fall,
+            )
+
+        for name, child in children.items():
+            yield from self._flatten(
+                child, prefix + name + _HIERARCHY_SEPARATOR, bindings[name]
+            )
+
+    def _batched(self, rows: Iterator[EdgeRow]) -> Iterator[list[EdgeRow]]:
+        while batch := list(islice(rows, self._batch_size)):
+            yield batch
+
+    def _known_modules(self) -> frozenset[str]:
+        if self._known is None:
+            self._known = frozenset(self._repo.module_names())
+        return self._known
+
+    def _module(self, name: str) -> ModuleDefinition:
+        if name not in self._cache:
+            module = self._repo.load_module(name)
+            if module is None:
+                raise ValueError(f"Module not found: {name}")
+            self._cache[name] = module
+        return self._cache[name]
+
+
+def _port_bindings(
+    module: ModuleDefinition, instance: str, prefix: str, ports: dict[str, str]
+) -> dict[str, str]:
+    """Port nets of one instance in module, named as module is flattened."""
+    bindings: dict[str, str] = {}
+    for src, dst, _, _ in module.edges:
+        name, _, pin = src.partition(".")
+        if pin and name == instance:
+            bindings[pin] = _qualify(dst, prefix, ports)
+    return bindings
+
+
+def _qualify(name: str, prefix: str, ports: dict[str, str]) -> str:
+    return _bound_name(name, ports) or prefix + name
+
+
+def _bound_name(name: str, ports: dict[str, str]) -> str | None:
+    """Maps a port net (or one bit of a port bus) to the parent's net."""
+    if name in ports:
+        return ports[name]
+    if (split := split_bit_name(name)) and split[0] in ports:
+        return f"{ports[split[0]]}[{split[1]}]"
+    return None
@@ -0,0 +1,102 @@
+from collections.abc import Container
+from dataclasses import dataclass
+
+from src.domain.model.cell_arc import CellArcRow, output_pin
+from src.domain.protocol.graph_repository import GraphRepository
+from src.domain.protocol.progress_observer import ProgressObserver
+from src.usecase.concurrent_import import FileSummary
+from src.usecase.delay_prefilter import DelayPrefilter
+from src.usecase.delay_template_registry import DelayTemplateRegistry
+from src.usecase.instrumentation import observed_stage
+
+
+@dataclass(frozen=True)
+class CellArcImportSummary:
+    """
+    Instance arcs written, distinct delay templates they reference and arcs
+    dropped by the prefilter; with several files, also the arcs each sent.
+    """
+
+    arcs: int
+    templates: int
+    files: tuple[FileSummary, ...] = ()
+    discarded: int = 0
+
+
+class CellArcWriter:
+    """
+    Writes the IOPATH arc batches of one import run and counts them, so
+    that a pass reading interconnects as well can write arcs as it goes.
+    """
+
+    def __init__(
+        self,
+        repo: GraphRepository,
+        registry: DelayTemplateRegistry,
+        prefilter: DelayPrefilter | None = None,
+    ) -> None:
+        self._repo = repo
+        self._registry = registry
+        self._prefilter = prefilter
+        self.written = 0
+
+    def __call__(self, rows: list[CellArcRow]) -> None:
+        if self._prefilter:
+            rows = self._prefilter.apply(rows)
+        if not rows:
+            return
+        new_templates, arcs = self._registry.register(rows)
+        if new_templates:
+            self._repo.save_delay_template_rows(new_templates)
+        self._repo.save_cell_arc_rows(arcs)
+        self.written += len(rows)
+
+    def summary(self, files: tuple[FileSummary, ...] = ()) -> CellArcImportSummary:
+        """Counts the arcs dropped here and those the workers of files dropped."""
+        discarded = self._prefilter.discarded if self._prefilter else 0
+        discarded += sum(file.discarded.get("arcs", 0) for file in files)
+        return CellArcImportSummary(self.written, len(self._registry), files, discarded)
+
+
+class ImportCellArcsUseCase:
+    """
+    Imports IOPATH cell arcs as per-instance references to delay templates,
+    through writers handed to ImportSDFUseCase, which reads the arcs in the
+    same pass as the interconnects. With prefilter=True, arcs whose output
+    pin has no stored edge are dropped, so a cone-restricted netlist keeps
+    only the arcs of its cone; given the cone's names instead, arcs are kept
+    exactly when their output pin is one of them.
+    """
+
+    def __init__(
+        self, repo: GraphRepository, prefilter: bool | Container[str] = False
+    ) -> None:
+        self._repo = repo
+        self._prefilter = prefilter
+        self._registry: DelayTemplateRegistry | None = None
+
+    @property
+    def registry(self) -> DelayTemplateRegistry:
+        """Every delay template known, including those of earlier imports."""
+        if self._registry is None:
+            self._registry = DelayTemplateRegistry.from_rows(
+                self._repo.load_delay_template_rows()
+            )
+        return self._registry
+
+    def writer(self, prefilter: DelayPrefilter | None = None) -> CellArcWriter:
+        """A writer for one run, dropping the arcs prefilter rejects."""
+        return CellArcWriter(self._repo, self.registry, prefilter)
+
+    def build_prefilter(
+        self, observer: ProgressObserver | None = None
+    ) -> DelayPrefilter | None:
+        """The arc prefilter this import is configured with; None if disabled."""
+        if not isinstance(self._prefilter, bool):
+            return DelayPrefilter(self._prefilter, key=output_pin)
+        if not self._prefilter:
+            return None
+        if observer:
+            observer.set_description("Loading Edge Keys...")
+        with observed_stage("build_arc_prefilter", observer):
+            return DelayPrefilter.from_repository(self._repo, key=output_pin)
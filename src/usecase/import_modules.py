@@ -0,0 +1,29 @@
+from pathlib import Path
+
+from src.domain.protocol.graph_repository import GraphRepository
+from src.domain.protocol.progress_observer import ProgressObserver
+from src.domain.protocol.verilog_parser import VerilogParser
+from src.usecase.instrumentation import observed_stage
+
+
+class ImportModulesUseCase:
+    """
+    Stores a hierarchical netlist as module definitions only.
+    Each module's graph is written once, however often it is instantiated;
+    FlattenHierarchyUseCase expands instances into edges on request.
+    """
+
+    def __init__(self, repo: GraphRepository, parser: VerilogParser) -> None:
+        self._repo = repo
+        self._parser = parser
+
+    def execute(self, file_path: Path, observer: ProgressObserver | None = None) -> int:
+        if observer:
+            observer.set_description("Importing Modules...")
+
+        count = 0
+        with self._repo.bulk_mode(), observed_stage("import_modules", observer):
+            for module in self._parser.parse_modules(file_path, observer=observer):
+                self._repo.save_module(module)
+                count += 1
+        return count
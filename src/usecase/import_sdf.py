@@ -1,23 +1,182 @@
+from collections.abc import Callable, Container, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
+from typing import Any
 
+from src.domain.model.cell_arc import CellArcRow
+from src.domain.model.edge import EdgeRow
 from src.domain.protocol.graph_repository import GraphRepository
 from src.domain.protocol.progress_observer import ProgressObserver
 from src.domain.protocol.sdf_parser import SDFParser
+from src.usecase.adaptive_batch_sizer import AdaptiveBatchSizer
+from src.usecase.concurrent_import import (
+    ConcurrentFileImport,
+    FileProgress,
+    FileSummary,
+    tagged,
+)
+from src.usecase.delay_prefilter import DelayPrefilter
+from src.usecase.import_cell_arcs import CellArcImportSummary, ImportCellArcsUseCase
+from src.usecase.instrumentation import observed_stage, run_stage
+
+
+@dataclass(frozen=True)
+class DelayImportSummary:
+    """
+    Rows handed to the repository and rows dropped by the prefilter; with
+    several files, also the rows each sent to the writer. cell_arcs
+    summarizes the IOPATH arcs read in the same pass, when asked for.
+    """
+
+    written: int
+    discarded: int = 0
+    files: tuple[FileSummary, ...] = ()
+    cell_arcs: CellArcImportSummary | None = None
 
 
 class ImportSDFUseCase:
-    def __init__(self, repo: GraphRepository, parser: SDFParser) -> None:
+    """
+    Imports INTERCONNECT delays onto the stored edges. Given cell_arcs, the
+    IOPATH arcs are written by it from the same single read of each file.
+    prefilter=True drops rows whose load pin has no stored edge, through a
+    bloom filter of the edges; given the names themselves (the fan-in cone
+    a netlist was imported with), rows are kept exactly when the load pin
+    is one of them, with no scan of the database.
+    """
+
+    def __init__(
+        self,
+        repo: GraphRepository,
+        parser: SDFParser,
+        sizer: AdaptiveBatchSizer | None = None,
+        prefilter: bool | Container[str] = False,
+        cell_arcs: ImportCellArcsUseCase | None = None,
+    ) -> None:
         self._repo = repo
         self._parser = parser
+        self._sizer = sizer
+        self._prefilter = prefilter
+        self._cell_arcs = cell_arcs
 
     def execute(
         self, file_path: Path, observer: ProgressObserver | None = None
-    ) -> None:
+    ) -> DelayImportSummary:
+        prefilter = self._build_prefilter(observer)
+        arc_writer = None
+        if self._cell_arcs:
+            arc_writer = self._cell_arcs.writer(
+                self._cell_arcs.build_prefilter(observer)
+            )
+
         if observer:
             observer.set_description("Importing Delays...")
 
+        batch_size = self._sizer.chunk_size if self._sizer else 100000
+        with self._repo.bulk_mode():
+            if arc_writer is None:
+                batches = self._parser.parse_delay_rows(
+                    file_path, batch_size=batch_size, observer=observer
+                )
+            else:
+                pairs = self._parser.parse_delay_and_cell_arc_rows(
+                    file_path, batch_size=batch_size, observer=observer
+                )
+                batches = writing_cell_arcs(pairs, arc_writer)
+            if prefilter:
+                batches = prefilter.filter_batches(batches)
+            written = run_stage(
+                "import_delays",
+                batches,
+                self._repo.update_edge_delay_rows,
+                observer,
+                self._sizer,
+            )
+
+        discarded = prefilter.discarded if prefilter else 0
+        if observer and prefilter:
+            observer.record_timing("prefilter:discarded", 0.0, discarded)
+        arcs = arc_writer.summary() if arc_writer else None
+        return DelayImportSummary(written, discarded, cell_arcs=arcs)
+
+    def execute_many(
+        self,
+        file_paths: Sequence[Path],
+        workers: int | None = None,
+        on_progress: FileProgress | None = None,
+        observer: ProgressObserver | None = None,
+    ) -> DelayImportSummary:
+        """
+        Parses and prefilters the SDFs concurrently; the prefilters are built
+        once and copied to each worker, so dropped rows never reach this
+        process, which writes the rest.
+        """
+        filters: dict[str, DelayPrefilter] = {}
+        if prefilter := self._build_prefilter(observer):
+            filters["delays"] = prefilter
+        writers: dict[str, Callable[[list[Any]], None]] = {
+            "delays": self._repo.update_edge_delay_rows
+        }
+        if self._cell_arcs:
+            if arc_prefilter := self._cell_arcs.build_prefilter(observer):
+                filters["arcs"] = arc_prefilter
+            writers["arcs"] = arc_writer = self._cell_arcs.writer()
+        batch_size = self._sizer.chunk_size if self._sizer else 100000
+        parse_file = parse_sdf_timing_file if self._cell_arcs else parse_sdf_file
+        parse = partial(parse_file, self._parser, batch_size)
+
         with self._repo.bulk_mode():
-            for batch in self._parser.parse_delays(
-                file_path, batch_size=100000, observer=observer
-            ):
-                self._repo.update_edges_delay_batch(batch)
+            importer = ConcurrentFileImport(
+                parse, workers, on_progress, self._sizer, filters
+            )
+            files = importer.run("import_delay_files", file_paths, writers, observer)
+
+        written = sum(file.rows.get("delays", 0) for file in files)
+        discarded = sum(file.discarded.get("delays", 0) for file in files)
+        if observer and prefilter:
+            observer.record_timing("prefilter:discarded", 0.0, discarded)
+        arcs = arc_writer.summary(tuple(files)) if self._cell_arcs else None
+        return DelayImportSummary(written, discarded, tuple(files), arcs)
+
+    def _build_prefilter(
+        self, observer: ProgressObserver | None
+    ) -> DelayPrefilter | None:
+        if not isinstance(self._prefilter, bool):
+            return DelayPrefilter(self._prefilter)
+        if not self._prefilter:
+            return None
+        if observer:
+            observer.set_description("Loading Edge Keys...")
+        with observed_stage("build_prefilter", observer):
+            return DelayPrefilter.from_repository(self._repo)
+
+
+def parse_sdf_file(
+    parser: SDFParser, batch_size: int, path: Path, observer: ProgressObserver
+) -> Iterator[tuple[str, list[EdgeRow]]]:
+    batches = parser.parse_delay_rows(path, batch_size=batch_size, observer=observer)
+    return tagged("delays", batches)
+
+
+def parse_sdf_timing_file(
+    parser: SDFParser, batch_size: int, path: Path, observer: ProgressObserver
+) -> Iterator[tuple[str, list[Any]]]:
+    """Delays and IOPATH arcs from one read of the file."""
+    pairs = parser.parse_delay_and_cell_arc_rows(
+        path, batch_size=batch_size, observer=observer
+    )
+    for delays, arcs in pairs:
+        yield "delays", delays
+        yield "arcs", arcs
+
+
+def writing_cell_arcs(
+    pairs: Iterable[tuple[list[EdgeRow], list[CellArcRow]]],
+    write_arcs: Callable[[list[CellArcRow]], None],
+) -> Iterator[list[EdgeRow]]:
+    """Writes each arc batch as it is read and passes the delays on."""
+    for delays, arcs in pairs:
+        if arcs:
+            write_arcs(arcs)
+        if delays:
+            yield delays
@@ -1,14 +1,42 @@
+from collections.abc import Callable, Container, Iterator, Sequence
+from functools import partial
 from pathlib import Path
+from typing import Any
 
+from src.domain.model.edge import EdgeRow
+from src.domain.model.node import NodeRow
 from src.domain.protocol.graph_repository import GraphRepository
 from src.domain.protocol.progress_observer import ProgressObserver
 from src.domain.protocol.verilog_parser import VerilogParser
+from src.usecase.adaptive_batch_sizer import AdaptiveBatchSizer
+from src.usecase.concurrent_import import (
+    ConcurrentFileImport,
+    FileProgress,
+    FileSummary,
+    tagged,
+)
+from src.usecase.instrumentation import observed_stage, run_stage
+from src.usecase.node_registry import NodeRegistry
 
 
 class ImportVerilogUseCase:
-    def __init__(self, repo: GraphRepository, parser: VerilogParser) -> None:
+    """
+    Imports a flat netlist's nodes and edges. Given a FaninCone, only the
+    nodes in it and the edges leaving its pins are written. Each run numbers
+    its nodes through a NodeRegistry, so repeated names stay out of SQLite.
+    """
+
+    def __init__(
+        self,
+        repo: GraphRepository,
+        parser: VerilogParser,
+        sizer: AdaptiveBatchSizer | None = None,
+        cone: Container[str] | None = None,
+    ) -> None:
         self._repo = repo
         self._parser = parser
+        self._sizer = sizer
+        self._cone = cone
 
     def execute(
         self, file_path: Path, observer: ProgressObserver | None = None
@@ -16,11 +44,75 @@ class ImportVerilogUseCase:
         if observer:
             observer.set_description("Importing Nodes...")
 
-        for batch in self._parser.parse_nodes(file_path, observer=observer):
-            self._repo.save_nodes_batch(batch)
+        nodes = self._parser.parse_node_rows(file_path, **self._parse_options(observer))
+        save_nodes = partial(self._save_nodes, self._node_registry())
+        run_stage("import_nodes", nodes, save_nodes, observer, self._sizer)
+        self._repo.save_bus_rows(self._parser.bus_rows())
 
         if observer:
             observer.set_description("Importing Edges...")
 
-        for batch in self._parser.parse_edges(file_path, observer=observer):
-            self._repo.save_edges_batch(batch)
+        edges = self._parser.parse_edge_rows(file_path, **self._parse_options(observer))
+        run_stage("import_edges", edges, self._save_edges, observer, self._sizer)
+
+        if observer:
+            observer.set_description("Indexing Names...")
+
+        with observed_stage("build_node_lookup", observer):
+            self._repo.build_node_lookup()
+
+    def execute_many(
+        self,
+        file_paths: Sequence[Path],
+        workers: int | None = None,
+        on_progress: FileProgress | None = None,
+        observer: ProgressObserver | None = None,
+    ) -> list[FileSummary]:
+        """
+        Parses the netlists concurrently; this process writes every batch.
+        Names shared by several files become one node.
+        """
+        parse = partial(parse_verilog_file, self._parser, self._batch_size())
+        writers: dict[str, Callable[[list[Any]], None]] = {
+            "nodes": partial(self._save_nodes, self._node_registry()),
+            "buses": self._repo.save_bus_rows,
+            "edges": self._save_edges,
+        }
+        importer = ConcurrentFileImport(parse, workers, on_progress, self._sizer)
+        summaries = importer.run("import_verilog_files", file_paths, writers, observer)
+
+        with observed_stage("build_node_lookup", observer):
+            self._repo.build_node_lookup()
+        return summaries
+
+    def _node_registry(self) -> NodeRegistry:
+        return NodeRegistry(self._repo.next_node_id())
+
+    def _save_nodes(self, registry: NodeRegistry, rows: list[NodeRow]) -> None:
+        if self._cone is not None:
+            rows = [row for row in rows if row[0] in self._cone]
+        if new_nodes := registry.register(rows):
+            self._repo.save_node_id_rows(new_nodes)
+
+    def _save_edges(self, rows: list[EdgeRow]) -> None:
+        if self._cone is not None:
+            rows = [row for row in rows if row[0] in self._cone]
+        if rows:
+            self._repo.save_edge_rows(rows)
+
+    def _parse_options(self, observer: ProgressObserver | None) -> dict[str, Any]:
+        if self._sizer:
+            return {"batch_size": self._sizer.chunk_size, "observer": observer}
+        return {"observer": observer}
+
+    def _batch_size(self) -> int:
+        return self._sizer.chunk_size if self._sizer else 100000
+
+
+def parse_verilog_file(
+    parser: VerilogParser, batch_size: int, path: Path, observer: ProgressObserver
+) -> Iterator[tuple[str, list[Any]]]:
+    """Node, bus and edge batches of one netlist, in the order execute reads them."""
+    yield from tagged("nodes", parser.parse_node_rows(path, batch_size, observer))
+    yield "buses", parser.bus_rows()
+    yield from tagged("edges", parser.parse_edge_rows(path, batch_size, observer))
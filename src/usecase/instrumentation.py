@@ -0,0 +1,63 @@
+import time
+from collections.abc import Callable, Iterable, Iterator, Sized
+from contextlib import contextmanager
+from typing import Any, cast
+
+from src.domain.protocol.progress_observer import ProgressObserver
+from src.usecase.adaptive_batch_sizer import AdaptiveBatchSizer
+
+
+def run_stage(
+    stage: str,
+    batches: Iterable[Sized],
+    write: Callable[[Any], None],
+    observer: ProgressObserver | None,
+    sizer: AdaptiveBatchSizer | None = None,
+) -> int:
+    """
+    Feeds every batch to write, reporting stage events and parse/write time.
+    With a sizer, batches are regrouped to its size and every write is fed
+    back to it so the size adapts to the measured cost.
+    """
+    if observer:
+        observer.stage_started(stage)
+    if sizer:  # only ever given for batches that are lists of rows
+        batches = sizer.rebatch(cast(Iterable[list[Any]], batches))
+    rows = 0
+    for batch in _timed_batches(batches, observer):
+        started = time.perf_counter()
+        write(batch)
+        elapsed = time.perf_counter() - started
+        rows += len(batch)
+        if sizer:
+            sizer.observe(len(batch), elapsed)
+        if observer:
+            observer.record_timing("write", elapsed, len(batch))
+    if observer:
+        observer.stage_finished(stage, rows)
+    return rows
+
+
+@contextmanager
+def observed_stage(stage: str, observer: ProgressObserver | None) -> Iterator[None]:
+    """Reports a stage that has no batches of its own (e.g. an index build)."""
+    if observer:
+        observer.stage_started(stage)
+    yield
+    if observer:
+        observer.stage_finished(stage, 0)
+
+
+def _timed_batches(
+    batches: Iterable[Sized], observer: ProgressObserver | None
+) -> Iterator[Sized]:
+    """Reports the time spent producing each batch (reading + parsing)."""
+    iterator = iter(batches)
+    while True:
+        started = time.perf_counter()
+        batch = next(iterator, None)
+        if batch is None:
+            return
+        if observer:
+            observer.record_timing("parse", time.perf_counter() - started, len(batch))
+        yield batch
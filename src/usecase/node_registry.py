@@ -0,0 +1,37 @@
+from collections import OrderedDict
+from collections.abc import Iterable
+
+from src.domain.model.node import NodeIdRow, NodeRow
+
+_CAPACITY = 1 << 18
+
+
+class NodeRegistry:
+    """
+    Assigns node IDs for one import run and drops names it has already
+    registered, so a net named by every pin it connects reaches SQLite once.
+    Only the `capacity` most recently seen names are kept; a name evicted
+    and seen again is sent again, and the database keeps its first ID.
+    """
+
+    def __init__(self, next_id: int = 1, capacity: int = _CAPACITY) -> None:
+        self._ids: OrderedDict[str, int] = OrderedDict()
+        self._next_id = next_id
+        self._capacity = capacity
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def register(self, rows: Iterable[NodeRow]) -> list[NodeIdRow]:
+        """Returns an (id, name) row for each name not among the recent ones."""
+        new_nodes: list[NodeIdRow] = []
+        for (name,) in rows:
+            if name in self._ids:
+                self._ids.move_to_end(name)
+                continue
+            self._ids[name] = self._next_id
+            new_nodes.append((self._next_id, name))
+            self._next_id += 1
+            if len(self._ids) > self._capacity:
+                self._ids.popitem(last=False)
+        return new_nodes
@@ -0,0 +1,58 @@
+import os
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from src.domain.model.trace_result import TraceResult
+from src.domain.protocol.path_queries import PathQueries
+from src.usecase.trace_path import TracePathUseCase
+
+# The TracePathUseCase of the current worker process, set once on start-up.
+_worker: dict[str, TracePathUseCase] = {}
+
+
+class ParallelTracePathUseCase:
+    """
+    Runs one TracePathUseCase search per start node on a process pool.
+    open_graph is called once in every worker and must be picklable; it
+    should attach a shared read-only graph (a MappedGraph) rather than load
+    a private copy, so memory stays at one graph whatever the worker count.
+    """
+
+    def __init__(
+        self, open_graph: Callable[[], PathQueries], workers: int | None = None
+    ) -> None:
+        self._open_graph = open_graph
+        self._workers = workers or os.cpu_count() or 1
+
+    def execute(
+        self,
+        start_nodes: Sequence[str],
+        end_node: str | None = None,
+        beam_width: int | None = None,
+        timeout: float | None = None,
+    ) -> list[TraceResult]:
+        """Returns one result per start node, in order; timeout is per start."""
+        if not start_nodes:
+            return []
+        trace = partial(
+            _trace, end_node=end_node, beam_width=beam_width, timeout=timeout
+        )
+        with ProcessPoolExecutor(
+            self._workers, initializer=_attach, initargs=(self._open_graph,)
+        ) as pool:
+            chunk = max(1, len(start_nodes) // (4 * self._workers))
+            return list(pool.map(trace, start_nodes, chunksize=chunk))
+
+
+def _attach(open_graph: Callable[[], PathQueries]) -> None:
+    _worker["usecase"] = TracePathUseCase(open_graph())
+
+
+def _trace(
+    start_node: str,
+    end_node: str | None,
+    beam_width: int | None,
+    timeout: float | None,
+) -> TraceResult:
+    return _worker["usecase"].execute(start_node, end_node, beam_width, timeout)
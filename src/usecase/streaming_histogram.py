@@ -0,0 +1,112 @@
+import numpy as np
+
+from src.domain.model.distribution import Distribution
+
+_FINE_BINS_PER_BIN = 64  # resolution kept for percentiles within a display bin
+
+
+class StreamingHistogram:
+    """
+    Fixed-range histogram accumulated one NumPy chunk at a time, over all
+    values and per group. Values are counted into fine bins and then dropped,
+    so memory does not grow with the row count; percentiles are read back
+    from the cumulative counts to within one fine bin.
+    """
+
+    def __init__(self, low: float, high: float, bins: int) -> None:
+        self._low = low
+        self._bins = bins
+        self._fine = bins * _FINE_BINS_PER_BIN
+        self._width = (high - low) / self._fine or 1.0 / self._fine
+        self._counts: dict[str | None, np.ndarray] = {}
+        self._sums: dict[str | None, float] = {}
+        self._minima: dict[str | None, float] = {}
+        self._maxima: dict[str | None, float] = {}
+
+    def add(self, values: np.ndarray, groups: np.ndarray | None = None) -> None:
+        if not len(values):
+            return
+        index = np.clip(
+            ((values - self._low) / self._width).astype(np.int64), 0, self._fine - 1
+        )
+        self._accumulate(
+            None,
+            np.bincount(index, minlength=self._fine),
+            float(values.sum()),
+            float(values.min()),
+            float(values.max()),
+        )
+        if groups is None:
+            return
+        labels, inverse = np.unique(groups, return_inverse=True)
+        counts = np.bincount(
+            inverse * self._fine + index, minlength=len(labels) * self._fine
+        ).reshape(len(labels), self._fine)
+        sums = np.bincount(inverse, weights=values, minlength=len(labels))
+        minima = np.full(len(labels), np.inf)
+        maxima = np.full(len(labels), -np.inf)
+        np.minimum.at(minima, inverse, values)
+        np.maximum.at(maxima, inverse, values)
+        for i, label in enumerate(labels.tolist()):
+            self._accumulate(
+                label, counts[i], float(sums[i]), float(minima[i]), float(maxima[i])
+            )
+
+    def distributions(
+        self, metric: str, percentiles: tuple[float, ...]
+    ) -> tuple[Distribution, ...]:
+        """The overall distribution first, then one per group in name order."""
+        groups = sorted(g for g in self._counts if g is not None)
+        keys = [None, *groups] if self._counts else []
+        return tuple(self._distribution(metric, key, percentiles) for key in keys)
+
+    def _accumulate(
+        self,
+        key: str | None,
+        counts: np.ndarray,
+        total: float,
+        minimum: float,
+        maximum: float,
+    ) -> None:
+        if key not in self._counts:
+            self._counts[key] = np.zeros(self._fine, dtype=np.int64)
+            self._sums[key] = 0.0
+            self._minima[key] = minimum
+            self._maxima[key] = maximum
+        self._counts[key] += counts
+        self._sums[key] += total
+        self._minima[key] = min(self._minima[key], minimum)
+        self._maxima[key] = max(self._maxima[key], maximum)
+
+    def _distribution(
+        self, metric: str, key: str | None, percentiles: tuple[float, ...]
+    ) -> Distribution:
+        counts = self._counts[key]
+        count = int(counts.sum())
+        edges = self._low + self._width * np.arange(0, self._fine + 1)
+        coarse = counts.reshape(self._bins, _FINE_BINS_PER_BIN).sum(axis=1)
+        return Distribution(
+            metric=metric,
+            group=key,
+            count=count,
+            minimum=self._minima[key],
+            maximum=self._maxima[key],
+            mean=self._sums[key] / count,
+            percentiles=tuple(
+                (q, self._percentile(counts, edges, key, q)) for q in percentiles
+            ),
+            bin_edges=tuple(edges[::_FINE_BINS_PER_BIN].tolist()),
+            bin_counts=tuple(coarse.tolist()),
+        )
+
+    def _percentile(
+        self, counts: np.ndarray, edges: np.ndarray, key: str | None, q: float
+    ) -> float:
+        """Interpolates linearly inside the fine bin holding the q-th percentile."""
+        cumulative = np.cumsum(counts)
+        target = q / 100 * cumulative[-1]
+        i = min(int(np.searchsorted(cumulative, target)), self._fine - 1)
+        below = cumulative[i - 1] if i else 0
+        fraction = (target - below) / counts[i] if counts[i] else 0.0
+        value = float(edges[i] + fraction * self._width)
+        return min(max(value, self._minima[key]), self._maxima[key])
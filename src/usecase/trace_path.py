@@ -1,12 +1,76 @@
-from src.domain.model.edge import Edge
-from src.domain.protocol.graph_repository import GraphRepository
+from collections.abc import Sequence
+
+from src.domain.model.bus import split_bit_name
+from src.domain.model.trace_result import TraceResult
+from src.domain.protocol.path_queries import PathQueries
+
+_GLOB_WILDCARDS = "*?["
 
 
 class TracePathUseCase:
     """UseCase to find the critical path between two nodes."""
 
-    def __init__(self, repo: GraphRepository) -> None:
+    def __init__(self, repo: PathQueries) -> None:
         self._repo = repo
 
-    def execute(self, start_node: str, end_node: str | None = None) -> tuple[Edge]:
-        return self._repo.find_max_delay_path(start_node, end_node)
+    def execute(
+        self,
+        start_node: str,
+        end_node: str | None = None,
+        beam_width: int | None = None,
+        timeout: float | None = None,
+    ) -> TraceResult:
+        """
+        Globs and buses expand to every matching node; they are searched in
+        one multi-source search rather than one search per (start, end) pair.
+        """
+        starts, ends = self._expand(start_node), self._expand_end(end_node)
+        if not starts or ends == ():
+            return TraceResult()
+        if len(starts) == 1 and (ends is None or len(ends) == 1):
+            end = None if ends is None else ends[0]
+            return self._repo.find_max_delay_path(
+                starts[0], end, beam_width=beam_width, timeout=timeout
+            )
+        return self._repo.find_max_delay_path_from_any(
+            starts, ends, beam_width=beam_width, timeout=timeout
+        )
+
+    def execute_through(
+        self,
+        start_node: str,
+        through: Sequence[str],
+        end_node: str | None = None,
+        timeout: float | None = None,
+    ) -> TraceResult:
+        """Worst path that visits every through node, in order."""
+        starts, ends = self._expand(start_node), self._expand_end(end_node)
+        if not starts or ends == ():
+            return TraceResult()
+        if len(starts) == 1 and (ends is None or len(ends) == 1):
+            end = None if ends is None else ends[0]
+            return self._repo.find_max_delay_path_through(
+                starts[0], tuple(through), end, timeout=timeout
+            )
+        return self._repo.find_max_delay_path_through_from_any(
+            starts, tuple(through), ends, timeout=timeout
+        )
+
+    def _expand(self, name: str) -> tuple[str, ...]:
+        """Expands a glob pattern or a bus name into the matching node names."""
+        if _is_glob(name):
+            return self._repo.find_nodes(name)
+        if bus := self._repo.find_bus(name):
+            return tuple(bus.bit_names())
+        return (name,)
+
+    def _expand_end(self, name: str | None) -> tuple[str, ...] | None:
+        """None (any reachable endpoint) stays None."""
+        return None if name is None else self._expand(name)
+
+
+def _is_glob(name: str) -> bool:
+    """A trailing "[3]" is a bit-select such as "data[3]", not a glob class."""
+    if split_bit_name(name) and not any(c in name for c in "*?"):
+        return False
+    return any(c in name for c in _GLOB_WILDCARDS)
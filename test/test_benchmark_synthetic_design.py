@@ -0,0 +1,102 @@
+import json
+import sqlite3
+from contextlib import closing
+
+import pytest
+from click.testing import CliRunner
+
+from benchmark.run_suite import main, run_suite
+from benchmark.synthetic_design import SyntheticDesignSpec, SyntheticDesignWriter
+from src.infra.parser.sdf_stream_parser import SDFStreamParser
+from src.infra.parser.verilog_stream_parser import VerilogStreamParser
+from src.infra.repository.sqlite_graph_repository import SqliteGraphRepository
+from src.usecase.import_cell_arcs import ImportCellArcsUseCase
+from src.usecase.import_sdf import ImportSDFUseCase
+from src.usecase.import_verilog import ImportVerilogUseCase
+from src.usecase.trace_path import TracePathUseCase
+
+_SPEC = SyntheticDesignSpec(edges=3_000, depth=8, seed=7)
+
+
+def test_generator_is_deterministic(tmp_path):
+    first = SyntheticDesignWriter(_SPEC).write(tmp_path / "a")
+    second = SyntheticDesignWriter(_SPEC).write(tmp_path / "b")
+
+    assert first.verilog_path.read_bytes() == second.verilog_path.read_bytes()
+    assert first.sdf_path.read_bytes() == second.sdf_path.read_bytes()
+
+
+@pytest.mark.parametrize("profile", ["flat", "tapered"])
+def test_generator_hits_requested_scale(tmp_path, profile):
+    tolerance = 0.1
+    spec = SyntheticDesignSpec(edges=20_000, depth=16, depth_profile=profile)
+
+    design = SyntheticDesignWriter(spec).write(tmp_path)
+
+    assert abs(design.edges - spec.edges) / spec.edges < tolerance
+    assert len(spec.level_widths()) == spec.depth
+
+
+def test_generated_sdf_matches_generated_netlist(tmp_path):
+    design = SyntheticDesignWriter(_SPEC).write(tmp_path)
+    repo = SqliteGraphRepository(str(tmp_path / "synth.db"))
+    repo.setup()
+
+    ImportVerilogUseCase(repo, VerilogStreamParser()).execute(design.verilog_path)
+    parser = SDFStreamParser()
+    arcs = ImportCellArcsUseCase(repo)
+    ImportSDFUseCase(repo, parser, cell_arcs=arcs).execute(design.sdf_path)
+
+    with closing(sqlite3.connect(repo.db_path)) as conn:
+        edges = conn.execute("SELECT count(*) FROM edges").fetchone()[0]
+        annotated = conn.execute(
+            "SELECT count(*) FROM edges WHERE delay_rise > 0"
+        ).fetchone()[0]
+        cell_arcs = conn.execute("SELECT count(*) FROM cell_arcs").fetchone()[0]
+    assert edges == design.edges
+    assert annotated == design.interconnects
+    assert cell_arcs == design.arcs
+
+
+def test_trace_from_an_input_pin_crosses_the_gate(tmp_path):
+    design = SyntheticDesignWriter(_SPEC).write(tmp_path)
+    repo = SqliteGraphRepository(str(tmp_path / "synth.db"))
+    repo.setup()
+    parser = SDFStreamParser()
+    ImportVerilogUseCase(repo, VerilogStreamParser()).execute(design.verilog_path)
+    arcs = ImportCellArcsUseCase(repo)
+    ImportSDFUseCase(repo, parser, cell_arcs=arcs).execute(design.sdf_path)
+
+    result = TracePathUseCase(repo).execute("u_g0.A1")
+
+    assert result.edges[0].src_node == "u_g0.A1"
+    assert result.edges[0].dst_node == "u_g0.ZN"
+    assert result.total_delay > 0
+
+
+def test_run_suite_reports_every_stage(tmp_path):
+    report = run_suite(_SPEC, tmp_path, traces=5)
+
+    expected = {
+        "generate",
+        "import_verilog",
+        "import_sdf",
+        "import_sdf_prefiltered",
+        "trace",
+        "batch_trace",
+    }
+    assert set(report["stages"]) == expected
+    assert report["db_bytes"] > 0
+    assert report["design"]["edges"] == report["stages"]["import_verilog"]["rows"]
+
+
+def test_main_writes_json_report(tmp_path):
+    out = tmp_path / "report.json"
+    edges = 2000
+
+    result = CliRunner().invoke(
+        main, ["--edges", str(edges), "--traces", "3", "--out", str(out)]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert json.loads(out.read_text())["spec"]["edges"] == edges
@@ -0,0 +1,44 @@
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.infra.repository.sqlite_graph_repository import SqliteGraphRepository
+
+
+@pytest.fixture()
+def repo(tmp_path):
+    repo = SqliteGraphRepository(str(tmp_path / "pool.db"))
+    repo.setup()
+    repo.save_edge_rows([("a", "b", 1.0, 1.0), ("b", "c", 2.0, 2.0)])
+    yield repo
+    repo.close()
+
+
+def test_query_connections_are_read_only(repo):
+    with repo.read_connection() as connection:
+        with pytest.raises(sqlite3.OperationalError, match="readonly"):
+            connection.execute("DELETE FROM edges")
+
+
+def test_query_connections_are_reused(repo):
+    with repo.read_connection() as first:
+        pass
+    with repo.read_connection() as second:
+        pass
+
+    assert first is second
+
+
+def test_concurrent_readers_see_committed_writes(repo):
+    traces = 32
+
+    def trace(i):
+        if i % 8 == 0:
+            repo.save_edge_rows([(f"x{i}", "a", 0.5, 0.5)])
+        return repo.find_max_delay_path("a").total_delay
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        delays = list(pool.map(trace, range(traces)))
+
+    assert delays == [pytest.approx(3.0)] * traces
@@ -0,0 +1,72 @@
+import bz2
+import gzip
+import lzma
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.infra.parser import line_reader
+from src.infra.parser.line_reader import read_lines
+from src.infra.parser.sdf_stream_parser import SDFStreamParser
+from src.infra.parser.verilog_stream_parser import VerilogStreamParser
+
+_SDF = """(DELAYFILE
+  (INTERCONNECT u1/Q u2/A (0.1::0.2) (0.1::0.2))
+  (INTERCONNECT u1/Q u3/B (0.3::0.4)
+    (0.3::0.5))
+)"""
+
+_VERILOG = """module top;
+  wire n1;
+  wire n2;
+  BUF u1 ( .A(n1), .Z(n2) );
+endmodule
+"""
+
+_COMPRESSORS = {".gz": gzip.compress, ".bz2": bz2.compress, ".xz": lzma.compress}
+
+
+@pytest.mark.parametrize("suffix", sorted(_COMPRESSORS))
+def test_compressed_sdf_parses_like_plain(tmp_path, suffix):
+    plain = tmp_path / "design.sdf"
+    plain.write_text(_SDF, encoding="utf-8")
+    packed = tmp_path / f"design.sdf{suffix}"
+    packed.write_bytes(_COMPRESSORS[suffix](_SDF.encode()))
+    parser = SDFStreamParser()
+
+    assert list(parser.parse_delay_rows(packed)) == list(parser.parse_delay_rows(plain))
+
+
+@pytest.mark.parametrize("suffix", sorted(_COMPRESSORS))
+def test_compressed_verilog_parses_like_plain(tmp_path, suffix):
+    plain = tmp_path / "design.v"
+    plain.write_text(_VERILOG, encoding="utf-8")
+    packed = tmp_path / f"design.v{suffix}"
+    packed.write_bytes(_COMPRESSORS[suffix](_VERILOG.encode()))
+    parser = VerilogStreamParser()
+
+    assert list(parser.parse_edge_rows(packed)) == list(parser.parse_edge_rows(plain))
+
+
+def test_compressed_progress_counts_compressed_bytes(tmp_path, monkeypatch):
+    monkeypatch.setattr(line_reader, "_DECOMPRESS_BLOCK", 64)
+    text = "".join(f"line {i}\n" for i in range(1000))
+    packed = tmp_path / "big.txt.gz"
+    packed.write_bytes(gzip.compress(text.encode()))
+    observer = MagicMock()
+
+    lines = list(read_lines(packed, observer))
+
+    assert "".join(lines) == text
+    reported = sum(c.args[0] for c in observer.update.call_args_list)
+    assert reported == packed.stat().st_size
+
+
+def test_abandoned_compressed_reader_stops_worker(tmp_path, monkeypatch):
+    monkeypatch.setattr(line_reader, "_DECOMPRESS_BLOCK", 16)
+    packed = tmp_path / "big.txt.xz"
+    packed.write_bytes(lzma.compress(b"x\n" * 100_000))
+
+    lines = read_lines(packed, None)
+    assert next(lines) == "x\n"
+    lines.close()  # must join the worker instead of hanging on a full queue
@@ -0,0 +1,78 @@
+from functools import partial
+
+import pytest
+
+from src.domain.model.edge import Edge
+from src.infra.export.npy_bundle import NpyBundleWriter
+from src.infra.repository.mapped_graph import (
+    MappedGraph,
+    build_adjacency_index,
+    has_adjacency_index,
+)
+from src.infra.repository.sqlite_graph_repository import SqliteGraphRepository
+from src.usecase.export_columnar import ExportColumnarUseCase
+from src.usecase.parallel_trace_path import ParallelTracePathUseCase
+from src.usecase.trace_path import TracePathUseCase
+
+
+@pytest.fixture(scope="module")
+def graphs(tmp_path_factory):
+    r"""
+    S -> X -> E (20) beats S -> Y -> M -> Z -> E (11.5); u1 is a cell arc
+    A1 -> ZN of 2.0 between u0.Z and u2.I.
+    """
+    work = tmp_path_factory.mktemp("mapped")
+    repo = SqliteGraphRepository(str(work / "graph.db"))
+    repo.setup()
+    repo.save_edges_batch(
+        (
+            Edge("S", "X", 10.0, 10.0),
+            Edge("X", "E", 10.0, 10.0),
+            Edge("S", "Y", 3.0, 2.0),
+            Edge("Y", "M", 1.0, 3.0),
+            Edge("M", "Z", 5.0, 5.0),
+            Edge("Z", "E", 0.5, 0.5),
+            Edge("u0.Z", "u1.A1", 0.5, 0.5),
+            Edge("u1.ZN", "u2.I", 1.0, 1.0),
+        )
+    )
+    repo.save_delay_template_rows([(1, "ND2D1", "A1", "ZN", 2.0, 1.5)])
+    repo.save_cell_arc_rows([("u1", 1)])
+    ExportColumnarUseCase(repo, NpyBundleWriter(work / "bundle")).execute()
+    build_adjacency_index(work / "bundle")
+    return repo, work / "bundle"
+
+
+def test_mapped_graph_traces_like_the_database(graphs):
+    repo, directory = graphs
+    mapped = MappedGraph(directory)
+
+    for start, end in (("S", "E"), ("S", None), ("u0.Z", "u2.I"), ("Q", None)):
+        expected = repo.find_max_delay_path(start, end)
+        found = mapped.find_max_delay_path(start, end)
+        assert list(found) == list(expected)
+
+    through = mapped.find_max_delay_path_through("S", ("M",), "E")
+    assert [e.dst_node for e in through] == ["Y", "M", "Z", "E"]
+    assert through.total_delay == pytest.approx(11.5)
+    assert has_adjacency_index(directory)
+
+
+def test_mapped_graph_find_nodes_scans_the_prefix_range(graphs):
+    mapped = MappedGraph(graphs[1])
+
+    assert mapped.find_nodes("u1.*") == ("u1.A1", "u1.ZN")
+    assert mapped.find_nodes("*.Z") == ("u0.Z",)
+    assert mapped.find_nodes("u*", limit=2) == ("u0.Z", "u1.A1")
+
+
+def test_parallel_traces_match_serial_ones(graphs):
+    repo, directory = graphs
+    starts = ["S", "Y", "u*.Z", "missing"]
+
+    found = ParallelTracePathUseCase(partial(MappedGraph, directory), 2).execute(
+        starts, "E"
+    )
+
+    serial = [TracePathUseCase(repo).execute(start, "E") for start in starts]
+    assert [list(path) for path in found] == [list(path) for path in serial]
@@ -0,0 +1,52 @@
+import numpy as np
+
+from src.domain.model.edge import Edge
+from src.domain.model.node import Node
+from src.infra.export.npy_bundle import NpyBundleWriter, load_npy_bundle
+from src.infra.repository.sqlite_graph_repository import SqliteGraphRepository
+from src.usecase.export_columnar import ExportColumnarUseCase
+
+
+def _export(repo, directory, chunk_rows=2):
+    writer = NpyBundleWriter(directory)
+    counts = ExportColumnarUseCase(repo, writer, chunk_rows=chunk_rows).execute()
+    return counts, load_npy_bundle(directory)
+
+
+def test_export_streams_id_columns_and_name_table(tmp_path):
+    repo = SqliteGraphRepository(str(tmp_path / "graph.db"))
+    repo.setup()
+    repo.save_nodes_batch((Node("net_only"),))
+    repo.save_edges_batch(
+        (
+            Edge("u1.Z", "n1", 0.25, 0.5),
+            Edge("n1", "u2.A", 1.0, 2.0),
+            Edge("u2.Z", "µ_out", 3.0, 0.125),
+        )
+    )
+
+    (nodes, edges), bundle = _export(repo, tmp_path / "bundle")
+
+    names = [bundle.name(i) for i in range(nodes)]
+    assert names == sorted(["net_only", "u1.Z", "n1", "u2.A", "u2.Z", "µ_out"])
+    assert edges == len(bundle.src)
+    exported = {
+        (names[s], names[d], r, f)
+        for s, d, r, f in zip(
+            bundle.src, bundle.dst, bundle.rise, bundle.fall, strict=True
+        )
+    }
+    assert ("u2.Z", "µ_out", 3.0, 0.125) in exported
+    assert ("n1", "u2.A", 1.0, 2.0) in exported
+    assert isinstance(bundle.src, np.memmap) and not bundle.src.flags.writeable
+    assert (bundle.src.dtype, bundle.rise.dtype) == (np.int32, np.float32)
+
+
+def test_export_of_an_empty_graph_loads(tmp_path):
+    repo = SqliteGraphRepository(str(tmp_path / "empty.db"))
+    repo.setup()
+
+    (nodes, edges), bundle = _export(repo, tmp_path / "bundle")
+
+    assert (nodes, edges) == (0, 0)
+    assert len(bundle.src) == 0 and list(bundle.name_offsets) == [0]
@@ -0,0 +1,146 @@
+import sqlite3
+from contextlib import closing
+
+import pytest
+
+from benchmark.synthetic_design import SyntheticDesignSpec, SyntheticDesignWriter
+from src.infra.parser.sdf_stream_parser import SDFStreamParser
+from src.infra.parser.verilog_stream_parser import VerilogStreamParser
+from src.infra.repository.partitioned_graph_repository import (
+    PartitionedGraphRepository,
+    partition_path,
+    stored_partition_count,
+)
+from src.infra.repository.sqlite_graph_repository import SqliteGraphRepository
+from src.usecase.import_sdf import ImportSDFUseCase
+from src.usecase.import_verilog import ImportVerilogUseCase
+
+_PARTITIONS = 3
+
+
+def _import(repo, design):
+    repo.setup()
+    ImportVerilogUseCase(repo, VerilogStreamParser()).execute(design.verilog_path)
+    ImportSDFUseCase(repo, SDFStreamParser()).execute(design.sdf_path)
+    return repo
+
+
+@pytest.fixture(scope="module")
+def repos(tmp_path_factory):
+    work = tmp_path_factory.mktemp("partitioned")
+    design = SyntheticDesignWriter(SyntheticDesignSpec(edges=2_000, seed=3)).write(work)
+    single = _import(SqliteGraphRepository(str(work / "single.db")), design)
+    sharded = _import(
+        PartitionedGraphRepository(str(work / "sharded.db"), _PARTITIONS), design
+    )
+    return single, sharded
+
+
+def _count(db_path, sql):
+    with closing(sqlite3.connect(db_path)) as connection:
+        return connection.execute(sql).fetchone()[0]
+
+
+def test_edges_are_split_between_partitions_only(repos):
+    single, sharded = repos
+    total = _count(single.db_path, "SELECT COUNT(*) FROM edges")
+    per_partition = [
+        _count(partition_path(sharded.db_path, i), "SELECT COUNT(*) FROM edges")
+        for i in range(_PARTITIONS)
+    ]
+
+    assert all(count > total / (2 * _PARTITIONS) for count in per_partition)
+    assert sum(per_partition) == total
+    assert _count(sharded.db_path, "SELECT COUNT(*) FROM edges") == 0
+    assert stored_partition_count(sharded.db_path) == _PARTITIONS
+    assert stored_partition_count(single.db_path) is None
+
+
+def test_node_ids_are_unique_across_partitions(repos):
+    _, sharded = repos
+    ids = []
+    for i in range(_PARTITIONS):
+        with closing(sqlite3.connect(partition_path(sharded.db_path, i))) as conn:
+            ids += [row[0] for row in conn.execute("SELECT id FROM nodes")]
+
+    assert len(ids) == len(set(ids))
+    assert sharded.next_node_id() == max(ids) + 1
+
+
+def test_delays_reach_every_partition(repos):
+    single, sharded = repos
+    sql = "SELECT COUNT(*) FROM edges WHERE delay_rise > 0"
+    updated = [
+        _count(partition_path(sharded.db_path, i), sql) for i in range(_PARTITIONS)
+    ]
+
+    assert all(updated)
+    assert sum(updated) == _count(single.db_path, sql)
+
+
+def test_setup_rejects_a_different_partition_count(tmp_path):
+    db_path = str(tmp_path / "sharded.db")
+    PartitionedGraphRepository(db_path, _PARTITIONS).setup()
+    PartitionedGraphRepository(db_path, _PARTITIONS).setup()
+
+    with pytest.raises(ValueError, match="split into 3 partitions"):
+        PartitionedGraphRepository(db_path, _PARTITIONS + 1).setup()
+    assert stored_partition_count(db_path) == _PARTITIONS
+
+
+def test_traces_stitch_across_partitions(tmp_path):
+    chain = [
+        ("u_a/x", "u_b/y", 1.0, 1.0),
+        ("u_b/y", "u_b/z", 2.0, 1.0),
+        ("u_b/z", "u_c/w", 1.0, 4.0),
+        ("u_a/x", "u_c/w", 5.0, 5.0),
+        ("u_c/w", "u_d/out", 0.5, 0.5),
+    ]
+    single = SqliteGraphRepository(str(tmp_path / "single.db"))
+    sharded = PartitionedGraphRepository(str(tmp_path / "sharded.db"), _PARTITIONS)
+    for repo in (single, sharded):
+        repo.setup()
+        repo.save_edge_rows(chain)
+
+    expected = single.find_max_delay_path("u_a/x", "u_d/out")
+    found = sharded.find_max_delay_path("u_a/x", "u_d/out")
+
+    assert list(found) == list(expected)
+    assert found.total_delay == pytest.approx(7.5)
+    assert not found.approximate
+
+
+def test_cell_arcs_resolve_in_their_instance_partition(tmp_path):
+    sharded = PartitionedGraphRepository(str(tmp_path / "sharded.db"), _PARTITIONS)
+    sharded.setup()
+    sharded.save_edge_rows([("u0.Z", "u1.A1", 0.5, 0.5), ("u1.ZN", "u2.I", 1.0, 1.0)])
+    sharded.save_delay_template_rows([(1, "ND2D1", "A1", "ZN", 2.0, 1.5)])
+    sharded.save_cell_arc_rows([("u1", 1)])
+
+    path = sharded.find_max_delay_path("u0.Z", "u2.I")
+
+    assert [e.dst_node for e in path] == ["u1.A1", "u1.ZN", "u2.I"]
+    assert path.total_delay == pytest.approx(3.5)
+    assert len(sharded.load_delay_template_rows()) == 1
+
+
+def test_find_nodes_merges_partitions(repos):
+    single, sharded = repos
+
+    assert sharded.find_nodes("u_g1*") == single.find_nodes("u_g1*")
+
+
+def test_columnar_snapshot_numbers_nodes_across_partitions(repos):
+    single, sharded = repos
+
+    def exported(repo):
+        with repo.columnar_snapshot() as source:
+            names = [n for chunk in source.iter_names(500) for n in chunk]
+            edges = [
+                (names[s], names[d], r, f)
+                for chunk in source.iter_edges(500)
+                for s, d, r, f in chunk
+            ]
+        return names, sorted(edges)
+
+    assert exported(sharded) == exported(single)
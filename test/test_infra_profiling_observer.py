@@ -0,0 +1,62 @@
+from unittest.mock import MagicMock
+
+from src.infra.metrics.profiling_observer import ProfilingObserver
+from src.infra.parser.sdf_stream_parser import SDFStreamParser
+
+
+def test_timings_are_attributed_to_running_stage():
+    profiler = ProfilingObserver()
+    rows = 150
+
+    profiler.stage_started("import_edges")
+    profiler.record_timing("sql:insert_edges", 0.5, rows=100)
+    profiler.record_timing("sql:insert_edges", 0.25, rows=50)
+    profiler.stage_finished("import_edges", rows=rows)
+    profiler.record_timing("sql:find_nodes", 0.1)
+
+    report = profiler.report()
+
+    (stage,) = report["stages"]
+    assert stage["name"] == "import_edges"
+    assert stage["rows"] == rows
+    assert stage["timings"]["sql:insert_edges"] == {
+        "calls": 2,
+        "seconds": 0.75,
+        "rows": rows,
+    }
+    assert "sql:find_nodes" not in stage["timings"]
+    assert set(report["timings"]) == {"sql:insert_edges", "sql:find_nodes"}
+    assert report["peak_rss_bytes"] > 0
+    assert "peak_rss_bytes" not in stage
+
+
+def test_progress_is_forwarded_to_inner_observer():
+    inner = MagicMock()
+    profiler = ProfilingObserver(inner)
+    increment = 10
+
+    profiler.update(increment)
+    profiler.set_description("Importing...")
+    profiler.stage_started("s")
+    profiler.stage_finished("s", 0)
+
+    inner.update.assert_called_once_with(increment)
+    inner.set_description.assert_called_once_with("Importing...")
+    inner.stage_finished.assert_called_once_with("s", 0)
+    assert profiler.report()["input_bytes"] == increment
+
+
+def test_parser_reports_progress_in_chunks(tmp_path):
+    sdf_file = tmp_path / "many_lines.sdf"
+    lines = [
+        f"(INTERCONNECT u{i}/Q u{i + 1}/D (0.1::0.1) (0.1::0.1))" for i in range(50_000)
+    ]
+    sdf_file.write_text("\n".join(lines), encoding="utf-8")
+    observer = MagicMock()
+
+    for _ in SDFStreamParser().parse_delays(sdf_file, observer=observer):
+        pass
+
+    reported = sum(call.args[0] for call in observer.update.call_args_list)
+    assert reported == sdf_file.stat().st_size
+    assert observer.update.call_count < len(lines) / 1000
@@ -3,6 +3,7 @@ from contextlib import closing
 
 import pytest
 
+from src.domain.model.bus import Bus
 from src.domain.model.edge import Edge
 from src.domain.model.node import Node
 from src.infra.repository.sqlite_graph_repository import SqliteGraphRepository
@@ -44,6 +45,43 @@ def test_save_nodes_batch_inserts_data(tmp_path):
         assert names == ["top.cpu.u1", "top.cpu.u2", "top.mem.u3"]
 
 
+def test_node_id_rows_keep_given_ids_and_first_id_of_a_name(tmp_path):
+    repo = SqliteGraphRepository(str(tmp_path / "test_gls.db"))
+    repo.setup()
+    repo.save_node_rows([("n0",)])
+
+    first_id = repo.next_node_id()
+    repo.save_node_id_rows([(first_id, "n1"), (first_id + 1, "n0")])
+
+    with closing(sqlite3.connect(repo.db_path)) as conn:
+        rows = conn.execute("SELECT id, name FROM nodes ORDER BY id").fetchall()
+    assert rows == [(1, "n0"), (first_id, "n1")]
+    assert repo.next_node_id() == first_id + 1
+
+
+def test_buses_are_stored_once_with_their_range(tmp_path):
+    repo = SqliteGraphRepository(str(tmp_path / "test_gls.db"))
+    repo.setup()
+
+    repo.save_bus_rows([("data", 7, 0), ("addr", 0, 3)])
+
+    assert repo.find_bus("data") == Bus("data", 7, 0)
+    assert repo.find_bus("addr") == Bus("addr", 0, 3)
+    assert repo.find_bus("clk") is None
+
+
+def test_reimported_bus_takes_the_new_range(tmp_path):
+    repo = SqliteGraphRepository(str(tmp_path / "test_gls.db"))
+    repo.setup()
+    repo.save_bus_rows([("data", 7, 0)])
+
+    repo.save_bus_rows([("data", 15, 0)])
+
+    assert repo.find_bus("data") == Bus("data", 15, 0)
+    with closing(sqlite3.connect(repo.db_path)) as conn:
+        assert conn.execute("SELECT count(*) FROM buses").fetchone()[0] == 1
+
+
 def test_save_nodes_batch_performance(tmp_path, benchmark):
     """Performance Test for Nodes using pytest-benchmark."""
     db_path = tmp_path / "perf_test_nodes.db"
@@ -179,3 +217,318 @@ def test_find_max_delay_path_without_end_node(tmp_path):
 
     len_paths = 2
     assert len(path) == len_paths
+
+
+@pytest.fixture
+def repo_with_lookup(tmp_path):
+    repo = SqliteGraphRepository(str(tmp_path / "test_lookup.db"))
+    repo.setup()
+    repo.save_nodes_batch((Node("net1"), Node("CK")))
+    repo.save_edges_batch(
+        (
+            Edge("u_alu1.Z", "net1"),
+            Edge("u_alu2.Z", "net2"),
+            Edge("u_reg1.CK", "CK"),
+            Edge("u_reg2.CK", "CK"),
+        )
+    )
+    repo.build_node_lookup()
+    return repo
+
+
+def test_find_nodes_with_prefix_pattern(repo_with_lookup):
+    assert repo_with_lookup.find_nodes("u_alu*.Z") == ("u_alu1.Z", "u_alu2.Z")
+    assert repo_with_lookup.find_nodes("net?") == ("net1", "net2")
+
+
+def test_find_nodes_with_suffix_pattern(repo_with_lookup):
+    assert repo_with_lookup.find_nodes("*.CK") == ("u_reg1.CK", "u_reg2.CK")
+    assert repo_with_lookup.find_nodes("*[2].CK") == ("u_reg2.CK",)
+
+
+def test_find_nodes_uses_index(repo_with_lookup):
+    with closing(sqlite3.connect(repo_with_lookup.db_path)) as conn:
+        plans = [
+            conn.execute(
+                f"EXPLAIN QUERY PLAN SELECT name FROM node_lookup WHERE {col} GLOB ?",
+                (glob,),
+            ).fetchone()[-1]
+            for col, glob in (("name", "u_alu*"), ("reversed_name", "KC.*"))
+        ]
+
+    assert all(plan.startswith("SEARCH") for plan in plans), plans
+
+
+def test_find_nodes_respects_limit(repo_with_lookup):
+    limit = 3
+    assert len(repo_with_lookup.find_nodes("*", limit=limit)) == limit
+
+
+def test_find_nodes_limits_after_sorting_by_name(tmp_path):
+    repo = SqliteGraphRepository(str(tmp_path / "test_lookup_order.db"))
+    repo.setup()
+    # Reversed, "b0.Z" sorts first in the suffix index: "Z.0b" < "Z.1a".
+    repo.save_edges_batch((Edge("b0.Z", "n1"), Edge("a1.Z", "n2")))
+    repo.build_node_lookup()
+
+    assert repo.find_nodes("*.Z", limit=1) == ("a1.Z",)
+
+
+@pytest.fixture
+def repo_with_greedy_trap(tmp_path):
+    r"""
+    A --(5.0)--> B --(1.0)--> D (Total: 6.0)
+      \
+       \--(1.0)--> C --(10.0)--> E (Total: 11.0) -> Critical Path!
+    """
+    repo = SqliteGraphRepository(str(tmp_path / "test_beam.db"))
+    repo.setup()
+    repo.save_edges_batch(
+        (
+            Edge("A", "B", 5.0, 5.0),
+            Edge("B", "D", 1.0, 1.0),
+            Edge("A", "C", 1.0, 1.0),
+            Edge("C", "E", 10.0, 10.0),
+        )
+    )
+    return repo
+
+
+def test_find_max_delay_path_exact_is_default(repo_with_greedy_trap):
+    path = repo_with_greedy_trap.find_max_delay_path("A")
+
+    assert not path.approximate
+    assert [e.dst_node for e in path] == ["C", "E"]
+
+
+def test_find_max_delay_path_beam_is_flagged_approximate(repo_with_greedy_trap):
+    narrow = repo_with_greedy_trap.find_max_delay_path("A", beam_width=1)
+    wide = repo_with_greedy_trap.find_max_delay_path("A", beam_width=2)
+
+    assert narrow.approximate and wide.approximate
+    assert [e.dst_node for e in narrow] == ["B", "D"]
+    assert [e.dst_node for e in wide] == ["C", "E"]
+
+
+def test_find_max_delay_path_beam_with_end_node(repo_with_greedy_trap):
+    path = repo_with_greedy_trap.find_max_delay_path("A", "D", beam_width=1)
+    missing = repo_with_greedy_trap.find_max_delay_path("A", "Z", beam_width=4)
+
+    assert [e.dst_node for e in path] == ["B", "D"]
+    assert not missing
+
+
+@pytest.fixture
+def repo_with_waypoint(tmp_path):
+    r"""
+    S --(10)--> X --(10)--> E        (Total: 20.0, avoids M)
+    S --(1)--> M, S --(3)--> Y --(3)--> M
+    M --(2)--> E, M --(5)--> Z --(0.5)--> E
+    Worst path through M: S -> Y -> M -> Z -> E (Total: 11.5)
+    """
+    repo = SqliteGraphRepository(str(tmp_path / "test_through.db"))
+    repo.setup()
+    repo.save_edges_batch(
+        (
+            Edge("S", "X", 10.0, 10.0),
+            Edge("X", "E", 10.0, 10.0),
+            Edge("S", "M", 1.0, 1.0),
+            Edge("S", "Y", 3.0, 2.0),
+            Edge("Y", "M", 1.0, 3.0),
+            Edge("M", "E", 2.0, 2.0),
+            Edge("M", "Z", 5.0, 5.0),
+            Edge("Z", "E", 0.5, 0.5),
+        )
+    )
+    return repo
+
+
+def test_find_max_delay_path_through_meets_at_waypoint(repo_with_waypoint):
+    path = repo_with_waypoint.find_max_delay_path_through("S", ("M",), "E")
+
+    assert [e.dst_node for e in path] == ["Y", "M", "Z", "E"]
+    assert path.total_delay == pytest.approx(11.5)
+    unconstrained = repo_with_waypoint.find_max_delay_path("S", "E")
+    assert [e.dst_node for e in unconstrained] == ["X", "E"]
+
+
+def test_find_max_delay_path_through_several_waypoints_in_order(repo_with_waypoint):
+    path = repo_with_waypoint.find_max_delay_path_through("S", ("Y", "M"))
+    backwards = repo_with_waypoint.find_max_delay_path_through("S", ("M", "Y"), "E")
+
+    assert [e.dst_node for e in path] == ["Y", "M", "Z", "E"]
+    assert not backwards
+
+
+def test_find_max_delay_path_from_any_searches_all_pairs_at_once(repo_with_waypoint):
+    worst = repo_with_waypoint.find_max_delay_path_from_any(("Y", "M"), ("Z", "E"))
+    through = repo_with_waypoint.find_max_delay_path_through_from_any(
+        ("S", "Y"), ("M",), ("Z", "E")
+    )
+
+    assert [(e.src_node, e.dst_node) for e in worst] == [
+        ("Y", "M"),
+        ("M", "Z"),
+        ("Z", "E"),
+    ]
+    assert [e.src_node for e in through] == ["S", "Y", "M", "Z"]
+
+
+@pytest.fixture
+def repo_with_path_explosion(tmp_path):
+    """Fully connected layers: the number of paths grows as width ** depth."""
+    repo = SqliteGraphRepository(str(tmp_path / "test_timeout.db"))
+    repo.setup()
+    width, depth = 6, 14
+    edges = [Edge("start", f"n0_{j}", 1.0, 1.0) for j in range(width)]
+    edges += [
+        Edge(f"n{layer}_{i}", f"n{layer + 1}_{j}", 1.0 + i * 0.1, 1.0)
+        for layer in range(depth)
+        for i in range(width)
+        for j in range(width)
+    ]
+    repo.save_edges_batch(edges)
+    return repo
+
+
+def test_find_max_delay_path_timeout_returns_best_so_far(repo_with_path_explosion):
+    path = repo_with_path_explosion.find_max_delay_path(
+        "start", max_depth=20, timeout=0.2
+    )
+
+    assert path.partial
+    assert len(path) > 0
+    assert path.stats.explored_paths > 0
+    assert path.stats.explored_nodes > 0
+
+
+def test_find_max_delay_path_timeout_not_hit_is_exact(repo_with_greedy_trap):
+    path = repo_with_greedy_trap.find_max_delay_path("A", timeout=30.0)
+
+    assert not path.partial
+    assert [e.dst_node for e in path] == ["C", "E"]
+    assert path.stats.explored_paths == len(("B", "C", "D", "E"))
+
+
+def test_find_max_delay_path_beam_honours_timeout(repo_with_path_explosion):
+    path = repo_with_path_explosion.find_max_delay_path(
+        "start", beam_width=4, timeout=1e-9
+    )
+
+    assert path.partial and path.approximate
+
+
+def test_find_max_delay_path_keeps_the_parallel_edge_that_won(tmp_path):
+    repo = SqliteGraphRepository(str(tmp_path / "parallel.db"))
+    repo.setup()
+    slow = Edge("a", "b", 5.0, 4.0)
+    repo.save_edges_batch((Edge("a", "b", 1.0, 1.0), slow, Edge("b", "c", 1.0, 2.0)))
+
+    path = repo.find_max_delay_path("a", "c")
+
+    assert list(path) == [slow, Edge("b", "c", 1.0, 2.0)]
+
+
+def test_find_slack_below_is_an_indexed_range_scan(tmp_path):
+    repo = SqliteGraphRepository(str(tmp_path / "test_slack.db"))
+    repo.setup()
+    repo.replace_slack_rows(
+        [("A", 0.0, 1.0, 1.0, 0, False), ("B", 2.0, 1.5, -0.5, 1, True)]
+    )
+    repo.replace_slack_rows(
+        [("C", 1.0, 3.0, 2.0, 1, False), ("D", 4.0, 3.0, -1.0, 2, True)]
+    )
+
+    assert repo.find_slack_below(0.0) == [("D", 4.0, 3.0, -1.0)]
+    assert [row[0] for row in repo.find_slack_below(5.0, limit=1)] == ["D"]
+    with closing(sqlite3.connect(repo.db_path)) as conn:
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM slack WHERE slack < ? ORDER BY slack",
+            (0.0,),
+        ).fetchone()[-1]
+    assert "idx_slack" in plan, plan
+
+
+def test_metric_chunks_stream_edge_delay_and_endpoint_timing(tmp_path):
+    repo = SqliteGraphRepository(str(tmp_path / "test_metrics.db"))
+    repo.setup()
+    repo.save_edges_batch(
+        (Edge("A", "B", 1.0, 2.0), Edge("B", "C", 4.0, 3.0), Edge("C", "D"))
+    )
+    repo.replace_slack_rows(
+        [("B", 2.0, 5.0, 3.0, 1, False), ("D", 6.0, 5.0, -1.0, 3, True)]
+    )
+
+    chunks = list(repo.iter_metric_chunks("edge_delay", chunk_rows=2))
+
+    assert [len(c) for c in chunks] == [len(["A", "B"]), len(["C"])]
+    assert repo.metric_range("edge_delay") == (0.0, 4.0)
+    assert list(repo.iter_metric_chunks("depth", chunk_rows=8)) == [[("D", 3)]]
+    assert repo.metric_range("arrival") == (6.0, 6.0)
+
+
+@pytest.fixture
+def repo_with_cell_arcs(tmp_path):
+    """
+    u0.Z -> u1.A1, then the u1 cell arcs A1 -> ZN (2.0) and A2 -> ZN (9.0),
+    then u1.ZN -> u2.I. The arcs are stored as references to templates.
+    """
+    repo = SqliteGraphRepository(str(tmp_path / "arcs.db"))
+    repo.setup()
+    repo.save_edge_rows([("u0.Z", "u1.A1", 0.5, 0.5), ("u1.ZN", "u2.I", 1.0, 1.0)])
+    repo.save_delay_template_rows(
+        [(1, "ND2D1", "A1", "ZN", 2.0, 1.5), (2, "ND2D1", "A2", "ZN", 9.0, 9.0)]
+    )
+    repo.save_cell_arc_rows([("u1", 1), ("u1", 2), ("u1", 1)])
+    return repo
+
+
+def test_cell_arcs_are_traced_like_edges(repo_with_cell_arcs):
+    expected = [
+        Edge("u0.Z", "u1.A1", 0.5, 0.5),
+        Edge("u1.A1", "u1.ZN", 2.0, 1.5),
+        Edge("u1.ZN", "u2.I", 1.0, 1.0),
+    ]
+
+    exact = repo_with_cell_arcs.find_max_delay_path("u0.Z", "u2.I")
+    beam = repo_with_cell_arcs.find_max_delay_path("u0.Z", beam_width=4)
+    through = repo_with_cell_arcs.find_max_delay_path_through("u0.Z", ("u1.ZN",))
+
+    assert list(exact) == expected
+    assert list(beam) == expected
+    assert list(through) == expected
+
+
+def test_cell_arcs_are_stored_once_per_instance(repo_with_cell_arcs):
+    rows = sorted(repo_with_cell_arcs.iter_edge_rows())
+
+    assert rows == [
+        ("u0.Z", "u1.A1", 0.5, 0.5),
+        ("u1.A1", "u1.ZN", 2.0, 1.5),
+        ("u1.A2", "u1.ZN", 9.0, 9.0),
+        ("u1.ZN", "u2.I", 1.0, 1.0),
+    ]
+
+
+def test_cluster_edges_orders_the_heap_by_source_behind_a_covering_index(
+    repo_with_greedy_trap,
+):
+    repo = repo_with_greedy_trap
+    before = sorted(repo.iter_edge_rows())
+    expected = list(repo.find_max_delay_path("A", "E"))
+
+    repo.cluster_edges()
+    repo.setup()  # idempotent on the clustered layout
+
+    with closing(sqlite3.connect(repo.db_path)) as conn:
+        heap = conn.execute("SELECT src, dst FROM edges ORDER BY rowid").fetchall()
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT dst, delay_rise, delay_fall, rowid "
+            "FROM edges WHERE src = ?",
+            ("A",),
+        ).fetchone()[-1]
+    assert heap == sorted(heap)
+    assert "COVERING INDEX idx_edges_src_dst" in plan, plan
+    assert sorted(repo.iter_edge_rows()) == before
+    assert list(repo.find_max_delay_path("A", "E")) == expected
+    assert [e.dst_node for e in expected] == ["C", "E"]
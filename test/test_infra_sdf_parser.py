@@ -55,3 +55,86 @@ def test_parse_delays_extracts_interconnect_delays(parser, tmp_path):
     assert edge2.src_node == "u1.Q"
     assert edge2.delay_rise == max_2_rise
     assert edge2.delay_fall == max_2_fall
+
+
+def test_parse_cell_arc_rows_reads_iopath_per_instance(parser, tmp_path):
+    sdf_file = tmp_path / "cells.sdf"
+    sdf_file.write_text(
+        """
+(DELAYFILE
+  (CELL (CELLTYPE "TOP") (INSTANCE)
+    (DELAY (ABSOLUTE (IOPATH A Z (1.0::1.0))))
+  )
+  (CELL
+    (CELLTYPE "ND2D1")
+    (INSTANCE u_core/u1)
+    (DELAY
+      (ABSOLUTE
+        (IOPATH A1 ZN (0.010:0.015:0.020) (0.011:0.016:0.021))
+        (IOPATH A2 ZN (0.03))
+      )
+    )
+  )
+  (CELL (CELLTYPE "DFQD1") (INSTANCE u2)
+    (DELAY (ABSOLUTE (IOPATH (posedge CP) Q (0.1::0.2) (0.1::0.3))))
+  )
+)
+""",
+        encoding="utf-8",
+    )
+
+    rows = [row for batch in parser.parse_cell_arc_rows(sdf_file) for row in batch]
+
+    assert rows == [
+        ("u1", "ND2D1", "A1", "ZN", 0.020, 0.021),
+        ("u1", "ND2D1", "A2", "ZN", 0.03, 0.03),
+        ("u2", "DFQD1", "CP", "Q", 0.2, 0.3),
+    ]
+
+
+def test_hierarchical_names_keep_blocks_apart(tmp_path):
+    sdf_file = tmp_path / "blocks.sdf"
+    sdf_file.write_text(
+        "(DELAYFILE\n"
+        "(INTERCONNECT A/u1/Z B/u1/A (0.1::0.1) (0.1::0.1))\n"
+        "(INTERCONNECT A/u1/Z C/u1/A (0.2::0.2) (0.2::0.2))\n"
+        '(CELL (CELLTYPE "INV") (INSTANCE B/u1)\n'
+        "  (DELAY (ABSOLUTE (IOPATH A Z (0.3::0.3)))))\n"
+        ")\n",
+        encoding="utf-8",
+    )
+    parser = SDFStreamParser(hierarchical=True)
+
+    rows = [row for batch in parser.parse_delay_rows(sdf_file) for row in batch]
+    arcs = [row for batch in parser.parse_cell_arc_rows(sdf_file) for row in batch]
+
+    assert [row[:2] for row in rows] == [("A/u1.Z", "B/u1.A"), ("A/u1.Z", "C/u1.A")]
+    assert [row[:4] for row in arcs] == [("B/u1", "INV", "A", "Z")]
+
+
+def test_one_pass_yields_the_delays_and_arcs_of_both_passes(tmp_path):
+    sdf_file = tmp_path / "both.sdf"
+    sdf_file.write_text(
+        "(DELAYFILE\n"
+        '(CELL (CELLTYPE "TOP") (INSTANCE) (DELAY (ABSOLUTE\n'
+        "  (INTERCONNECT a/u1/Z a/u2/A (0.1::0.1) (0.1::0.1))\n"
+        "  (INTERCONNECT b/u1/Z b/u2/A (0.2::0.2)\n"
+        "    (0.2::0.2)))))\n"
+        '(CELL (CELLTYPE "INV") (INSTANCE a/u1)\n'
+        "  (DELAY (ABSOLUTE (IOPATH A Z (0.3::0.3)))))\n"
+        '(CELL (CELLTYPE "INV") (INSTANCE b/u1)\n'
+        "  (DELAY (ABSOLUTE (IOPATH A Z (0.3::0.3)))))\n"
+        ")\n",
+        encoding="utf-8",
+    )
+    parser = SDFStreamParser(hierarchical=True)
+
+    pairs = list(parser.parse_delay_and_cell_arc_rows(sdf_file, batch_size=1))
+
+    assert [row for delays, _ in pairs for row in delays] == [
+        row for batch in parser.parse_delay_rows(sdf_file) for row in batch
+    ]
+    assert [row for _, arcs in pairs for row in arcs] == [
+        ("a/u1", "INV", "A", "Z", 0.3, 0.3),
+        ("b/u1", "INV", "A", "Z", 0.3, 0.3),
+    ]
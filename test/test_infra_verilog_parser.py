@@ -0,0 +1,95 @@
+from src.infra.parser.verilog_stream_parser import VerilogStreamParser
+
+
+def test_vector_wires_are_stored_once_with_their_range(tmp_path):
+    verilog = tmp_path / "bus.v"
+    verilog.write_text(
+        "module top;\n"
+        "  wire [7:0] data;\n"
+        "  wire [WIDTH-1:0] param_bus;\n"
+        "  wire clk;\n"
+        "endmodule\n"
+    )
+    parser = VerilogStreamParser()
+
+    nodes = [row for batch in parser.parse_node_rows(verilog) for row in batch]
+
+    assert nodes == [("data",), ("param_bus",), ("clk",)]
+    assert parser.bus_rows() == [("data", 7, 0)]
+
+
+def test_bit_selects_connect_pins_and_assigns(tmp_path):
+    verilog = tmp_path / "bits.v"
+    verilog.write_text(
+        "module top;\n"
+        "  BUF u1 ( .A(data[3]), .Z( out [ 0 ] ) );\n"
+        "  assign q[1] = data[3];\n"
+        "  assign y = x;\n"
+        "endmodule\n"
+    )
+
+    edges = [
+        row[:2]
+        for batch in VerilogStreamParser().parse_edge_rows(verilog)
+        for row in batch
+    ]
+
+    assert edges == [
+        ("u1.A", "data[3]"),
+        ("u1.Z", "out[0]"),
+        ("data[3]", "q[1]"),
+        ("x", "y"),
+    ]
+
+
+def test_parse_modules_keeps_each_definition_local(tmp_path):
+    verilog = tmp_path / "hier.v"
+    verilog.write_text(
+        "module leaf ( a , z ) ;\n"
+        "  input a ;\n"
+        "  output z ;\n"
+        "  INV u_inv ( .I ( a ) , .ZN ( z ) ) ;\n"
+        "endmodule\n"
+        "module top ( in , out ) ;\n"
+        "  leaf u_l0 ( .a ( in ) , .z ( mid ) ) ;\n"
+        "  leaf u_l1 ( .a ( mid ) ,\n"
+        "    .z ( out ) ) ;\n"
+        "endmodule\n"
+    )
+
+    modules = {m.name: m for m in VerilogStreamParser().parse_modules(verilog)}
+
+    assert modules["leaf"].edges == (
+        ("u_inv.I", "a", 0.0, 0.0),
+        ("u_inv.ZN", "z", 0.0, 0.0),
+    )
+    assert modules["leaf"].instances == (("u_inv", "INV"),)
+    assert modules["top"].instances == (("u_l0", "leaf"), ("u_l1", "leaf"))
+    assert [e[:2] for e in modules["top"].edges] == [
+        ("u_l0.a", "in"),
+        ("u_l0.z", "mid"),
+        ("u_l1.a", "mid"),
+        ("u_l1.z", "out"),
+    ]
+
+
+def test_escaped_identifiers_keep_their_hierarchical_spelling(tmp_path):
+    verilog = tmp_path / "flat.v"
+    verilog.write_text(
+        "module top ( x ) ;\n"
+        "  wire \\u_a/n1 ;\n"
+        "  INV \\u_a/u1  ( .I ( x ) , .ZN ( \\u_a/n1  ) ) ;\n"
+        "  INV \\u_b/u1  ( .I ( \\u_a/n1  ) , .ZN ( y ) ) ;\n"
+        "endmodule\n"
+    )
+
+    edges = [
+        e for batch in VerilogStreamParser().parse_edge_rows(verilog) for e in batch
+    ]
+
+    assert [e[:2] for e in edges] == [
+        ("u_a/u1.I", "x"),
+        ("u_a/u1.ZN", "u_a/n1"),
+        ("u_b/u1.I", "u_a/n1"),
+        ("u_b/u1.ZN", "y"),
+    ]
@@ -1,8 +1,14 @@
+import json
+import sqlite3
+from contextlib import closing
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 from click.testing import CliRunner
 
+from src.domain.model.edge import Edge
+from src.domain.model.trace_result import SearchStats, TraceResult
+from src.infra.repository.sqlite_graph_repository import SqliteGraphRepository
 from src.interface.cli import cli
 
 
@@ -55,3 +61,359 @@ def test_cli_import_sdf_calls_usecase():
             args, kwargs = mock_usecase.execute.call_args
             assert args[0].name == "delay.sdf"
             assert "observer" in kwargs or len(args) > 1
+
+
+def test_cli_find_nodes_lists_matches():
+    runner = CliRunner()
+
+    with patch("src.interface.cli.FindNodesUseCase") as mock_class:
+        mock_class.return_value.execute.return_value = ("u1.CK", "u2.CK")
+
+        result = runner.invoke(cli, ["find-nodes", "*.CK", "--db", "graph.db"])
+
+    assert result.exit_code == 0, f"Command failed: {result.output}"
+    mock_class.return_value.execute.assert_called_once_with("*.CK", None)
+    assert "u1.CK" in result.output
+    assert "2 node(s) matched." in result.output
+
+
+def test_cli_trace_path_reports_approximate_beam_result():
+    runner = CliRunner()
+    path = TraceResult((Edge("A", "B", 1.0, 2.0),), approximate=True)
+
+    with patch("src.interface.cli.TracePathUseCase") as mock_class:
+        mock_class.return_value.execute.return_value = path
+
+        result = runner.invoke(cli, ["trace-path", "A", "--beam", "4"])
+
+    assert result.exit_code == 0, f"Command failed: {result.output}"
+    mock_class.return_value.execute.assert_called_once_with(
+        "A", None, beam_width=4, timeout=None
+    )
+    assert "approximate result (beam width 4)" in result.output
+
+
+def test_cli_trace_path_reports_partial_result_on_timeout():
+    runner = CliRunner()
+    stats = SearchStats(explored_paths=1200, explored_nodes=300, elapsed_seconds=2.0)
+    path = TraceResult((Edge("A", "B", 1.0, 2.0),), partial=True, stats=stats)
+
+    with patch("src.interface.cli.TracePathUseCase") as mock_class:
+        mock_class.return_value.execute.return_value = path
+
+        result = runner.invoke(cli, ["trace-path", "A", "--timeout", "2"])
+
+    assert result.exit_code == 0, f"Command failed: {result.output}"
+    mock_class.return_value.execute.assert_called_once_with(
+        "A", None, beam_width=None, timeout=2.0
+    )
+    assert "timed out after 2.0s" in result.output
+    assert "1200 paths over 300 nodes" in result.output
+
+
+def test_cli_trace_path_through_uses_waypoints_in_order():
+    runner = CliRunner()
+    path = TraceResult((Edge("A", "M", 1.0, 2.0), Edge("M", "B", 1.0, 1.0)))
+
+    with patch("src.interface.cli.TracePathUseCase") as mock_class:
+        mock_class.return_value.execute_through.return_value = path
+
+        result = runner.invoke(
+            cli, ["trace-path", "A", "B", "--through", "M", "--through", "N"]
+        )
+        rejected = runner.invoke(
+            cli, ["trace-path", "A", "--through", "M", "--beam", "2"]
+        )
+
+    assert result.exit_code == 0, f"Command failed: {result.output}"
+    mock_class.return_value.execute_through.assert_called_once_with(
+        "A", ("M", "N"), "B", timeout=None
+    )
+    assert "to B through M -> N" in result.output
+    assert rejected.exit_code != 0
+    assert "--through cannot be combined with --beam" in rejected.output
+
+
+def test_cli_import_verilog_writes_profile(tmp_path):
+    runner = CliRunner()
+    design = Path("test/input/infra/real_content/CHIPTOP_Decoder_inst_design.v")
+    profile = tmp_path / "profile.json"
+    db = tmp_path / "graph.db"
+
+    with patch("src.interface.cli.tqdm"):
+        result = runner.invoke(
+            cli,
+            ["import-verilog", str(design), "--db", str(db), "--profile", str(profile)],
+        )
+
+    assert result.exit_code == 0, f"Command failed: {result.output}"
+    report = json.loads(profile.read_text())
+    stages = {stage["name"]: stage for stage in report["stages"]}
+    assert set(stages) == {"import_nodes", "import_edges", "build_node_lookup"}
+    assert stages["import_edges"]["rows"] > 0
+    assert {"parse", "write", "sql:insert_edges", "commit"} <= set(
+        stages["import_edges"]["timings"]
+    )
+
+
+def test_cli_flatten_reports_materialized_edges():
+    runner = CliRunner()
+    written = 12
+
+    with runner.isolated_filesystem():
+        with patch("src.interface.cli.FlattenHierarchyUseCase") as mock_class:
+            mock_class.return_value.execute.return_value = written
+
+            result = runner.invoke(
+                cli, ["flatten", "--db", "graph.db", "--block", "u_core"]
+            )
+
+    assert result.exit_code == 0, result.output
+    mock_class.return_value.execute.assert_called_once()
+    assert mock_class.return_value.execute.call_args.args[:2] == (None, "u_core")
+    assert f"Materialized {written} edge(s)." in result.output
+
+
+def test_cli_sdf_delays_match_flattened_hierarchical_names():
+    runner = CliRunner()
+    netlist = (
+        "module leaf ( a , z ) ;\n"
+        "  INV u_inv ( .I ( a ) , .ZN ( z ) ) ;\n"
+        "endmodule\n"
+        "module top ( in , out ) ;\n"
+        "  leaf u_l0 ( .a ( in ) , .z ( mid ) ) ;\n"
+        "  leaf u_l1 ( .a ( mid ) , .z ( out ) ) ;\n"
+        "endmodule\n"
+    )
+    sdf = (
+        '(DELAYFILE (CELL (CELLTYPE "top") (INSTANCE) (DELAY (ABSOLUTE\n'
+        "  (INTERCONNECT u_l0/u_inv/ZN u_l1/u_inv/I (0.3::0.4) (0.5::0.6))))))\n"
+    )
+
+    with runner.isolated_filesystem(), patch("src.interface.cli.tqdm"):
+        Path("top.v").write_text(netlist)
+        Path("top.sdf").write_text(sdf)
+        runner.invoke(cli, ["import-verilog", "top.v", "--hierarchical"])
+        runner.invoke(cli, ["flatten"])
+        delays = runner.invoke(cli, ["import-sdf", "top.sdf", "--no-iopath"])
+        rejected = runner.invoke(
+            cli, ["import-verilog", "top.v", "--hierarchical", "--memory-budget", "64"]
+        )
+        with closing(sqlite3.connect("gls.db")) as connection:
+            annotated = connection.execute(
+                "SELECT src, delay_rise, delay_fall FROM edges WHERE delay_rise > 0"
+            ).fetchall()
+
+    assert delays.exit_code == 0, delays.output
+    assert annotated == [("u_l1/u_inv.I", 0.4, 0.6)]
+    assert rejected.exit_code != 0
+    assert "--memory-budget cannot be combined with --hierarchical" in rejected.output
+
+
+def test_cli_slack_lists_nodes_below_threshold():
+    runner = CliRunner()
+
+    with runner.isolated_filesystem():
+        repo = SqliteGraphRepository("graph.db")
+        repo.setup()
+        repo.save_edges_batch((Edge("A", "B", 2.0, 1.0), Edge("B", "C", 3.0, 3.0)))
+        repo.close()
+        Path("limits.txt").write_text("# endpoint required\nC 4.0\n")
+
+        result = runner.invoke(
+            cli, ["slack", "--db", "graph.db", "--constraints", "limits.txt"]
+        )
+        missing = runner.invoke(cli, ["slack", "--db", "graph.db"])
+
+    assert result.exit_code == 0, result.output
+    assert "Slack computed for 3 nodes from 1 endpoints (worst: -1.00000)." in (
+        result.output
+    )
+    assert "-1.00000  C (Arrival: 5.00000, Required: 4.00000)" in result.output
+    assert missing.exit_code != 0
+
+
+def test_cli_stats_prints_percentiles_and_histogram_per_metric():
+    runner = CliRunner()
+
+    with runner.isolated_filesystem():
+        repo = SqliteGraphRepository("graph.db")
+        repo.setup()
+        repo.save_edges_batch(
+            (Edge("u1/a.Z", "x", 1.0, 2.0), Edge("u2/b.Z", "y", 4.0, 3.0))
+        )
+        repo.close()
+
+        result = runner.invoke(
+            cli, ["stats", "--db", "graph.db", "--bins", "2", "--by-prefix"]
+        )
+
+    assert result.exit_code == 0, result.output
+    assert "edge_delay: n=2 min=2.00000 mean=3.00000 max=4.00000" in result.output
+    assert "p50=" in result.output and "p99.9=" in result.output
+    assert "  u1: n=1 min=2.00000" in result.output
+    assert "arrival: no values." in result.output
+
+
+def test_cli_export_columnar_writes_npy_bundle():
+    runner = CliRunner()
+
+    with runner.isolated_filesystem():
+        repo = SqliteGraphRepository("graph.db")
+        repo.setup()
+        repo.save_edges_batch((Edge("A", "B", 1.0, 2.0),))
+        repo.close()
+
+        result = runner.invoke(cli, ["export-columnar", "out", "--db", "graph.db"])
+        files = sorted(p.name for p in Path("out").iterdir())
+
+    assert result.exit_code == 0, result.output
+    assert "Exported 2 nodes and 1 edges to out." in result.output
+    assert "src.npy" in files and "name_bytes.npy" in files
+
+
+def test_cli_trace_batch_reports_one_line_per_start():
+    runner = CliRunner()
+
+    with runner.isolated_filesystem():
+        repo = SqliteGraphRepository("graph.db")
+        repo.setup()
+        repo.save_edges_batch((Edge("A", "B", 1.0, 2.0), Edge("B", "C", 0.5, 0.5)))
+        repo.close()
+        Path("starts.txt").write_text("A  # launch\n\nC\n")
+
+        args = ["trace-batch", "starts.txt", "--db", "graph.db", "-j", "1"]
+        result = runner.invoke(cli, [*args, "--graph-dir", "graph"])
+        reused = runner.invoke(cli, [*args, "--graph-dir", "graph"])
+
+    assert result.exit_code == 0, result.output
+    assert "A -> C: 2.50000 over 2 edge(s)" in result.output
+    assert "C: no path" in result.output
+    assert "Traced 2 start node(s)." in result.output
+    assert reused.output == result.output
+
+
+def test_cli_trace_batch_exports_a_kept_graph_again_after_the_db_changes():
+    runner = CliRunner()
+
+    with runner.isolated_filesystem():
+        repo = SqliteGraphRepository("graph.db")
+        repo.setup()
+        repo.save_edges_batch((Edge("A", "B", 1.0, 2.0),))
+        Path("starts.txt").write_text("A\n")
+        args = ["trace-batch", "starts.txt", "--db", "graph.db", "-j", "1"]
+        before = runner.invoke(cli, [*args, "--graph-dir", "graph"])
+        exported = Path("graph/src.npy").stat().st_mtime_ns
+        runner.invoke(cli, [*args, "--graph-dir", "graph"])
+        reused = Path("graph/src.npy").stat().st_mtime_ns == exported
+        repo.save_edges_batch((Edge("B", "C", 0.5, 0.5),))
+        repo.close()
+        after = runner.invoke(cli, [*args, "--graph-dir", "graph"])
+
+    assert "A -> B: 2.00000 over 1 edge(s)" in before.output
+    assert reused
+    assert "A -> C: 2.50000 over 2 edge(s)" in after.output
+
+
+def test_cli_cluster_edges_keeps_traces():
+    runner = CliRunner()
+
+    with runner.isolated_filesystem():
+        repo = SqliteGraphRepository("graph.db")
+        repo.setup()
+        repo.save_edges_batch((Edge("B", "C", 0.5, 0.5), Edge("A", "B", 1.0, 2.0)))
+        repo.close()
+
+        result = runner.invoke(cli, ["cluster-edges", "--db", "graph.db"])
+        traced = runner.invoke(cli, ["trace-path", "A", "C", "--db", "graph.db"])
+
+    assert result.exit_code == 0, result.output
+    assert "Edges clustered by source." in result.output
+    assert "Total Delay: Rise=1.50000, Fall=2.50000" in traced.output
+
+
+def test_cli_import_many_files_from_a_glob_reports_each_file():
+    runner = CliRunner()
+    netlist = (
+        "module {0} ( x ) ;\ninput x ;\n"
+        "BUFD1 {0}_u1 ( .I ( x ) , .Z ( {0}_n ) ) ;\nendmodule\n"
+    )
+    sdf = (
+        '(DELAYFILE (CELL (CELLTYPE "BUFD1") (INSTANCE {0}_u1) (DELAY (ABSOLUTE\n'
+        "  (IOPATH I Z (0.1::0.2) (0.3::0.4))))))\n"
+    )
+
+    with runner.isolated_filesystem(), patch("src.interface.cli.tqdm"):
+        Path("blocks").mkdir()
+        for name in ("a", "b"):
+            Path(f"blocks/{name}.v").write_text(netlist.format(name))
+            Path(f"blocks/{name}.sdf").write_text(sdf.format(name))
+
+        verilog = runner.invoke(cli, ["import-verilog", "blocks/*.v", "-j", "2"])
+        delays = runner.invoke(cli, ["import-sdf", "blocks/*.sdf", "-j", "2"])
+        rejected = runner.invoke(
+            cli, ["import-verilog", "blocks/*.v", "--hierarchical"]
+        )
+
+    assert verilog.exit_code == 0, verilog.output
+    assert "  blocks/a.v: 1 nodes, 2 edges in " in verilog.output
+    assert "  blocks/b.v: 1 nodes, 2 edges in " in verilog.output
+    assert delays.exit_code == 0, delays.output
+    assert "  blocks/b.sdf: 1 arcs in " in delays.output
+    assert "Imported 2 cell arc(s) over 1 delay template(s)." in delays.output
+    assert rejected.exit_code != 0
+    assert "--hierarchical takes one file." in rejected.output
+
+
+def test_cli_import_only_cone_keeps_the_fanin_of_the_endpoints():
+    runner = CliRunner()
+    netlist = (
+        "module top ( a , y , z ) ;\ninput a ;\noutput y ;\noutput z ;\n"
+        "BUFD1 u1 ( .I ( a ) , .Z ( n1 ) ) ;\n"
+        "INVD1 u2 ( .I ( n1 ) , .ZN ( y ) ) ;\n"
+        "INVD1 u3 ( .I ( n1 ) , .ZN ( z ) ) ;\nendmodule\n"
+    )
+    arcs = "".join(
+        f'(CELL (CELLTYPE "{cell}") (INSTANCE {inst}) (DELAY (ABSOLUTE\n'
+        f"  (IOPATH I {pin} (0.1::0.2) (0.1::0.2)))))\n"
+        for cell, inst, pin in (
+            ("BUFD1", "u1", "Z"),
+            ("INVD1", "u2", "ZN"),
+            ("INVD1", "u3", "ZN"),
+        )
+    )
+    sdf = (
+        '(DELAYFILE (CELL (CELLTYPE "top") (INSTANCE) (DELAY (ABSOLUTE\n'
+        "  (INTERCONNECT u1/Z u2/I (0.3::0.4) (0.3::0.4))\n"
+        "  (INTERCONNECT u1/Z u3/I (0.5::0.6) (0.5::0.6)))))\n" + arcs + ")\n"
+    )
+
+    with runner.isolated_filesystem(), patch("src.interface.cli.tqdm"):
+        Path("top.v").write_text(netlist)
+        Path("top.sdf").write_text(sdf)
+        Path("endpoints.txt").write_text("y  # failing endpoint\nmissing\n")
+        cone_args = ["--only-cone", "endpoints.txt", "--sdf", "top.sdf"]
+
+        verilog = runner.invoke(cli, ["import-verilog", "top.v", *cone_args])
+        rejected = runner.invoke(cli, ["import-verilog", "top.v", *cone_args[:2]])
+        with closing(sqlite3.connect("gls.db")) as connection:
+            edges = connection.execute(
+                "SELECT src, dst, delay_rise FROM edges ORDER BY src"
+            ).fetchall()
+            instances = connection.execute(
+                "SELECT instance FROM cell_arcs ORDER BY instance"
+            ).fetchall()
+
+    assert verilog.exit_code == 0, verilog.output
+    assert "Fan-in cone of 2 endpoint(s): 7 node(s)." in verilog.output
+    assert "Note: endpoint missing matches no pin or net." in verilog.output
+    assert "Imported 1 delay(s) and 2 cell arc(s) of the cone." in verilog.output
+    assert edges == [
+        ("u1.I", "a", 0.0),
+        ("u1.Z", "n1", 0.0),
+        ("u2.I", "n1", 0.4),
+        ("u2.ZN", "y", 0.0),
+    ]
+    assert instances == [("u1",), ("u2",)]
+    assert rejected.exit_code != 0
+    assert "--only-cone needs --sdf for the pin directions." in rejected.output
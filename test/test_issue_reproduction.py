@@ -105,23 +105,25 @@ def test_anchor_query_works(repo_with_data):
     assert row[1] == "net1966"
 
 
-def test_fetch_path_string_returns_csv(repo_with_data):
+def test_fetch_edge_ids_returns_csv(repo_with_data):
     start = "u_cell_3491.ZN"
     end = "net1966"
 
-    path_str = repo_with_data._fetch_max_delay_path_string(start, end, depth=10)
+    with repo_with_data.read_connection() as connection:
+        edge_ids = repo_with_data._fetch_max_delay_edge_ids(
+            connection, start, end, depth=10
+        )
 
-    assert path_str is not None, (
+    assert edge_ids is not None, (
         "CTE returned None! The recursive query logic is broken."
     )
-    assert path_str == "u_cell_3491.ZN,net1966"
+    assert edge_ids == "1"
 
 
-def test_reconstruct_edges_works(repo_with_data):
-    """【Step 3】CSV文字列から Edge オブジェクトを復元できるか？"""
-    path_str = "u_cell_3491.ZN,net1966"
-
-    edges = repo_with_data._reconstruct_edges_from_path(path_str)
+def test_materialize_edges_works(repo_with_data):
+    """【Step 3】rowid の CSV 文字列から Edge オブジェクトを 1 クエリで復元できるか？"""
+    with repo_with_data.read_connection() as connection:
+        edges = repo_with_data._materialize_edges(connection, "1")
 
     assert len(edges) == 1, "Reconstruction failed! Could not fetch edge from DB."
     assert edges[0].src_node == "u_cell_3491.ZN"
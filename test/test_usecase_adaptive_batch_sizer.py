@@ -0,0 +1,71 @@
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from src.usecase.adaptive_batch_sizer import AdaptiveBatchSizer
+from src.usecase.import_sdf import ImportSDFUseCase
+
+
+def test_grows_while_writes_are_cheap():
+    initial = 10_000
+    sizer = AdaptiveBatchSizer(initial=initial, target_seconds=1.0)
+
+    sizer.observe(rows=initial, seconds=0.01)
+
+    assert sizer.size == initial * 2
+
+
+def test_shrinks_when_writes_are_slow():
+    initial = 100_000
+    sizer = AdaptiveBatchSizer(initial=initial, target_seconds=1.0)
+
+    sizer.observe(rows=initial, seconds=5.0)
+
+    assert sizer.size == initial // 2
+
+
+def test_shrinks_near_memory_budget_even_when_fast():
+    budget, initial = 1_000, 100_000
+    sizer = AdaptiveBatchSizer(
+        initial=initial, memory_budget=budget, memory_probe=lambda: budget
+    )
+
+    sizer.observe(rows=initial, seconds=0.01)
+
+    assert sizer.size < initial
+
+
+def test_does_not_grow_on_partial_batch_or_without_headroom():
+    budget, initial = 1_000, 10_000
+    sizer = AdaptiveBatchSizer(
+        initial=initial, memory_budget=budget, memory_probe=lambda: budget * 0.8
+    )
+
+    sizer.observe(rows=initial, seconds=0.01)
+    sizer.observe(rows=10, seconds=0.0)
+
+    assert sizer.size == initial
+
+
+def test_rebatch_regroups_chunks_to_current_size():
+    sizer = AdaptiveBatchSizer(initial=5_000)
+    chunks = [tuple(range(i, i + 2_000)) for i in range(0, 12_000, 2_000)]
+
+    batches = list(sizer.rebatch(chunks))
+
+    assert [len(b) for b in batches] == [6_000, 6_000]
+    assert [x for b in batches for x in b] == list(range(12_000))
+
+
+def test_import_sdf_requests_chunks_and_writes_rebatched():
+    mock_repo = MagicMock()
+    mock_parser = MagicMock()
+    sizer = AdaptiveBatchSizer(initial=5_000)
+    chunk = [(f"u{i}.Q", f"u{i}.D", 0.1, 0.1) for i in range(3_000)]
+    mock_parser.parse_delay_rows.return_value = iter((chunk, chunk))
+
+    ImportSDFUseCase(mock_repo, mock_parser, sizer).execute(Path("dummy.sdf"))
+
+    mock_parser.parse_delay_rows.assert_called_once_with(
+        Path("dummy.sdf"), batch_size=sizer.chunk_size, observer=None
+    )
+    mock_repo.update_edge_delay_rows.assert_called_once_with(chunk + chunk)
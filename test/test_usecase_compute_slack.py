@@ -0,0 +1,69 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.usecase.compute_slack import ComputeSlackUseCase
+
+# A --(2)--> B --(3)--> D
+# A --(1)--> C --(1)--> D --(4)--> Q (sink)
+#            C --(2)--> R (sink)
+EDGES = [
+    ("A", "B", 2.0, 1.0),
+    ("B", "D", 3.0, 3.0),
+    ("A", "C", 1.0, 1.0),
+    ("C", "D", 1.0, 0.5),
+    ("D", "Q", 4.0, 4.0),
+    ("C", "R", 2.0, 2.0),
+]
+
+
+def _run(required_times, clock_period=None):
+    repo = MagicMock()
+    repo.iter_edge_rows.return_value = iter(EDGES)
+    summary = ComputeSlackUseCase(repo).execute(required_times, clock_period)
+    rows = repo.replace_slack_rows.call_args.args[0]
+    return summary, {node: row for node, *row, _, _ in rows}, rows
+
+
+def test_execute_propagates_required_time_backward_from_constraints():
+    summary, slack, _ = _run({"Q": 10.0})
+
+    assert slack["Q"] == pytest.approx([9.0, 10.0, 1.0])
+    assert slack["D"] == pytest.approx([5.0, 6.0, 1.0])
+    assert slack["C"] == pytest.approx([1.0, 5.0, 4.0])
+    assert slack["A"] == pytest.approx([0.0, 1.0, 1.0])
+    assert "R" not in slack
+    assert summary.endpoints == 1
+    assert summary.worst_slack == pytest.approx(1.0)
+
+
+def test_execute_clock_period_constrains_sinks_and_file_overrides_it():
+    summary, slack, _ = _run({"R": 2.5}, clock_period=8.0)
+
+    assert slack["Q"][1] == pytest.approx(8.0)
+    assert slack["R"] == pytest.approx([3.0, 2.5, -0.5])
+    assert slack["C"][1] == pytest.approx(0.5)
+    assert summary.endpoints == len(["Q", "R"])
+    assert summary.worst_slack == pytest.approx(-1.0)
+
+
+def test_execute_records_depth_of_the_worst_arrival_and_endpoints():
+    _, _, rows = _run({"D": 9.0}, clock_period=12.0)
+
+    depth = {row[0]: row[4] for row in rows}
+    endpoints = {row[0] for row in rows if row[5]}
+    assert depth == {"A": 0, "B": 1, "C": 1, "D": 2, "Q": 3, "R": 2}
+    assert endpoints == {"D", "Q", "R"}
+
+
+def test_execute_twice_on_one_instance_reads_the_graph_afresh():
+    repo = MagicMock()
+    repo.iter_edge_rows.side_effect = [iter(EDGES), iter(EDGES[:2])]
+    usecase = ComputeSlackUseCase(repo)
+    usecase.execute({"Q": 10.0})
+
+    summary = usecase.execute({}, clock_period=10.0)
+
+    rows = repo.replace_slack_rows.call_args.args[0]
+    assert [row[0] for row in rows] == ["A", "B", "D"]
+    assert summary.worst_slack == pytest.approx(5.0)
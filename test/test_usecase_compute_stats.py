@@ -0,0 +1,62 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from src.usecase.compute_stats import PERCENTILES, ComputeStatsUseCase
+
+
+def _repo_with(rows, chunk_rows):
+    repo = MagicMock()
+    values = [v for _, v in rows]
+    repo.metric_range.return_value = (min(values), max(values))
+    repo.iter_metric_chunks.return_value = (
+        rows[i : i + chunk_rows] for i in range(0, len(rows), chunk_rows)
+    )
+    return repo
+
+
+def test_execute_streams_chunks_into_percentiles_and_histogram():
+    rng = np.random.default_rng(7)
+    values = rng.gamma(2.0, 0.05, size=20_000)
+    rows = [(f"u{i % 3}/x{i}.Z", float(v)) for i, v in enumerate(values)]
+    bins = 8
+
+    (overall,) = ComputeStatsUseCase(_repo_with(rows, 4096), chunk_rows=4096).execute(
+        "edge_delay", bins=bins
+    )
+
+    # Within a fine bin, plus a bin of slack for sample interpolation in the tail
+    resolution = 2 * (values.max() - values.min()) / (bins * 64)
+    expected = np.percentile(values, PERCENTILES)
+    for (q, value), exact in zip(overall.percentiles, expected, strict=True):
+        assert value == pytest.approx(exact, abs=resolution), q
+    assert overall.count == len(values)
+    assert sum(overall.bin_counts) == len(values)
+    assert len(overall.bin_edges) == bins + 1
+    assert overall.mean == pytest.approx(values.mean())
+    assert (overall.minimum, overall.maximum) == (values.min(), values.max())
+
+
+def test_execute_breaks_down_by_top_level_prefix():
+    rows = [("u_core/a.Z", 1.0), ("u_core/b.Z", 3.0), ("u_io.Z", 2.0), ("top", 5.0)]
+
+    overall, *groups = ComputeStatsUseCase(_repo_with(rows, 3), chunk_rows=3).execute(
+        "arrival", by_prefix=True
+    )
+
+    assert overall.group is None and overall.count == len(rows)
+    assert [(g.group, g.count, g.maximum) for g in groups] == [
+        ("top", 1, 5.0),
+        ("u_core", 2, 3.0),
+        ("u_io", 1, 2.0),
+    ]
+    assert groups[1].mean == pytest.approx(2.0)
+
+
+def test_execute_returns_nothing_without_rows():
+    repo = MagicMock()
+    repo.metric_range.return_value = None
+
+    assert ComputeStatsUseCase(repo).execute("depth") == ()
+    repo.iter_metric_chunks.assert_not_called()
@@ -0,0 +1,175 @@
+import os
+import sqlite3
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import closing
+from pathlib import Path
+
+import pytest
+
+from src.infra.parser.sdf_stream_parser import SDFStreamParser
+from src.infra.parser.verilog_stream_parser import VerilogStreamParser
+from src.infra.repository.sqlite_graph_repository import SqliteGraphRepository
+from src.usecase.adaptive_batch_sizer import AdaptiveBatchSizer
+from src.usecase.concurrent_import import ConcurrentFileImport, FileProgress
+from src.usecase.import_cell_arcs import ImportCellArcsUseCase
+from src.usecase.import_sdf import ImportSDFUseCase
+from src.usecase.import_verilog import ImportVerilogUseCase
+
+_BLOCKS = ("a", "b", "c")
+
+
+def _write_block(directory: Path, name: str) -> tuple[Path, Path]:
+    """A two-cell block driven by the shared input clk."""
+    verilog = directory / f"{name}.v"
+    verilog.write_text(
+        f"module {name} ( clk , {name}_y ) ;\n"
+        f"input clk ;\noutput {name}_y ;\n"
+        f"BUFD1 {name}_u1 ( .I ( clk ) , .Z ( {name}_n1 ) ) ;\n"
+        f"INVD1 {name}_u2 ( .I ( {name}_n1 ) , .ZN ( {name}_y ) ) ;\n"
+        "endmodule\n"
+    )
+    sdf = directory / f"{name}.sdf"
+    sdf.write_text(
+        "(DELAYFILE\n(DIVIDER /)\n"
+        f'(CELL (CELLTYPE "{name}") (INSTANCE) (DELAY (ABSOLUTE\n'
+        f"  (INTERCONNECT {name}_u1/Z {name}_u2/I (0.1::0.2) (0.3::0.4)))))\n"
+        f'(CELL (CELLTYPE "BUFD1") (INSTANCE {name}_u1) (DELAY (ABSOLUTE\n'
+        "  (IOPATH I Z (0.5::0.6) (0.7::0.8)))))\n"
+        ")\n"
+    )
+    return verilog, sdf
+
+
+def _dump(db_path: str) -> dict[str, list[tuple]]:
+    queries = {
+        "nodes": "SELECT name FROM nodes ORDER BY name",
+        "edges": "SELECT src, dst, delay_rise, delay_fall FROM edges ORDER BY 1, 2",
+        "arcs": "SELECT COUNT(*) FROM cell_arcs",
+    }
+    with closing(sqlite3.connect(db_path)) as connection:
+        return {
+            table: connection.execute(sql).fetchall() for table, sql in queries.items()
+        }
+
+
+def _import(
+    db_path: Path,
+    files: list[tuple[Path, Path]],
+    workers: int | None,
+    on_progress: FileProgress | None = None,
+):
+    repo = SqliteGraphRepository(str(db_path))
+    repo.setup()
+    verilog = ImportVerilogUseCase(repo, VerilogStreamParser())
+    arcs = ImportCellArcsUseCase(repo)
+    delays = ImportSDFUseCase(repo, SDFStreamParser(), cell_arcs=arcs)
+    if workers is None:
+        for verilog_path, _ in files:
+            verilog.execute(verilog_path)
+        for _, sdf_path in files:
+            delays.execute(sdf_path)
+        summaries = None
+    else:
+        verilog_paths, sdf_paths = zip(*files, strict=True)
+        summaries = (
+            verilog.execute_many(verilog_paths, workers, on_progress),
+            delays.execute_many(sdf_paths, workers),
+        )
+    repo.close()
+    return summaries
+
+
+def test_execute_many_imports_the_same_graph_as_one_file_at_a_time(tmp_path):
+    files = [_write_block(tmp_path, name) for name in _BLOCKS]
+    progress = dict.fromkeys(range(len(files)), 0)
+
+    def on_progress(index: int, increment: int) -> None:
+        progress[index] += increment
+
+    _import(tmp_path / "sequential.db", files, workers=None)
+    verilog_files, delays = _import(tmp_path / "concurrent.db", files, 2, on_progress)
+
+    assert _dump(str(tmp_path / "concurrent.db")) == _dump(
+        str(tmp_path / "sequential.db")
+    )
+    assert [summary.path for summary in verilog_files] == [v for v, _ in files]
+    assert [summary.rows["edges"] for summary in verilog_files] == [4, 4, 4]
+    assert [summary.rows["delays"] for summary in delays.files] == [1, 1, 1]
+    assert (delays.written, delays.discarded) == (len(_BLOCKS), 0)
+    assert (delays.cell_arcs.arcs, delays.cell_arcs.templates) == (len(_BLOCKS), 1)
+    # Both passes over each netlist are reported against that file.
+    assert progress == {
+        index: 2 * verilog.stat().st_size for index, (verilog, _) in enumerate(files)
+    }
+
+
+def test_execute_many_reraises_a_worker_parse_error(tmp_path):
+    verilog, _ = _write_block(tmp_path, "a")
+    repo = SqliteGraphRepository(str(tmp_path / "graph.db"))
+    repo.setup()
+    usecase = ImportVerilogUseCase(repo, VerilogStreamParser())
+
+    with pytest.raises(FileNotFoundError):
+        usecase.execute_many([verilog, tmp_path / "missing.v"], workers=2)
+    repo.close()
+
+
+def _die(path: Path, observer) -> list[tuple[str, list]]:
+    """Kills its worker process, which then never reports the file done."""
+    os._exit(1)
+
+
+def test_run_raises_when_a_worker_process_dies(tmp_path):
+    paths = [tmp_path / "a.v", tmp_path / "b.v"]
+
+    with pytest.raises(BrokenProcessPool):
+        ConcurrentFileImport(_die, workers=2).run("import", paths, {})
+
+
+def _small_chunks(path: Path, observer) -> list[tuple[str, list]]:
+    """Three 2000-row node chunks and three 10-row edge chunks, interleaved."""
+    chunk = [("nodes", [path.name] * 2000), ("edges", [path.name] * 10)]
+    return chunk * 3
+
+
+def test_run_with_a_sizer_writes_batches_of_its_size_per_kind(tmp_path):
+    paths = [tmp_path / "a.v", tmp_path / "b.v"]
+    initial = 5_000
+    sizer = AdaptiveBatchSizer(initial=initial)
+    written: dict[str, list[int]] = {"nodes": [], "edges": []}
+    writers = {
+        kind: (lambda rows, k=kind: written[k].append(len(rows))) for kind in written
+    }
+
+    files = ConcurrentFileImport(_small_chunks, workers=2, sizer=sizer).run(
+        "import", paths, writers
+    )
+
+    assert sum(written["nodes"]) == 2 * 6000
+    assert all(rows >= initial for rows in written["nodes"])
+    assert written["edges"] == [2 * 30]
+    assert [file.rows for file in files] == [{"nodes": 6000, "edges": 30}] * 2
+
+
+def test_execute_many_prefilters_in_the_workers(tmp_path):
+    files = [_write_block(tmp_path, name) for name in _BLOCKS]
+    repo = SqliteGraphRepository(str(tmp_path / "graph.db"))
+    repo.setup()
+    cone = frozenset({"a_u2.I", "a_u1.Z"})
+    arcs = ImportCellArcsUseCase(repo, cone)
+    delays = ImportSDFUseCase(repo, SDFStreamParser(), prefilter=cone, cell_arcs=arcs)
+
+    summary = delays.execute_many([sdf for _, sdf in files], workers=2)
+    repo.close()
+
+    dropped = len(_BLOCKS) - 1
+    assert [file.rows for file in summary.files] == [
+        {"delays": 1, "arcs": 1},
+        {},
+        {},
+    ]
+    assert [file.discarded for file in summary.files][1:] == [
+        {"delays": 1, "arcs": 1}
+    ] * dropped
+    assert (summary.written, summary.discarded) == (1, dropped)
+    assert (summary.cell_arcs.arcs, summary.cell_arcs.discarded) == (1, dropped)
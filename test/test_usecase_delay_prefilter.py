@@ -0,0 +1,51 @@
+import pickle
+from pathlib import Path
+from unittest.mock import MagicMock, call
+
+from src.usecase.bloom_filter import BloomFilter
+from src.usecase.delay_prefilter import DelayPrefilter
+from src.usecase.import_sdf import ImportSDFUseCase
+
+
+def test_bloom_filter_has_no_false_negatives_and_few_false_positives():
+    keys = [f"u{i}.A" for i in range(10_000)]
+    bloom = BloomFilter.from_keys(keys, capacity=len(keys), error_rate=0.01)
+
+    assert all(key in bloom for key in keys)
+    false_positives = sum(f"v{i}.A" in bloom for i in range(10_000))
+    assert false_positives < len(keys) * 0.03
+
+
+def test_bloom_filter_survives_pickling_for_worker_processes():
+    bloom = BloomFilter.from_keys(["u1.A", "u2.B"], capacity=2)
+
+    restored = pickle.loads(pickle.dumps(bloom))
+
+    assert "u1.A" in restored
+    assert "u2.B" in restored
+
+
+def test_prefilter_counts_discarded_rows():
+    prefilter = DelayPrefilter({"u2.A"})
+    rows = [("u1.Q", "u2.A", 0.1, 0.1), ("u1.Q", "u9.Z", 0.2, 0.2)]
+
+    assert prefilter.apply(rows) == [rows[0]]
+    assert (prefilter.kept, prefilter.discarded) == (1, 1)
+
+
+def test_import_sdf_with_prefilter_skips_unmatched_records():
+    mock_repo = MagicMock()
+    mock_repo.count_edge_sources.return_value = 1
+    mock_repo.iter_edge_sources.return_value = iter(["u2.A"])
+    mock_parser = MagicMock()
+    matched = ("u1.Q", "u2.A", 0.1, 0.1)
+    batch_1 = [matched, ("u1.Q", "u9.Z", 0.2, 0.2)]
+    batch_2 = [("u3.Q", "u8.Z", 0.3, 0.3)]
+    mock_parser.parse_delay_rows.return_value = iter((batch_1, batch_2))
+
+    use_case = ImportSDFUseCase(repo=mock_repo, parser=mock_parser, prefilter=True)
+    summary = use_case.execute(Path("dummy.sdf"))
+
+    mock_repo.update_edge_delay_rows.assert_has_calls([call([matched])])
+    assert mock_repo.update_edge_delay_rows.call_count == 1
+    assert (summary.written, summary.discarded) == (1, 2)
@@ -0,0 +1,81 @@
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from src.usecase.fanin_cone import BuildFaninConeUseCase, ConnectivityIndex
+
+
+def _index() -> ConnectivityIndex:
+    """
+    in -> u1 (BUF) -> n1 -> u2 (INV) -> out, where n1 also feeds u3, and
+    u3 -> side. u2.I is reached only through the netlist (no INTERCONNECT).
+    """
+    index = ConnectivityIndex()
+    index.add_interconnects([("u1.Z", "u3.I", 0.1, 0.1)])
+    index.add_cell_arcs(
+        [
+            ("u1", "BUFD1", "I", "Z", 0.2, 0.2),
+            ("u2", "INVD1", "I", "ZN", 0.3, 0.3),
+            ("u3", "INVD1", "I", "ZN", 0.3, 0.3),
+        ]
+    )
+    index.add_netlist_edges(
+        [
+            ("u1.I", "in", 0.0, 0.0),
+            ("u1.Z", "n1", 0.0, 0.0),
+            ("u2.I", "n1", 0.0, 0.0),
+            ("u2.ZN", "out", 0.0, 0.0),
+            ("u3.I", "n1", 0.0, 0.0),
+            ("u3.ZN", "side", 0.0, 0.0),
+        ]
+    )
+    return index
+
+
+def test_fanin_cone_follows_netlist_and_sdf_backwards():
+    cone = _index().fanin_cone(["out"])
+
+    assert cone.names == {"out", "u2.ZN", "u2.I", "n1", "u1.Z", "u1.I", "in"}
+    assert "u3.I" not in cone
+    assert cone.missing == ()
+
+
+def test_fanin_cone_expands_globs_and_reports_missing_endpoints():
+    cone = _index().fanin_cone(["u3.*", "nowhere"])
+
+    assert {"u3.ZN", "u3.I", "u1.Z", "in"} <= cone.names
+    assert "u2.I" not in cone
+    assert cone.missing == ("nowhere",)
+
+
+def test_build_fanin_cone_reads_the_sdf_before_the_netlist():
+    sdf_parser = MagicMock()
+    sdf_parser.parse_delay_and_cell_arc_rows.return_value = iter(
+        [([], [("u1", "BUFD1", "I", "Z", 0.2, 0.2)])]
+    )
+    verilog_parser = MagicMock()
+    verilog_parser.parse_edge_rows.return_value = iter(
+        [[("u1.I", "a", 0.0, 0.0), ("u1.Z", "y", 0.0, 0.0)]]
+    )
+
+    cone = BuildFaninConeUseCase(verilog_parser, sdf_parser).execute(
+        ["y"], [Path("a.v")], [Path("a.sdf")]
+    )
+
+    assert cone.names == {"y", "u1.Z", "u1.I", "a"}
+    sdf_parser.parse_delay_rows.assert_not_called()
+    sdf_parser.parse_cell_arc_rows.assert_not_called()
+
+
+def test_assign_edges_run_from_the_driving_net():
+    index = ConnectivityIndex()
+    index.add_cell_arcs([("u1", "BUFD1", "I", "Z", 0.2, 0.2)])
+    index.add_netlist_edges(
+        [
+            ("u1.I", "a", 0.0, 0.0),
+            ("u1.Z", "n1", 0.0, 0.0),
+            ("n1", "y", 0.0, 0.0),  # assign y = n1
+        ]
+    )
+
+    assert index.fanin_cone(["y"]).names == {"y", "n1", "u1.Z", "u1.I", "a"}
+    assert index.fanin_cone(["n1"]).names == {"n1", "u1.Z", "u1.I", "a"}
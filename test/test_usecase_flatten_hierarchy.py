@@ -0,0 +1,85 @@
+import sqlite3
+from contextlib import closing
+
+import pytest
+
+from src.domain.model.module_definition import ModuleDefinition
+from src.infra.repository.sqlite_graph_repository import SqliteGraphRepository
+from src.usecase.flatten_hierarchy import FlattenHierarchyUseCase
+
+_LEAF = ModuleDefinition(
+    "leaf",
+    edges=(("u_inv.I", "a", 0.0, 0.0), ("u_inv.ZN", "z", 0.0, 0.0)),
+    instances=(("u_inv", "INV"),),
+)
+_TOP = ModuleDefinition(
+    "top",
+    edges=(
+        ("u_l0.a", "in", 0.0, 0.0),
+        ("u_l0.z", "mid", 0.0, 0.0),
+        ("u_l1.a", "mid", 0.0, 0.0),
+        ("u_l1.z", "out[2]", 0.0, 0.0),
+    ),
+    instances=(("u_l0", "leaf"), ("u_l1", "leaf")),
+)
+
+
+@pytest.fixture()
+def repo(tmp_path):
+    repo = SqliteGraphRepository(str(tmp_path / "hier.db"))
+    repo.setup()
+    repo.save_module(_LEAF)
+    repo.save_module(_TOP)
+    return repo
+
+
+def _edges(repo):
+    with closing(sqlite3.connect(repo.db_path)) as connection:
+        return sorted(connection.execute("SELECT src, dst FROM edges").fetchall())
+
+
+def test_modules_are_stored_once_per_definition(repo):
+    with closing(sqlite3.connect(repo.db_path)) as connection:
+        stored = connection.execute("SELECT COUNT(*) FROM module_edges").fetchone()[0]
+
+    assert stored == len(_LEAF.edges) + len(_TOP.edges)
+    assert repo.load_module("leaf") == _LEAF
+    assert repo.load_module("INV") is None
+
+
+def test_flatten_binds_ports_to_parent_nets(repo):
+    written = FlattenHierarchyUseCase(repo).execute()
+
+    assert _edges(repo) == [
+        ("u_l0/u_inv.I", "in"),
+        ("u_l0/u_inv.ZN", "mid"),
+        ("u_l1/u_inv.I", "mid"),
+        ("u_l1/u_inv.ZN", "out[2]"),
+    ]
+    assert written == len(_edges(repo))
+
+
+def test_flatten_materializes_only_the_requested_block(repo):
+    FlattenHierarchyUseCase(repo).execute(block="u_l1")
+
+    assert _edges(repo) == [("u_l1/u_inv.I", "mid"), ("u_l1/u_inv.ZN", "out[2]")]
+
+
+def test_flatten_rejects_unknown_blocks(repo):
+    with pytest.raises(ValueError, match="u_missing"):
+        FlattenHierarchyUseCase(repo).execute(top="top", block="u_missing")
+
+
+def test_flatten_again_adds_nothing_and_keeps_delays(repo):
+    usecase = FlattenHierarchyUseCase(repo)
+    usecase.execute()
+    repo.update_edge_delay_rows([("u_l0/u_inv.ZN", "u_l1/u_inv.I", 0.5, 0.7)])
+
+    usecase.execute()
+
+    with closing(sqlite3.connect(repo.db_path)) as connection:
+        rows = connection.execute(
+            "SELECT src, delay_rise FROM edges WHERE src = 'u_l1/u_inv.I'"
+        ).fetchall()
+    assert len(_edges(repo)) == len(_LEAF.edges) * len(_TOP.instances)
+    assert rows == [("u_l1/u_inv.I", 0.5)]
@@ -0,0 +1,56 @@
+from unittest.mock import MagicMock
+
+from src.usecase.delay_template_registry import DelayTemplateRegistry
+from src.usecase.import_cell_arcs import ImportCellArcsUseCase
+
+
+def test_registry_shares_one_template_between_identical_arcs():
+    registry = DelayTemplateRegistry()
+
+    templates, arcs = registry.register(
+        [
+            ("u1", "ND2D1", "A1", "ZN", 0.02, 0.02),
+            ("u2", "ND2D1", "A1", "ZN", 0.02, 0.02),
+            ("u3", "ND2D1", "A1", "ZN", 0.05, 0.02),
+        ]
+    )
+
+    assert templates == [
+        (1, "ND2D1", "A1", "ZN", 0.02, 0.02),
+        (2, "ND2D1", "A1", "ZN", 0.05, 0.02),
+    ]
+    assert arcs == [("u1", 1), ("u2", 1), ("u3", 2)]
+
+
+def test_import_cell_arcs_reuses_templates_of_earlier_imports():
+    mock_repo = MagicMock()
+    mock_repo.load_delay_template_rows.return_value = [
+        (7, "ND2D1", "A1", "ZN", 0.02, 0.02)
+    ]
+    writer = ImportCellArcsUseCase(mock_repo).writer()
+
+    writer([("u1", "ND2D1", "A1", "ZN", 0.02, 0.02)])
+    writer([("u2", "ND2D1", "A2", "ZN", 0.03, 0.03)])
+    summary = writer.summary()
+
+    assert (summary.arcs, summary.templates) == (2, 2)
+    mock_repo.save_delay_template_rows.assert_called_once_with(
+        [(8, "ND2D1", "A2", "ZN", 0.03, 0.03)]
+    )
+    assert mock_repo.save_cell_arc_rows.call_count == len(("u1", "u2"))
+
+
+def test_import_cell_arcs_with_prefilter_keeps_arcs_driving_stored_edges():
+    mock_repo = MagicMock()
+    mock_repo.load_delay_template_rows.return_value = []
+    mock_repo.count_edge_sources.return_value = 1
+    mock_repo.iter_edge_sources.return_value = iter(["u1.ZN"])
+    kept = ("u1", "ND2D1", "A1", "ZN", 0.02, 0.02)
+    usecase = ImportCellArcsUseCase(mock_repo, prefilter=True)
+    writer = usecase.writer(usecase.build_prefilter())
+
+    writer([kept, ("u2", "ND2D1", "A1", "ZN", 0.02, 0.02)])
+    summary = writer.summary()
+
+    assert (summary.arcs, summary.discarded) == (1, 1)
+    mock_repo.save_cell_arc_rows.assert_called_once_with([("u1", 1)])
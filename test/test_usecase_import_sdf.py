@@ -1,7 +1,7 @@
 from pathlib import Path
 from unittest.mock import MagicMock, call
 
-from src.domain.model.edge import Edge
+from src.usecase.import_cell_arcs import ImportCellArcsUseCase
 from src.usecase.import_sdf import ImportSDFUseCase
 
 
@@ -13,13 +13,10 @@ def test_execute_orchestrates_parsing_and_updating():
     mock_repo = MagicMock()
     mock_parser = MagicMock()
 
-    batch_1 = (
-        Edge(src_node="u1.Q", dst_node="u2.A", delay_rise=0.1, delay_fall=0.1),
-        Edge(src_node="u1.Q", dst_node="u3.B", delay_rise=0.2, delay_fall=0.2),
-    )
-    batch_2 = (Edge(src_node="u2.Z", dst_node="u4.D", delay_rise=0.3, delay_fall=0.3),)
+    batch_1 = [("u1.Q", "u2.A", 0.1, 0.1), ("u1.Q", "u3.B", 0.2, 0.2)]
+    batch_2 = [("u2.Z", "u4.D", 0.3, 0.3)]
 
-    mock_parser.parse_delays.return_value = iter((batch_1, batch_2))
+    mock_parser.parse_delay_rows.return_value = iter((batch_1, batch_2))
 
     use_case = ImportSDFUseCase(repo=mock_repo, parser=mock_parser)
     dummy_path = Path("dummy.sdf")
@@ -28,9 +25,39 @@ def test_execute_orchestrates_parsing_and_updating():
     use_case.execute(dummy_path)
 
     # Assert
-    mock_parser.parse_delays.assert_called_once_with(
+    mock_parser.parse_delay_rows.assert_called_once_with(
         dummy_path, batch_size=100000, observer=None
     )
 
-    assert mock_repo.update_edges_delay_batch.call_count == len([batch_1, batch_2])
-    mock_repo.update_edges_delay_batch.assert_has_calls([call(batch_1), call(batch_2)])
+    assert mock_repo.update_edge_delay_rows.call_count == len([batch_1, batch_2])
+    mock_repo.update_edge_delay_rows.assert_has_calls([call(batch_1), call(batch_2)])
+
+
+def test_execute_with_cell_arcs_reads_the_file_once():
+    mock_repo = MagicMock()
+    mock_repo.load_delay_template_rows.return_value = []
+    mock_parser = MagicMock()
+    delays = [("a/u1.Z", "a/u2.A", 0.1, 0.1)]
+    arcs = [
+        ("a/u1", "INV", "A", "Z", 0.3, 0.3),
+        ("b/u1", "INV", "A", "Z", 0.3, 0.3),
+    ]
+    mock_parser.parse_delay_and_cell_arc_rows.return_value = iter(
+        ((delays, arcs[:1]), ([], arcs[1:]))
+    )
+    cell_arcs = ImportCellArcsUseCase(mock_repo)
+
+    summary = ImportSDFUseCase(mock_repo, mock_parser, cell_arcs=cell_arcs).execute(
+        Path("a.sdf")
+    )
+
+    mock_parser.parse_delay_rows.assert_not_called()
+    mock_parser.parse_cell_arc_rows.assert_not_called()
+    mock_repo.update_edge_delay_rows.assert_called_once_with(delays)
+    assert mock_repo.save_cell_arc_rows.call_args_list == [
+        call([("a/u1", 1)]),
+        call([("b/u1", 1)]),
+    ]
+    assert summary.written == 1
+    assert summary.cell_arcs is not None
+    assert (summary.cell_arcs.arcs, summary.cell_arcs.templates) == (2, 1)
@@ -1,7 +1,7 @@
 from pathlib import Path
 from unittest.mock import MagicMock, call
 
-from src.domain.model.node import Node
+from src.domain.model.node import NodeRow
 from src.usecase.import_verilog import ImportVerilogUseCase
 
 
@@ -13,11 +13,12 @@ def test_execute_orchestrates_parsing_and_saving():
     mock_repo = MagicMock()
     mock_parser = MagicMock()
 
-    batch_1: tuple[Node, ...] = (Node("u1"), Node("u2"))
-    batch_2: tuple[Node, ...] = (Node("u3"),)
-    batches: tuple[tuple[Node, ...]] = (batch_1, batch_2)
+    batch_1: list[NodeRow] = [("u1",), ("u2",)]
+    batch_2: list[NodeRow] = [("u3",), ("u1",)]
+    batches: tuple[list[NodeRow], ...] = (batch_1, batch_2)
 
-    mock_parser.parse_nodes.return_value = iter(batches)
+    mock_parser.parse_node_rows.return_value = iter(batches)
+    mock_repo.next_node_id.return_value = 1
 
     use_case = ImportVerilogUseCase(repo=mock_repo, parser=mock_parser)
     dummy_path = Path("dummy.v")  # str -> Path
@@ -26,7 +27,10 @@ def test_execute_orchestrates_parsing_and_saving():
     use_case.execute(dummy_path)
 
     # Assert
-    assert mock_repo.save_nodes_batch.call_count == len(batches)
-    mock_repo.save_nodes_batch.assert_has_calls([call(batch_1), call(batch_2)])
+    assert mock_repo.save_node_id_rows.call_count == len(batches)
+    mock_repo.save_node_id_rows.assert_has_calls(
+        [call([(1, "u1"), (2, "u2")]), call([(3, "u3")])]
+    )
 
-    mock_parser.parse_nodes.assert_called_with(dummy_path, observer=None)
+    mock_parser.parse_node_rows.assert_called_with(dummy_path, observer=None)
+    mock_repo.build_node_lookup.assert_called_once_with()
@@ -0,0 +1,22 @@
+from src.usecase.node_registry import NodeRegistry
+
+
+def test_repeated_names_are_registered_once():
+    registry = NodeRegistry(next_id=5)
+
+    first = registry.register([("n1",), ("u1.A",), ("n1",)])
+    second = registry.register([("n1",), ("u2.A",)])
+
+    assert first == [(5, "n1"), (6, "u1.A")]
+    assert second == [(7, "u2.A")]
+
+
+def test_least_recently_seen_name_is_evicted_at_capacity():
+    capacity = 2
+    registry = NodeRegistry(capacity=capacity)
+
+    registry.register([("a",), ("b",), ("a",), ("c",)])
+
+    assert len(registry) == capacity
+    assert registry.register([("a",)]) == []
+    assert registry.register([("b",)]) == [(4, "b")]
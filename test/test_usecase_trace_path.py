@@ -0,0 +1,104 @@
+from unittest.mock import MagicMock
+
+from src.domain.model.bus import Bus
+from src.domain.model.edge import Edge
+from src.domain.model.trace_result import SearchStats, TraceResult
+from src.usecase.trace_path import TracePathUseCase
+
+
+def test_execute_passes_exact_names_through():
+    mock_repo = MagicMock()
+    mock_repo.find_bus.return_value = None
+    path = TraceResult((Edge("A", "B", 1.0, 1.0),))
+    mock_repo.find_max_delay_path.return_value = path
+
+    result = TracePathUseCase(mock_repo).execute("A", "B")
+
+    assert result == path
+    mock_repo.find_nodes.assert_not_called()
+    mock_repo.find_max_delay_path.assert_called_once_with(
+        "A", "B", beam_width=None, timeout=None
+    )
+
+
+def test_execute_searches_expanded_patterns_at_once():
+    mock_repo = MagicMock()
+    mock_repo.find_nodes.side_effect = lambda pattern: {
+        "u*.Q": ("u1.Q", "u2.Q"),
+        "*.D": ("r1.D", "r2.D"),
+    }[pattern]
+    slow = TraceResult((Edge("u2.Q", "x", 2.0, 1.0), Edge("x", "r1.D", 3.0, 3.0)))
+    mock_repo.find_max_delay_path_from_any.return_value = slow
+
+    result = TracePathUseCase(mock_repo).execute("u*.Q", "*.D")
+
+    assert result == slow
+    mock_repo.find_max_delay_path.assert_not_called()
+    mock_repo.find_max_delay_path_from_any.assert_called_once_with(
+        ("u1.Q", "u2.Q"), ("r1.D", "r2.D"), beam_width=None, timeout=None
+    )
+
+
+def test_execute_returns_empty_when_pattern_matches_nothing():
+    mock_repo = MagicMock()
+    mock_repo.find_nodes.return_value = ()
+
+    assert not TracePathUseCase(mock_repo).execute("nothing*")
+
+
+def test_execute_forwards_beam_width():
+    mock_repo = MagicMock()
+    mock_repo.find_bus.return_value = None
+    beam_width = 8
+    mock_repo.find_max_delay_path.return_value = TraceResult(approximate=True)
+
+    result = TracePathUseCase(mock_repo).execute("A", beam_width=beam_width)
+
+    assert result.approximate
+    mock_repo.find_max_delay_path.assert_called_once_with(
+        "A", None, beam_width=beam_width, timeout=None
+    )
+
+
+def test_execute_gives_the_whole_timeout_to_the_one_search():
+    mock_repo = MagicMock()
+    mock_repo.find_nodes.return_value = ("u1.Q", "u2.Q")
+    cut_short = TraceResult(partial=True, stats=SearchStats(7, 5, 0.75))
+    mock_repo.find_max_delay_path_from_any.return_value = cut_short
+
+    result = TracePathUseCase(mock_repo).execute("u*.Q", timeout=0.01)
+
+    assert result.partial
+    assert result.stats == SearchStats(7, 5, 0.75)
+    mock_repo.find_max_delay_path_from_any.assert_called_once_with(
+        ("u1.Q", "u2.Q"), None, beam_width=None, timeout=0.01
+    )
+
+
+def test_execute_expands_bus_names_into_bits_lazily():
+    mock_repo = MagicMock()
+    mock_repo.find_bus.side_effect = {"data": Bus("data", 1, 0)}.get
+    mock_repo.find_max_delay_path_from_any.return_value = TraceResult()
+
+    TracePathUseCase(mock_repo).execute("data", "out[0]")
+
+    mock_repo.find_nodes.assert_not_called()
+    mock_repo.find_max_delay_path_from_any.assert_called_once_with(
+        ("data[1]", "data[0]"), ("out[0]",), beam_width=None, timeout=None
+    )
+
+
+def test_execute_through_expands_endpoints_but_not_waypoints():
+    mock_repo = MagicMock()
+    mock_repo.find_bus.return_value = None
+    mock_repo.find_nodes.return_value = ("r1.D", "r2.D")
+    path = TraceResult((Edge("A", "M", 1.0, 1.0), Edge("M", "r2.D", 2.0, 2.0)))
+    mock_repo.find_max_delay_path_through_from_any.return_value = path
+
+    result = TracePathUseCase(mock_repo).execute_through("A", ["M"], "r*.D")
+
+    assert result == path
+    mock_repo.find_max_delay_path.assert_not_called()
+    mock_repo.find_max_delay_path_through_from_any.assert_called_once_with(
+        ("A",), ("M",), ("r1.D", "r2.D"), timeout=None
+    )